@@ -0,0 +1,55 @@
+"""Download and parse rates over HTTP from the local stand-in server at a high request rate.
+
+Every client is a separate `SpotRate`, so nothing is shared and each one downloads its own
+rates. Some responses are faults, to check that they are reported and nothing hangs.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_http
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+import asyncio
+import time as time_module
+
+import aiohttp
+
+from custom_components.cz_energy_spot_prices.cnb_rate import CnbRate
+from custom_components.cz_energy_spot_prices.spot_rate import SpotRate
+from tests.stand_in_server import StandInConfig, StandInServer
+
+TIMEZONE = ZoneInfo('Europe/Prague')
+NOW = datetime(2025, 10, 26, 10, 20, tzinfo=TIMEZONE)
+
+
+async def run(clients: int, config: StandInConfig) -> None:
+    async with StandInServer(config) as server, aiohttp.ClientSession() as session:
+        cnb_rate = CnbRate(session, rates_url=server.cnb_url)
+        _ = await cnb_rate.get_current_rates()
+        outcomes: Counter[str] = Counter()
+
+        async def client(index: int) -> None:
+            spot_rate = SpotRate(session, cnb_rate=cnb_rate, ote_url=server.ote_url)
+            try:
+                _ = await spot_rate.get_electricity_rates(NOW + timedelta(days=index % 30), in_eur=True, unit='MWh', resolution='PT15M')
+                outcomes['ok'] += 1
+            except Exception as e:
+                outcomes[type(e).__name__] += 1
+
+        started = time_module.perf_counter()
+        _ = await asyncio.gather(*(client(i) for i in range(clients)))
+        elapsed = time_module.perf_counter() - started
+
+        print(f'{clients} clients, latency {config.latency * 1000:.0f} ms: {elapsed:.2f} s, {server.requests["ote"] / elapsed:.0f} OTE requests/s')
+        print('  ' + ', '.join(f'{outcome} {count}' for outcome, count in outcomes.most_common()))
+
+
+def main():
+    asyncio.run(run(200, StandInConfig()))
+    asyncio.run(run(200, StandInConfig(latency=0.05, fault_rate=0.05, truncate_rate=0.05, unavailable_rate=0.05)))
+
+
+if __name__ == '__main__':
+    main()
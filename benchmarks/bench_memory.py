@@ -0,0 +1,86 @@
+"""Memory retained by the electricity model for 3 days of 15 minute prices.
+
+The baseline mimics the previous model, an object with its own `__dict__` and two
+dicts of block sums and orders for every interval, kept in `hours_by_dt` dicts.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Callable
+from unittest import mock
+from zoneinfo import ZoneInfo
+import gc
+import tracemalloc
+
+from custom_components.cz_energy_spot_prices import coordinator
+
+from tests import synthetic
+
+TIMEZONE = ZoneInfo('Europe/Prague')
+
+
+class LegacyHour:
+    def __init__(self, dt_utc: datetime, dt_local: datetime, price: Decimal, consecutive_hours: tuple[int, ...]):
+        self.dt_utc = dt_utc
+        self.dt_local = dt_local
+        self.price = price
+        self.most_expensive_order = 0
+        self.order = 0
+        self.consecutive_sum_prices: dict[int, Decimal] = {}
+        self.cheapest_consecutive_order = dict.fromkeys(consecutive_hours, 0)
+
+
+def legacy_model(data: coordinator.HourlySpotRateData) -> object:
+    """Per-interval objects with the values of `data`."""
+    hours_by_dt: dict[datetime, LegacyHour] = {}
+    day_hours: dict[datetime, LegacyHour] = {}
+    for hour in data.hours:
+        legacy = LegacyHour(hour.dt_utc, hour.dt_local, hour.price, data.consecutive_hours)
+        legacy.order = hour.order
+        legacy.consecutive_sum_prices.update(hour.consecutive_sum_prices)
+        legacy.cheapest_consecutive_order.update(hour.cheapest_consecutive_order)
+        hours_by_dt[hour.dt_utc] = legacy
+        day_hours[hour.dt_utc] = legacy
+    return hours_by_dt, day_hours
+
+
+def retained(build: Callable[[], object]) -> tuple[object, int]:
+    """Build the model and return it with the bytes it keeps allocated."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    model = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return model, after - before
+
+
+def main():
+    today = date(2025, 10, 26)
+    now = datetime.combine(today, datetime.min.time(), tzinfo=TIMEZONE) + timedelta(hours=10)
+    rates = synthetic.rates(today - timedelta(days=1), 3, 15)
+
+    with mock.patch.object(coordinator, 'get_now', lambda _zoneinfo=None: now):
+        def build() -> coordinator.HourlySpotRateData:
+            data = coordinator.HourlySpotRateData(rates, TIMEZONE, None, coordinator.CONSECUTIVE_HOURS, timedelta(minutes=15))
+            # Sensors create the views of all intervals
+            _ = data.hours
+            return data
+
+        data, columnar = retained(build)
+        _, legacy = retained(lambda: legacy_model(data))
+
+    print(f'{len(rates)} intervals, {len(coordinator.CONSECUTIVE_HOURS)} block lengths')
+    print(f'{"model":10s} {"bytes":>9s} {"per interval":>13s}')
+    print(f'{"legacy":10s} {legacy:9d} {legacy / len(rates):13.0f}')
+    print(f'{"columnar":10s} {columnar:9d} {columnar / len(rates):13.0f}')
+    print(f'reduction  {1 - columnar / legacy:9.0%}')
+
+
+if __name__ == '__main__':
+    main()
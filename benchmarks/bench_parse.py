@@ -0,0 +1,108 @@
+"""Compare the streaming OTE parser with the previous `ET.fromstring` based one.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parse
+"""
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable
+import time as time_module
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+from custom_components.cz_energy_spot_prices.spot_rate import SpotRate, RateKind
+
+from tests import synthetic
+
+FIXTURES = Path(__file__).parent.parent / 'tests' / 'fixtures'
+NS = '{http://www.ote-cr.cz/schema/service/public}'
+
+
+def legacy_parse(spot_rate: SpotRate, text: str, kind: RateKind) -> SpotRate.RateByDatetime:
+    """Parser as it was before streaming, kept here as the baseline."""
+    root = ET.fromstring(text)
+    fault = root.find('.//{http://schemas.xmlsoap.org/soap/envelope/}Fault')
+    if fault:
+        raise ValueError('Fault')
+
+    result: SpotRate.RateByDatetime = {}
+    for item in root.findall(f'.//{NS}Item'):
+        date_el = item.find(f'{NS}Date')
+        assert date_el is not None and date_el.text is not None
+        current_date = date.fromisoformat(date_el.text)
+        current_hour = 0
+        current_minute = 0
+        if kind == 'electricity_legacy':
+            hour_el = item.find(f'{NS}Hour')
+            if hour_el is not None and hour_el.text is not None:
+                current_hour = int(hour_el.text) - 1
+        elif kind != 'gas':
+            period_index_el = item.find(f'{NS}PeriodIndex')
+            if period_index_el is not None and period_index_el.text:
+                period_index = int(period_index_el.text)
+                current_hour = (period_index - 1) // 4
+                current_minute = ((period_index - 1) % 4) * 15
+
+        price_el = item.find(f'{NS}Price')
+        if price_el is None or price_el.text is None:
+            continue
+        current_price = Decimal(price_el.text)
+        current_hourly_price = Decimal(0)
+        if kind == 'electricity_60min':
+            hourly_price_el = item.find(f'{NS}HourlyPrice')
+            if hourly_price_el is None or hourly_price_el.text is None:
+                continue
+            current_hourly_price = Decimal(hourly_price_el.text)
+
+        start_of_day = datetime.combine(current_date, time(0), tzinfo=spot_rate.timezone)
+        if kind != 'electricity_60min':
+            dt = start_of_day.astimezone(spot_rate.utc) + timedelta(hours=current_hour, minutes=current_minute)
+            result[dt] = current_price
+        else:
+            dt = start_of_day.astimezone(spot_rate.utc) + timedelta(hours=current_hour)
+            result[dt] = current_hourly_price
+    return result
+
+
+def measure(fn: Callable[[], object], repeat: int) -> tuple[float, int]:
+    """Return best wall time in milliseconds and peak traced memory in bytes."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time_module.perf_counter()
+        _ = fn()
+        best = min(best, time_module.perf_counter() - start)
+
+    tracemalloc.start()
+    _ = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak
+
+
+def main():
+    spot_rate = SpotRate()
+    cases: list[tuple[str, str, RateKind]] = [
+        ('fixture electricity (legacy)', (FIXTURES / 'ote-electricity-2022-12-03_EUR.xml').read_text(), 'electricity_legacy'),
+        ('fixture gas', (FIXTURES / 'ote-gas-2022-12-03_EUR.xml').read_text(), 'gas'),
+        ('PT15M 3 days (60min)', synthetic.electricity_response(date(2025, 10, 25), 3), 'electricity_60min'),
+        ('PT15M 3 days (15min)', synthetic.electricity_response(date(2025, 10, 25), 3), 'electricity_15min'),
+        ('PT15M 31 days (15min)', synthetic.electricity_response(date(2025, 10, 1), 31), 'electricity_15min'),
+    ]
+
+    print(f'{"case":32s} {"bytes":>9s} {"legacy ms":>10s} {"stream ms":>10s} {"legacy peak":>12s} {"stream peak":>12s}')
+    for name, text, kind in cases:
+        legacy = legacy_parse(spot_rate, text, kind)
+        streamed = spot_rate._parse_rates(text, 'MWh', kind)  # pyright: ignore[reportPrivateUsage]
+        assert legacy == streamed, f'{name}: results differ'
+
+        repeat = 50 if len(text) < 100_000 else 5
+        legacy_ms, legacy_peak = measure(lambda: legacy_parse(spot_rate, text, kind), repeat)
+        stream_ms, stream_peak = measure(lambda: spot_rate._parse_rates(text, 'MWh', kind), repeat)  # pyright: ignore[reportPrivateUsage]
+        print(f'{name:32s} {len(text):9d} {legacy_ms:10.2f} {stream_ms:10.2f} {legacy_peak:12d} {stream_peak:12d}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Bytes of attributes the recorder writes in one day for the electricity sensors of one trade.
+
+Simulates a day with hourly fetches, tomorrow's prices arriving at 13:00 and a state
+write whenever the state changes. The recorder keeps each distinct attribute set once
+(`state_attributes` rows), the upper bound counts the attributes of every state write.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_recorder
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any
+from unittest import mock
+from zoneinfo import ZoneInfo
+import json
+
+from custom_components.cz_energy_spot_prices import coordinator
+
+from tests import synthetic
+
+TIMEZONE = ZoneInfo('Europe/Prague')
+
+# Attributes every entity has, recorded either way
+COMMON = {'unit_of_measurement': 'Kč/kWh', 'friendly_name': 'Current Spot Electricity Price', 'icon': 'mdi:cash'}
+
+
+def sensor_states(data: coordinator.HourlySpotRateData) -> dict[str, tuple[Any, dict[str, Any]]]:
+    """State and attribute maps as built by the price and hour order sensors."""
+    prices: dict[str, Any] = {}
+    today_orders: dict[str, Any] = {}
+    tomorrow_orders: dict[str, Any] = {}
+    for hour in data.today.hours:
+        prices[hour.dt_local.isoformat()] = float(hour.price)
+        today_orders[hour.dt_local.isoformat()] = [hour.order, float(round(hour.price, 3))]
+    if data.tomorrow is not None:
+        for hour in data.tomorrow.hours:
+            prices[hour.dt_local.isoformat()] = float(hour.price)
+            tomorrow_orders[hour.dt_local.isoformat()] = [hour.order, float(round(hour.price, 3))]
+
+    current = data.current_hour
+    return {
+        'price': (current.price, prices),
+        'hour_order': (current.order, today_orders),
+        'tomorrow_hour_order': (None, tomorrow_orders),
+    }
+
+
+def simulate(day: date, minutes: int) -> tuple[int, int, int, int]:
+    """Return recorded attribute bytes (distinct, per write) with and without the maps."""
+    rates = synthetic.rates(day - timedelta(days=1), 3, minutes)
+    tomorrow_start = datetime.combine(day + timedelta(days=1), time(0), tzinfo=TIMEZONE)
+    without_tomorrow = {dt: price for dt, price in rates.items() if dt < tomorrow_start}
+    step = timedelta(minutes=minutes)
+
+    written: dict[str, tuple[Any, dict[str, Any]]] = {}
+    distinct: dict[bool, set[str]] = {True: set(), False: set()}
+    per_write = {True: 0, False: 0}
+
+    now = datetime.combine(day, time(0), tzinfo=TIMEZONE)
+    data = None
+    while now.date() == day:
+        with mock.patch.object(coordinator, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo)):
+            if data is None or now.minute == 0:
+                data = coordinator.HourlySpotRateData(rates if now.hour >= 13 else without_tomorrow, TIMEZONE, None, step=step, previous=data)
+            else:
+                data.refresh_now()
+
+            for name, state in sensor_states(data).items():
+                if written.get(name) == state:
+                    continue
+                written[name] = state
+                for recorded in (True, False):
+                    attributes = COMMON | state[1] if recorded else COMMON
+                    shared = json.dumps(attributes, separators=(',', ':'))
+                    distinct[recorded].add(shared)
+                    per_write[recorded] += len(shared)
+
+        now = (now.astimezone(timezone.utc) + step).astimezone(TIMEZONE)
+
+    return (
+        sum(map(len, distinct[True])),
+        per_write[True],
+        sum(map(len, distinct[False])),
+        per_write[False],
+    )
+
+
+def main():
+    print(f'{"resolution":10s} {"maps kB":>8s} {"unrecorded kB":>14s} {"reduction":>10s} {"per write kB":>13s} {"unrecorded kB":>14s} {"reduction":>10s}')
+    for minutes in (60, 15):
+        distinct, per_write, distinct_unrecorded, per_write_unrecorded = simulate(date(2025, 10, 1), minutes)
+        print(
+            f'{f"PT{minutes}M":10s} {distinct / 1000:8.1f} {distinct_unrecorded / 1000:14.1f} {1 - distinct_unrecorded / distinct:10.0%} '
+            + f'{per_write / 1000:13.1f} {per_write_unrecorded / 1000:14.1f} {1 - per_write_unrecorded / per_write:10.0%}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Time to build the electricity model on refresh with hourly and 15 minute prices.
+
+The baseline is hourly prices with window sums looked up interval by interval,
+as it was before windows of series without gaps became plain index ranges.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_refresh
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest import mock
+from zoneinfo import ZoneInfo
+import time as time_module
+
+from custom_components.cz_energy_spot_prices import coordinator
+from custom_components.cz_energy_spot_prices.price_series import PriceSeries
+
+from tests import synthetic
+
+TIMEZONE = ZoneInfo('Europe/Prague')
+
+
+def legacy_window_sums(self: PriceSeries, length: int, _indices: range | None = None) -> list[Decimal | None]:
+    # Sums the whole series every time
+    span = self.step * (length - 1)
+    return [
+        None if (start := self.index_of(dt - span)) is None else self._prefix_sums[index + 1] - self._prefix_sums[start]  # pyright: ignore[reportPrivateUsage]
+        for index, dt in enumerate(self.dts)
+    ]
+
+
+def measure(rates: dict[datetime, object], step: timedelta, repeat: int, previous: coordinator.HourlyTradeRateData | None = None) -> float:
+    """Return best wall time in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time_module.perf_counter()
+        _ = coordinator.HourlyTradeRateData(rates, TIMEZONE, None, None, coordinator.CONSECUTIVE_HOURS, step, previous)  # pyright: ignore[reportArgumentType]
+        best = min(best, time_module.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    print(f'{"day":12s} {"baseline ms":>11s} {"PT60M ms":>9s} {"PT15M ms":>9s} {"intervals":>10s} {"vs baseline":>12s} {"vs PT60M":>9s} {"PT15M incr ms":>14s}')
+    # Regular day and both daylight saving time changes as today
+    for today in (date(2025, 10, 1), date(2025, 10, 26), date(2026, 3, 29)):
+        now = datetime.combine(today, datetime.min.time(), tzinfo=TIMEZONE) + timedelta(hours=10)
+        hourly = synthetic.rates(today - timedelta(days=1), 3, 60)
+        quarterly = synthetic.rates(today - timedelta(days=1), 3, 15)
+
+        with mock.patch.object(coordinator, 'get_now', lambda _zoneinfo=None: now):
+            with mock.patch.object(PriceSeries, 'window_sums', legacy_window_sums):
+                baseline_ms = measure(hourly, timedelta(hours=1), 300)
+            hourly_ms = measure(hourly, timedelta(hours=1), 300)
+            quarterly_ms = measure(quarterly, timedelta(minutes=15), 100)
+            # Tomorrow arrives, only the new day is ranked
+            tomorrow_start = datetime.combine(today + timedelta(days=1), datetime.min.time(), tzinfo=TIMEZONE)
+            previous = coordinator.HourlyTradeRateData(
+                {dt: price for dt, price in quarterly.items() if dt < tomorrow_start},  # pyright: ignore[reportArgumentType]
+                TIMEZONE, None, None, coordinator.CONSECUTIVE_HOURS, timedelta(minutes=15),
+            )
+            incremental_ms = measure(quarterly, timedelta(minutes=15), 100, previous)
+
+        print(
+            f'{today.isoformat():12s} {baseline_ms:11.3f} {hourly_ms:9.3f} {quarterly_ms:9.3f} '
+            + f'{len(quarterly) / len(hourly):9.1f}x {quarterly_ms / baseline_ms:11.1f}x {quarterly_ms / hourly_ms:8.1f}x {incremental_ms:14.3f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+"""Benchmark suite timing the parse -> model -> sensor pipeline stage by stage.
+
+Stages:
+- parse: `SpotRate._parse_rates` of the test fixtures and synthetic responses, what `_get_rates` does after download
+- hourly: `HourlyTradeRateData` construction without and with buy/sell templates
+- daily: `DailyTradeRateData` construction
+- fanout: `update()` of all entities created by `sensor.async_setup_entry` and `binary_sensor.async_setup_entry`
+
+Run from the repository root:
+
+    python -m benchmarks.run --json results.json
+    python -m benchmarks.run --compare results.json
+
+Results are written as JSON, `--compare` prints the ratio to a previous result file,
+for example one produced on another commit.
+"""
+
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, cast
+from unittest import mock
+from zoneinfo import ZoneInfo
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time as time_module
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import Template
+
+from custom_components.cz_energy_spot_prices import binary_sensor, coordinator, sensor
+from custom_components.cz_energy_spot_prices.rate_template import RateTemplate
+from custom_components.cz_energy_spot_prices.spot_rate import RateKind, SpotRate
+
+from tests import synthetic
+
+FIXTURES = Path(__file__).parent.parent / 'tests' / 'fixtures'
+TIMEZONE = ZoneInfo('Europe/Prague')
+TODAY = date(2025, 10, 26)
+NOW = datetime.combine(TODAY, datetime.min.time(), tzinfo=TIMEZONE) + timedelta(hours=10, minutes=20)
+
+BUY_TEMPLATE = '{% set fee = 0.5 %}{% if hour.hour in [9, 12] %}{% set fee = 1 %}{% endif %}{{ value * 1.21 + fee }}'
+SELL_TEMPLATE = '{{ value * 0.9 - 0.2 }}'
+GAS_TEMPLATE = '{{ value * 1.21 }}'
+
+
+@dataclass
+class Result:
+    stage: str
+    case: str
+    size: int
+    repeat: int
+    best_ms: float
+    median_ms: float
+
+
+def measure(fn: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Return best and median wall time in milliseconds."""
+    times: list[float] = []
+    for _ in range(repeat):
+        start = time_module.perf_counter()
+        _ = fn()
+        times.append(time_module.perf_counter() - start)
+    return min(times) * 1000, statistics.median(times) * 1000
+
+
+def electricity_datasets() -> list[tuple[str, SpotRate.RateByDatetime, timedelta]]:
+    first_day = TODAY - timedelta(days=1)
+    return [
+        ('PT60M 3 days', synthetic.rates(first_day, 3, 60), timedelta(hours=1)),
+        ('PT15M 3 days', synthetic.rates(first_day, 3, 15), timedelta(minutes=15)),
+        ('PT15M 28 days', synthetic.rates(TODAY - timedelta(days=26), 28, 15), timedelta(minutes=15)),
+    ]
+
+
+def gas_rates(days: int) -> SpotRate.RateByDatetime:
+    return SpotRate()._parse_rates(synthetic.gas_response(TODAY - timedelta(days=days - 2), days), 'MWh', 'gas')  # pyright: ignore[reportPrivateUsage]
+
+
+def bench_parse(repeat: int, _hass: HomeAssistant) -> list[Result]:
+    spot_rate = SpotRate()
+    cases: list[tuple[str, str, RateKind]] = [
+        ('fixture electricity', (FIXTURES / 'ote-electricity-2022-12-03_EUR.xml').read_text(), 'electricity_legacy'),
+        ('fixture gas', (FIXTURES / 'ote-gas-2022-12-03_EUR.xml').read_text(), 'gas'),
+        ('PT15M 3 days (60min)', synthetic.electricity_response(TODAY - timedelta(days=1), 3), 'electricity_60min'),
+        ('PT15M 3 days (15min)', synthetic.electricity_response(TODAY - timedelta(days=1), 3), 'electricity_15min'),
+        ('PT15M 28 days (15min)', synthetic.electricity_response(TODAY - timedelta(days=26), 28), 'electricity_15min'),
+    ]
+
+    results: list[Result] = []
+    for name, text, kind in cases:
+        size = len(spot_rate._parse_rates(text, 'MWh', kind))  # pyright: ignore[reportPrivateUsage]
+        best, median = measure(lambda: spot_rate._parse_rates(text, 'MWh', kind), repeat)  # pyright: ignore[reportPrivateUsage]
+        results.append(Result('parse', name, size, repeat, best, median))
+    return results
+
+
+def bench_hourly(repeat: int, hass: HomeAssistant) -> list[Result]:
+    buy = RateTemplate(Template(BUY_TEMPLATE, hass))
+    sell = RateTemplate(Template(SELL_TEMPLATE, hass))
+
+    results: list[Result] = []
+    for name, rates, step in electricity_datasets():
+        for templates, (buy_template, sell_template) in (('without templates', (None, None)), ('with templates', (buy, sell))):
+            best, median = measure(
+                lambda: coordinator.HourlyTradeRateData(rates, TIMEZONE, buy_template, sell_template, coordinator.CONSECUTIVE_HOURS, step),
+                repeat,
+            )
+            results.append(Result('hourly', f'{name} {templates}', len(rates), repeat, best, median))
+    return results
+
+
+def bench_daily(repeat: int, hass: HomeAssistant) -> list[Result]:
+    gas = RateTemplate(Template(GAS_TEMPLATE, hass), 'day')
+
+    results: list[Result] = []
+    for days in (3, 28):
+        rates = gas_rates(days)
+        for templates, template in (('without template', None), ('with template', gas)):
+            best, median = measure(lambda: coordinator.DailyTradeRateData(rates, TIMEZONE, template), repeat)
+            results.append(Result('daily', f'{days} days {templates}', len(rates), repeat, best, median))
+    return results
+
+
+def create_entities(data: coordinator.SpotRateData) -> list[Any]:
+    """Entities of both platforms as created for a config entry with buy and sell templates."""
+    runtime_data = SimpleNamespace(
+        data=data,
+        consecutive_hours=coordinator.CONSECUTIVE_HOURS,
+        has_electricity_buy_rate_template=lambda: True,
+        has_electricity_sell_rate_template=lambda: True,
+        has_gas_buy_rate_template=lambda: True,
+        timings=None,
+    )
+    entry = SimpleNamespace(unique_id='benchmark', data={'currency': 'CZK', 'unit_of_measurement': 'kWh'}, options={}, runtime_data=runtime_data)
+    hass = SimpleNamespace(config=SimpleNamespace(time_zone=str(TIMEZONE)))
+
+    entities: list[Any] = []
+    for platform_module in (sensor, binary_sensor):
+        asyncio.run(platform_module.async_setup_entry(hass, entry, entities.extend))  # pyright: ignore[reportArgumentType]
+    return entities
+
+
+def bench_fanout(repeat: int, hass: HomeAssistant) -> list[Result]:
+    buy = RateTemplate(Template(BUY_TEMPLATE, hass))
+    sell = RateTemplate(Template(SELL_TEMPLATE, hass))
+    gas = RateTemplate(Template(GAS_TEMPLATE, hass), 'day')
+    gas_data = coordinator.DailyTradeRateData(gas_rates(3), TIMEZONE, gas)
+
+    results: list[Result] = []
+    for name, rates, step in electricity_datasets():
+        # Two equal data objects, so every update sees new data as after a refresh
+        datas = [
+            coordinator.SpotRateData(coordinator.HourlyTradeRateData(rates, TIMEZONE, buy, sell, coordinator.CONSECUTIVE_HOURS, step), gas_data)
+            for _ in range(2)
+        ]
+        entities = create_entities(datas[0])
+        updates = iter(range(repeat * 2))
+
+        def update_all() -> None:
+            data = datas[next(updates) % 2]
+            for entity in entities:
+                entity.update(data)
+
+        best, median = measure(update_all, repeat)
+        results.append(Result('fanout', f'{name} {len(entities)} entities', len(rates), repeat, best, median))
+    return results
+
+
+STAGES: dict[str, Callable[[int, HomeAssistant], list[Result]]] = {
+    'parse': bench_parse,
+    'hourly': bench_hourly,
+    'daily': bench_daily,
+    'fanout': bench_fanout,
+}
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def create_hass(loop: asyncio.AbstractEventLoop, config_dir: str) -> HomeAssistant:
+    """Home Assistant instance templates are rendered with, it is never started."""
+
+    async def create() -> HomeAssistant:
+        hass = HomeAssistant(config_dir)
+        hass.config.time_zone = str(TIMEZONE)
+        return hass
+
+    return loop.run_until_complete(create())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    _ = parser.add_argument('--stage', action='append', choices=list(STAGES), help='stages to run, all by default')
+    _ = parser.add_argument('--repeat', type=int, default=20, help='runs of each case')
+    _ = parser.add_argument('--json', type=Path, help='write results to this file')
+    _ = parser.add_argument('--compare', type=Path, help='previous results to compare with')
+    args = parser.parse_args()
+
+    results: list[Result] = []
+    loop = asyncio.new_event_loop()
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        mock.patch.object(coordinator, 'get_now', lambda _zoneinfo=timezone.utc: NOW.astimezone(_zoneinfo)),
+    ):
+        hass = create_hass(loop, config_dir)
+        for stage in cast(list[str] | None, args.stage) or list(STAGES):
+            results.extend(STAGES[stage](cast(int, args.repeat), hass))
+    loop.close()
+
+    baseline: dict[tuple[str, str], float] = {}
+    if args.compare is not None:
+        previous = json.loads(cast(Path, args.compare).read_text())
+        baseline = {(result['stage'], result['case']): result['best_ms'] for result in previous['results']}
+
+    print(f'{"stage":7s} {"case":40s} {"size":>6s} {"best ms":>9s} {"median ms":>10s}' + (f' {"vs base":>8s}' if baseline else ''))
+    for result in results:
+        line = f'{result.stage:7s} {result.case:40s} {result.size:6d} {result.best_ms:9.3f} {result.median_ms:10.3f}'
+        if (base := baseline.get((result.stage, result.case))) is not None:
+            line += f' {result.best_ms / base:7.2f}x'
+        print(line)
+
+    if args.json is not None:
+        _ = cast(Path, args.json).write_text(json.dumps({
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'now': NOW.isoformat(),
+            'results': [asdict(result) for result in results],
+        }, indent=2) + '\n')
+
+
+if __name__ == '__main__':
+    main()
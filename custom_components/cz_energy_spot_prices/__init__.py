@@ -6,32 +6,97 @@ from typing import cast
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_CURRENCY, CONF_UNIT_OF_MEASUREMENT
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
+    DOMAIN,
     PLATFORMS,
     ADDITIONAL_COSTS_BUY_ELECTRICITY,
     ADDITIONAL_COSTS_SELL_ELECTRICITY,
     ADDITIONAL_COSTS_BUY_GAS,
+    CHEAPEST_BLOCK_HOURS,
+    ELECTRICITY_RESOLUTION,
+    REFRESH_TIMINGS,
 )
-from .coordinator import SpotRateCoordinator
+from .coordinator import SpotRateCoordinator, CONSECUTIVE_HOURS, parse_consecutive_hours
+from .cnb_rate import CnbRate
+from .price_cache import ElectricityResolution, PriceCache, STORAGE_VERSION
+from .services import async_setup_services
 from .spot_rate import SpotRate
 
 
 logger = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 type SpotRateConfigEntry = ConfigEntry[SpotRateCoordinator]
 
 
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    async_setup_services(hass)
+    return True
+
+
 async def options_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Handle options update."""
     logger.debug('options_update_listener', config_entry.data)
     _ = await hass.config_entries.async_reload(config_entry.entry_id)
 
 
+async def async_get_price_cache(hass: HomeAssistant) -> PriceCache:
+    """Price cache shared by all config entries, loaded from disk on first use."""
+    domain_data = cast(dict[str, object], hass.data.setdefault(DOMAIN, {}))
+    cache = domain_data.get('price_cache')
+    if not isinstance(cache, PriceCache):
+        cache = PriceCache(Store(hass, STORAGE_VERSION, f'{DOMAIN}.prices'))
+        domain_data['price_cache'] = cache
+
+    await cache.async_load()
+    return cache
+
+
+def get_cnb_rate(hass: HomeAssistant, cache: PriceCache) -> CnbRate:
+    """CNB rates shared by all config entries, so they are downloaded once a day."""
+    domain_data = cast(dict[str, object], hass.data.setdefault(DOMAIN, {}))
+    cnb_rate = domain_data.get('cnb_rate')
+    if not isinstance(cnb_rate, CnbRate):
+        cnb_rate = CnbRate(async_get_clientsession(hass), cache)
+        domain_data['cnb_rate'] = cnb_rate
+
+    return cnb_rate
+
+
+def get_spot_rate(hass: HomeAssistant, cache: PriceCache) -> SpotRate:
+    """OTE rates shared by all config entries, so they are downloaded and parsed once."""
+    domain_data = cast(dict[str, object], hass.data.setdefault(DOMAIN, {}))
+    spot_rate = domain_data.get('spot_rate')
+    if not isinstance(spot_rate, SpotRate):
+        spot_rate = SpotRate(
+            session=async_get_clientsession(hass),
+            cache=cache,
+            cnb_rate=get_cnb_rate(hass, cache),
+        )
+        domain_data['spot_rate'] = spot_rate
+
+    return spot_rate
+
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: SpotRateConfigEntry):
     logger.debug('async_setup_entry %s data: [%s]; options: [%s]', config_entry.unique_id, config_entry.data, config_entry.options)
 
-    spot_rate = SpotRate()
+    cache = await async_get_price_cache(hass)
+    # Each entry only converts the shared rates to its currency and unit and applies its templates
+    spot_rate = get_spot_rate(hass, cache)
+
+    try:
+        consecutive_hours = parse_consecutive_hours(config_entry.options.get(CHEAPEST_BLOCK_HOURS))
+    except ValueError as e:
+        logger.error('Invalid cheapest block lengths, using defaults: %s', e)
+        consecutive_hours = CONSECUTIVE_HOURS
+
     coordinator = SpotRateCoordinator(
         hass=hass,
         spot_rate=spot_rate,
@@ -47,7 +112,13 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: SpotRateConfigEnt
         or "",
         gas_buy_rate_template_code=config_entry.options.get(ADDITIONAL_COSTS_BUY_GAS)
         or "",
+        consecutive_hours=consecutive_hours,
+        resolution=cast(ElectricityResolution, config_entry.options.get(ELECTRICITY_RESOLUTION) or 'PT60M'),
+        refresh_timings=bool(config_entry.options.get(REFRESH_TIMINGS)),
+        entry_id=config_entry.entry_id,
     )
+    config_entry.async_on_unload(coordinator.unschedule)
+    config_entry.async_on_unload(coordinator.release_timings)
 
     await coordinator.async_config_entry_first_refresh()
 
@@ -59,6 +130,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: SpotRateConfigEnt
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
+async def async_unload_entry(hass: HomeAssistant, config_entry: SpotRateConfigEntry):
     """Unload config entry."""
+    config_entry.runtime_data.cancel_import()
     return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
@@ -0,0 +1,187 @@
+"""Backfill of historical prices into a separate price cache.
+
+Days already in the cache are skipped and the cache is saved after each downloaded chunk, so an
+interrupted backfill continues where it stopped and running it again downloads nothing. Missing days are split into chunks OTE answers in one
+query and the chunks are downloaded concurrently, at most `concurrency` at a time.
+
+Standalone use writes the cache to a JSON file:
+
+    python -m custom_components.cz_energy_spot_prices.backfill 2024-01-01 2024-12-31 --output history.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import TypedDict, cast, final
+from zoneinfo import ZoneInfo
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import DOMAIN
+from .http_session import close_session
+from .price_cache import CacheData, Commodity, PriceCache, STORAGE_VERSION
+from .spot_rate import COMMODITY_RESOLUTIONS, OTEFault, SpotRate
+
+logger = logging.getLogger(__name__)
+
+# Days in one OTE query, electricity has up to 100 periods a day
+CHUNK_DAYS: dict[Commodity, int] = {
+    'electricity': 31,
+    'gas': 366,
+}
+
+# Concurrent OTE queries
+CONCURRENCY = 4
+
+
+class BackfillStats(TypedDict):
+    commodity: Commodity
+    start: str
+    end: str
+    days: int
+    # Already in the cache before
+    skipped_days: int
+    # Downloaded and complete
+    stored_days: int
+    # Not published (yet) or in failed chunks
+    missing_days: int
+    chunks: int
+    failed_chunks: int
+    seconds: float
+    days_per_second: float
+
+
+def chunk_days(days: list[date], size: int) -> list[tuple[date, date]]:
+    """Split ordered `days` to ranges of consecutive days, at most `size` days each."""
+    chunks: list[tuple[date, date]] = []
+    for day in days:
+        if chunks and day - chunks[-1][1] == timedelta(days=1) and (day - chunks[-1][0]).days < size:
+            chunks[-1] = (chunks[-1][0], day)
+        else:
+            chunks.append((day, day))
+    return chunks
+
+
+@final
+class Backfill:
+    def __init__(self, spot_rate: SpotRate, cache: PriceCache, concurrency: int = CONCURRENCY) -> None:
+        # `spot_rate` must store downloaded days to `cache`
+        self._spot_rate = spot_rate
+        self._cache = cache
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    def _is_stored(self, commodity: Commodity, day: date) -> bool:
+        return all(self._cache.has_day(commodity, day, resolution) for resolution in COMMODITY_RESOLUTIONS[commodity])
+
+    async def _fetch_chunk(self, commodity: Commodity, first_day: date, last_day: date) -> bool:
+        async with self._semaphore:
+            started = time.monotonic()
+            try:
+                # Downloaded days are written to the cache, complete ones are kept
+                _ = await self._spot_rate._get_day_rates(commodity, first_day, last_day)  # pyright: ignore[reportPrivateUsage]
+            except (OTEFault, UpdateFailed, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning('Backfill of %s %s - %s failed: %s', commodity, first_day, last_day, e)
+                return False
+
+            # Kept even when the backfill is interrupted later
+            await self._cache.async_save()
+            logger.debug('Backfill of %s %s - %s took %.3f s', commodity, first_day, last_day, time.monotonic() - started)
+            return True
+
+    async def run(self, commodity: Commodity, start: date, end: date) -> BackfillStats:
+        await self._cache.async_load()
+        started = time.monotonic()
+
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        missing = [day for day in days if not self._is_stored(commodity, day)]
+        chunks = chunk_days(missing, CHUNK_DAYS[commodity])
+        logger.info('Backfill of %s %s - %s: %d of %d days in %d chunks', commodity, start, end, len(missing), len(days), len(chunks))
+
+        results = await asyncio.gather(*(self._fetch_chunk(commodity, first_day, last_day) for first_day, last_day in chunks))
+        await self._cache.async_save()
+
+        seconds = time.monotonic() - started
+        stored = sum(1 for day in missing if self._is_stored(commodity, day))
+        stats: BackfillStats = {
+            'commodity': commodity,
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'days': len(days),
+            'skipped_days': len(days) - len(missing),
+            'stored_days': stored,
+            'missing_days': len(missing) - stored,
+            'chunks': len(chunks),
+            'failed_chunks': results.count(False),
+            'seconds': round(seconds, 3),
+            'days_per_second': round(stored / seconds, 1) if seconds > 0 else 0,
+        }
+        logger.info('Backfill finished: %s', stats)
+        return stats
+
+
+async def async_get_history_cache(hass: HomeAssistant) -> PriceCache:
+    """Backfilled prices, kept apart from the recent prices and never pruned."""
+    domain_data = cast(dict[str, object], hass.data.setdefault(DOMAIN, {}))
+    cache = domain_data.get('history_cache')
+    if not isinstance(cache, PriceCache):
+        cache = PriceCache(Store(hass, STORAGE_VERSION, f'{DOMAIN}.history'), retention_days=None)
+        domain_data['history_cache'] = cache
+
+    await cache.async_load()
+    return cache
+
+
+async def async_backfill(hass: HomeAssistant, commodity: Commodity, start: date, end: date) -> BackfillStats:
+    cache = await async_get_history_cache(hass)
+    spot_rate = SpotRate(session=async_get_clientsession(hass), cache=cache)
+    return await Backfill(spot_rate, cache).run(commodity, start, end)
+
+
+class JsonFileStore:
+    """The part of `Store` the price cache uses, on a plain JSON file for standalone use."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    async def async_load(self) -> CacheData | None:
+        if not self._path.exists():
+            return None
+        return cast(CacheData, json.loads(self._path.read_text()))
+
+    async def async_save(self, data: CacheData) -> None:
+        _ = self._path.write_text(json.dumps(data, separators=(',', ':')))
+
+    def async_delay_save(self, *_args: object) -> None:
+        # Saved after each chunk of the backfill
+        pass
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Backfill historical OTE prices')
+    _ = parser.add_argument('start', type=date.fromisoformat)
+    _ = parser.add_argument('end', type=date.fromisoformat, nargs='?', default=datetime.now(ZoneInfo('Europe/Prague')).date())
+    _ = parser.add_argument('--commodity', choices=['electricity', 'gas'], action='append')
+    _ = parser.add_argument('--output', type=Path, default=Path('history.json'))
+    _ = parser.add_argument('--concurrency', type=int, default=CONCURRENCY)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    async def backfill():
+        cache = PriceCache(JsonFileStore(cast(Path, args.output)), retention_days=None)  # pyright: ignore[reportArgumentType]
+        try:
+            backfill = Backfill(SpotRate(cache=cache), cache, cast(int, args.concurrency))
+            for commodity in cast(list[Commodity] | None, args.commodity) or ['electricity', 'gas']:
+                print(json.dumps(await backfill.run(commodity, cast(date, args.start), cast(date, args.end))))
+        finally:
+            await close_session()
+
+    asyncio.run(backfill())
@@ -1,20 +1,22 @@
 from __future__ import annotations
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Callable, cast, override
 from zoneinfo import ZoneInfo
 
 from homeassistant.const import CONF_CURRENCY, CONF_UNIT_OF_MEASUREMENT
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import event
 from homeassistant.helpers.entity import Entity
 
 from . import SpotRateConfigEntry
 from .coordinator import (
+    HourlySpotRateData,
     SpotRateCoordinator,
     SpotRateData,
-    CONSECUTIVE_HOURS,
+    get_now,
 )
 from .spot_rate_mixin import ElectricitySpotRateSensorMixin, GasSpotRateSensorMixin, Trade
 from .spot_rate_settings import SpotRateSettings
@@ -61,7 +63,7 @@ async def async_setup_entry(
 
     sensors: list[Entity] = [has_tomorrow_electricity_data, has_tomorrow_gas_data]
 
-    for i in CONSECUTIVE_HOURS:
+    for i in coordinator.consecutive_hours:
         sensors.append(
             ConsecutiveCheapestElectricitySensor(
                 hours=i,
@@ -73,7 +75,7 @@ async def async_setup_entry(
         )
 
     if coordinator.has_electricity_buy_rate_template():
-        for i in CONSECUTIVE_HOURS:
+        for i in coordinator.consecutive_hours:
             sensors.append(
                 ConsecutiveCheapestElectricitySensor(
                     hours=i,
@@ -85,7 +87,7 @@ async def async_setup_entry(
             )
 
     if coordinator.has_electricity_sell_rate_template():
-        for i in CONSECUTIVE_HOURS:
+        for i in coordinator.consecutive_hours:
             sensors.append(
                 ConsecutiveCheapestElectricitySensor(
                     hours=i,
@@ -110,6 +112,10 @@ class ConsecutiveCheapestElectricitySensor(ElectricityBinarySpotRateSensorBase):
 
     def __init__(self, hours: int, hass: HomeAssistant, settings: SpotRateSettings, coordinator: SpotRateCoordinator, trade: Trade) -> None:
         self.hours = hours
+        # Start, end (exclusive) and attributes of the cheapest blocks, built once for each data
+        self._blocks: list[tuple[datetime, datetime, dict[str, Any]]] = []
+        self._blocks_rates: HourlySpotRateData | None = None
+        self._unschedule_transition: CALLBACK_TYPE | None = None
 
         if self.hours == 1:
             self._attr_unique_id = f'binary_sensor.{trade.lower()}_electricity_is_cheapest'
@@ -128,7 +134,8 @@ class ConsecutiveCheapestElectricitySensor(ElectricityBinarySpotRateSensorBase):
     def _compute_attr(
         self, rate_data: SpotRateData, start: datetime, end: datetime
     ) -> dict[str, Any]:
-        dt = start
+        # Walk in UTC, local wall clock repeats or skips an hour on DST days
+        dt = start.astimezone(timezone.utc)
         min_price: Decimal | None = None
         max_price: Decimal | None = None
         sum_price: Decimal = Decimal(0)
@@ -136,6 +143,7 @@ class ConsecutiveCheapestElectricitySensor(ElectricityBinarySpotRateSensorBase):
 
         hourly_rates = self._get_trade_rates(rate_data)
         while dt <= end:
+            # Blocks are fully inside the data
             hour = hourly_rates.hour_for_dt(dt)
             sum_price += hour.price
             count += 1
@@ -145,7 +153,7 @@ class ConsecutiveCheapestElectricitySensor(ElectricityBinarySpotRateSensorBase):
             if max_price is None or hour.price > max_price:
                 max_price = hour.price
 
-            dt += timedelta(hours=1)
+            dt += hourly_rates.step
         return {
             'Start': start,
             'Start hour': start.hour,
@@ -158,32 +166,86 @@ class ConsecutiveCheapestElectricitySensor(ElectricityBinarySpotRateSensorBase):
 
     @override
     def update(self, rate_data: SpotRateData | None):
-        self._attr = {}
-
         if not rate_data:
+            self._attr = {}
             self._attr_available = False
             self._attr_is_on = None
+            self._blocks = []
+            self._blocks_rates = None
             return
 
-        is_on = False
         hourly_rates = self._get_trade_rates(rate_data)
-        has_future_data = False
-        for hour in hourly_rates.hours_by_dt.values():
-            start = hour.dt_local - timedelta(hours=self.hours - 1)
-            end = hour.dt_local + timedelta(hours=1, seconds=-1)
+        if hourly_rates is self._blocks_rates:
+            # Same blocks, the state changes only at their bounds
+            return
+
+        # Only the cheapest blocks of today and tomorrow are marked with 1
+        self._blocks = []
+        for hour in hourly_rates.cheapest_blocks(self.hours):
+            # Block of `hours` ending with this interval, in UTC so it is `hours` long on DST days too
+            end = hour.dt_utc + hourly_rates.step
+            start = end - timedelta(hours=self.hours)
+            last = end - timedelta(seconds=1)
+            start, end, last = (dt.astimezone(hourly_rates.zoneinfo) for dt in (start, end, last))
+            self._blocks.append((start, end, self._compute_attr(rate_data, start, last)))
+        self._blocks_rates = hourly_rates
 
-            if hour.cheapest_consecutive_order[self.hours] == 1:
-                if not has_future_data:
-                    # We want to show earliest future block but if there's no future data, show the last past block
-                    if end >= hourly_rates.now:
-                        has_future_data = True
-                    self._attr = self._compute_attr(rate_data, start, end)
+        self._attr_available = True
+        self._apply_blocks(hourly_rates.now)
 
-                if start <= hourly_rates.now <= end:
-                    is_on = True
+    def _apply_blocks(self, now: datetime) -> None:
+        is_on = False
+        self._attr = {}
+        for start, end, attr in self._blocks:
+            if not self._attr or self._attr['End'] < now:
+                # We want to show earliest future block but if there's no future data, show the last past block
+                self._attr = attr
+
+            if start <= now < end:
+                is_on = True
 
         self._attr_is_on = is_on
-        self._attr_available = True
+
+    def _schedule_transition(self, now: datetime) -> None:
+        """Wake up exactly at the next start or end of a block, nothing changes in between."""
+        if self._unschedule_transition is not None:
+            self._unschedule_transition()
+            self._unschedule_transition = None
+
+        bounds = [bound for start, end, _attr in self._blocks for bound in (start, end) if bound > now]
+        if bounds:
+            self._unschedule_transition = event.async_track_point_in_utc_time(
+                self.hass, self._on_transition, min(bounds).astimezone(timezone.utc)
+            )
+
+    @callback
+    def _on_transition(self, now: datetime) -> None:
+        self._unschedule_transition = None
+        self._apply_blocks(now)
+        logger.debug('%s is %s at block bound %s', self.unique_id, self._attr_is_on, now.isoformat())
+        self._written = self._state_fingerprint()
+        self.async_write_ha_state()
+        self._schedule_transition(now)
+
+    @override
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        blocks_rates = self._blocks_rates
+        super()._handle_coordinator_update()
+        if self._blocks_rates is not blocks_rates:
+            self._schedule_transition(get_now(timezone.utc))
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._schedule_transition(get_now(timezone.utc))
+
+    @override
+    async def async_will_remove_from_hass(self) -> None:
+        if self._unschedule_transition is not None:
+            self._unschedule_transition()
+            self._unschedule_transition = None
+        await super().async_will_remove_from_hass()
 
 
 class HasTomorrowElectricityData(ElectricityBinarySpotRateSensorBase):
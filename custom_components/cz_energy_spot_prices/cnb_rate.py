@@ -2,8 +2,22 @@ from datetime import date, datetime, timedelta, timezone
 from typing import TypedDict, cast
 from zoneinfo import ZoneInfo
 from decimal import Decimal
+import asyncio
+import hashlib
+import json
+import logging
+import time
 import aiohttp
 
+from .http_session import get_session, close_session
+from .price_cache import PriceCache
+from .timing import StageTimings, stage
+
+logger = logging.getLogger(__name__)
+
+# CNB doesn't publish rates on weekends and holidays, look this many days back
+FALLBACK_DAYS = 7
+
 
 class InvalidDateError(Exception):
     """Exception raised for invalid date format in CNB API response."""
@@ -36,25 +50,49 @@ class RateError(TypedDict):
 class CnbRate:
     RATES_URL: str = "https://api.cnb.cz/cnbapi/exrates/daily"
 
-    def __init__(self) -> None:
+    def __init__(self, session: aiohttp.ClientSession | None = None, cache: PriceCache | None = None, rates_url: str | None = None) -> None:
+        if rates_url is not None:
+            # Stand-in server in tests and benchmarks
+            self.RATES_URL = rates_url
         self._timezone: ZoneInfo = ZoneInfo("Europe/Prague")
-        self._rates: dict[str, Decimal] = {}
-        self._last_checked_date: date | None = None
+        # Home Assistant passes its shared session, standalone use falls back to the pooled module session
+        self._session = session
+        self._cache = cache
+        # Rates are valid for the whole day they were requested for
+        self._rates_by_day: dict[date, dict[str, Decimal]] = {}
+        # Requests in progress, concurrent callers for the same day wait for the same request
+        self._pending: dict[date, asyncio.Future[dict[str, Decimal]]] = {}
+        self.downloads = 0
+        # Digest of the current rates, the same digest means the same rates
+        self.digest: str | None = None
+        # Stage timings of downloads, when enabled
+        self.timings: StageTimings | None = None
+        # Size in characters and duration in seconds of the last downloaded rates
+        self.last_payload_size: int | None = None
+        self.last_download_seconds: float | None = None
+        # Days CNB rejected, weekends and holidays never get rates
+        self._invalid_days: set[date] = set()
 
     async def download_rates(self, day: date) -> Rates:
         params = {"date": day.isoformat()}
 
         text: Rates
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.RATES_URL, params=params) as response:
-                if response.status > 299:
-                    if response.status == 400:
-                        error = cast(RateError, await response.json())
-                        if error.get("errorCode") == "VALIDATION_ERROR":
-                            raise InvalidDateError(f"Invalid date format: {day}")
-
-                    raise Exception(f"Error {response.status} while downloading rates")
-                text = cast(Rates, await response.json())
+        started = time.monotonic()
+        session = self._session or get_session()
+        async with session.get(self.RATES_URL, params=params) as response:
+            logger.debug('CNB request for %s took %.3f s', day, time.monotonic() - started)
+            if response.status > 299:
+                if response.status == 400:
+                    error = cast(RateError, await response.json())
+                    if error.get("errorCode") == "VALIDATION_ERROR":
+                        raise InvalidDateError(f"Invalid date format: {day}")
+
+                raise Exception(f"Error {response.status} while downloading rates")
+            body = await response.text()
+            text = cast(Rates, json.loads(body))
+
+        self.last_payload_size = len(body)
+        self.last_download_seconds = time.monotonic() - started
         return text
 
     async def get_day_rates(self, day: date) -> dict[str, Decimal]:
@@ -62,39 +100,91 @@ class CnbRate:
             "CZK": Decimal(1),
         }
 
+        oldest = day - timedelta(days=FALLBACK_DAYS - 1)
+        self._invalid_days = {d for d in self._invalid_days if d >= oldest}
+        fallback_days = [
+            day - timedelta(days=previous_day)
+            for previous_day in range(1, FALLBACK_DAYS)
+            if day - timedelta(days=previous_day) not in self._invalid_days
+        ]
+
         cnb_rates: Rates | None = None
-        for previous_day in range(0, 7):
+        if day in self._invalid_days or day.weekday() >= 5:
+            # Weekend or a known holiday, probe all the days at once so it costs a single round trip,
+            # the newest published day wins
+            cnb_rates = await self._probe_days(([] if day in self._invalid_days else [day]) + fallback_days)
+        else:
             try:
-                cnb_rates = await self.download_rates(
-                    day - timedelta(days=previous_day)
-                )
-                break
+                cnb_rates = await self.download_rates(day)
             except InvalidDateError:
-                continue
+                # A holiday, remembered for the next time
+                self._invalid_days.add(day)
+                cnb_rates = await self._probe_days(fallback_days)
 
         if not cnb_rates:
-            raise Exception("Could not download CNB rates for last 7 days")
+            raise Exception(f"Could not download CNB rates for last {FALLBACK_DAYS} days")
 
         for rate in cnb_rates["rates"]:
             rates[rate["currencyCode"]] = Decimal(rate["rate"])
 
         return rates
 
-    async def get_current_rates(self):
+    async def _probe_days(self, candidates: list[date]) -> Rates | None:
+        """Rates of the newest of `candidates` CNB published, requested concurrently."""
+        tasks = [asyncio.ensure_future(self.download_rates(candidate)) for candidate in candidates]
+        try:
+            for candidate, task in zip(candidates, tasks):
+                try:
+                    return await task
+                except InvalidDateError:
+                    self._invalid_days.add(candidate)
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Collect the cancelled and failed probes
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return None
+
+    async def get_current_rates(self) -> dict[str, Decimal]:
         now = datetime.now(timezone.utc)
         day = now.astimezone(self._timezone).date()
 
-        # Update if needed
-        if self._last_checked_date is None or day != self._last_checked_date:
-            self._rates = await self.get_day_rates(day)
-            self._last_checked_date = day
-
-        return self._rates
+        rates = self._rates_by_day.get(day)
+        if rates is not None:
+            return rates
+
+        pending = self._pending.get(day)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load_rates(day))
+            self._pending[day] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(day, None))
+
+        # Don't cancel the shared request when one of the callers is cancelled
+        return await asyncio.shield(pending)
+
+    async def _load_rates(self, day: date) -> dict[str, Decimal]:
+        rates = self._cache.get_currency_rates(day) if self._cache is not None else None
+        if rates is None:
+            self.downloads += 1
+            with stage(self.timings, 'cnb'):
+                rates = await self.get_day_rates(day)
+            if self._cache is not None:
+                self._cache.set_currency_rates(day, rates)
+
+        # Keep only the current day, older rates are not needed anymore
+        self._rates_by_day = {day: rates}
+        self.digest = hashlib.blake2b(repr(sorted(rates.items())).encode(), digest_size=16).hexdigest()
+        return rates
 
 
 if __name__ == '__main__':
-    import asyncio
-    cnb_rate = CnbRate()
-    rates = asyncio.run(cnb_rate.get_current_rates())
+
+    async def get_current_rates():
+        try:
+            return await CnbRate().get_current_rates()
+        finally:
+            await close_session()
+
+    rates = asyncio.run(get_current_rates())
     for iso, rate in rates.items():
         print(iso, rate)
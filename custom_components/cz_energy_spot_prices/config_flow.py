@@ -5,11 +5,12 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.const import CONF_CURRENCY, CONF_UNIT_OF_MEASUREMENT
-from homeassistant.helpers.selector import TemplateSelector  # pyright: ignore[reportUnknownVariableType]
+from homeassistant.helpers.selector import BooleanSelector, TemplateSelector, TextSelector  # pyright: ignore[reportUnknownVariableType]
 from homeassistant.helpers.template import Template
 from homeassistant.exceptions import TemplateError
 
-from .const import DOMAIN, ADDITIONAL_COSTS_BUY_ELECTRICITY, ADDITIONAL_COSTS_SELL_ELECTRICITY, ADDITIONAL_COSTS_BUY_GAS
+from .const import DOMAIN, ADDITIONAL_COSTS_BUY_ELECTRICITY, ADDITIONAL_COSTS_SELL_ELECTRICITY, ADDITIONAL_COSTS_BUY_GAS, CHEAPEST_BLOCK_HOURS, ELECTRICITY_RESOLUTION, REFRESH_TIMINGS
+from .coordinator import CONSECUTIVE_HOURS, parse_consecutive_hours
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,11 @@ CURRENCIES = {
     'EUR': 'EUR',
 }
 
+RESOLUTIONS = {
+    'PT60M': '60 min',
+    'PT15M': '15 min',
+}
+
 DATA_SCHEMA = vol.Schema({
     vol.Required(CONF_CURRENCY, description='Currency', default='CZK'): vol.In(CURRENCIES),  # type: ignore
     vol.Required(CONF_UNIT_OF_MEASUREMENT, description='Energy unit', default='kWh'): vol.In(UNITS),  # type: ignore
@@ -80,6 +86,20 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 ADDITIONAL_COSTS_BUY_GAS,
                 default=self.config_entry.options.get(ADDITIONAL_COSTS_BUY_GAS, ''),
             ): TemplateSelector(),
+            vol.Optional(
+                CHEAPEST_BLOCK_HOURS,
+                default=self.config_entry.options.get(
+                    CHEAPEST_BLOCK_HOURS, ', '.join(str(i) for i in CONSECUTIVE_HOURS)
+                ),
+            ): TextSelector(),
+            vol.Optional(
+                ELECTRICITY_RESOLUTION,
+                default=self.config_entry.options.get(ELECTRICITY_RESOLUTION, 'PT60M'),
+            ): vol.In(RESOLUTIONS),  # type: ignore
+            vol.Optional(
+                REFRESH_TIMINGS,
+                default=self.config_entry.options.get(REFRESH_TIMINGS, False),
+            ): BooleanSelector(),
         })
 
         errors = {}
@@ -114,10 +134,16 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 except TemplateError:
                     errors[ADDITIONAL_COSTS_BUY_GAS] = 'invalid_template'
 
+            try:
+                _ = parse_consecutive_hours(cast(str, user_input.get(CHEAPEST_BLOCK_HOURS) or ""))
+            except ValueError:
+                errors[CHEAPEST_BLOCK_HOURS] = 'invalid_block_hours'
+
             if not errors:
                 return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
             step_id="init",
             data_schema=options_schema,
+            errors=errors,
         )
@@ -11,3 +11,9 @@ PLATFORMS = [
 ADDITIONAL_COSTS_BUY_ELECTRICITY = 'additional_costs_buy_electricity'
 ADDITIONAL_COSTS_SELL_ELECTRICITY = 'additional_costs_sell_electricity'
 ADDITIONAL_COSTS_BUY_GAS = 'additional_costs_buy_gas'
+CHEAPEST_BLOCK_HOURS = 'cheapest_block_hours'
+ELECTRICITY_RESOLUTION = 'electricity_resolution'
+REFRESH_TIMINGS = 'refresh_timings'
+
+SERVICE_GET_ELECTRICITY_PRICES = 'get_electricity_prices'
+SERVICE_BACKFILL = 'backfill'
@@ -1,6 +1,8 @@
 import asyncio
 import logging
-from datetime import datetime, timedelta, timezone, time
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime, timedelta, timezone, time
 from typing import cast, final, override
 from zoneinfo import ZoneInfo
 from decimal import Decimal
@@ -8,7 +10,7 @@ import random
 
 import async_timeout
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.update_coordinator import (
@@ -17,10 +19,35 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .spot_rate import SpotRate, OTEFault
+from .price_cache import RESOLUTION_STEPS, ElectricityResolution
+from .price_series import PriceSeries
+from .rate_template import RateTemplate
+from .statistics import PriceStatistics
+from .timing import StageTimings, stage
 
 logger = logging.getLogger(__name__)
 
+# Default lengths (in hours) of the cheapest consecutive blocks
 CONSECUTIVE_HOURS = (1, 2, 3, 4, 6, 8)
+MAX_CONSECUTIVE_HOURS = 24
+
+
+def parse_consecutive_hours(value: str | None) -> tuple[int, ...]:
+    """Parse comma separated block lengths, e.g. "1, 2, 5, 12". Empty value means defaults."""
+    if not value or not value.strip():
+        return CONSECUTIVE_HOURS
+
+    hours: set[int] = set()
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        hour = int(part)
+        if hour < 1 or hour > MAX_CONSECUTIVE_HOURS:
+            raise ValueError(f'Block length must be between 1 and {MAX_CONSECUTIVE_HOURS} hours: {hour}')
+        hours.add(hour)
+
+    return tuple(sorted(hours))
 
 
 def get_now(zoneinfo: timezone | ZoneInfo = timezone.utc) -> datetime:
@@ -28,128 +55,306 @@ def get_now(zoneinfo: timezone | ZoneInfo = timezone.utc) -> datetime:
 
 @final
 class SpotRateHour:
+    """View of a single interval of `HourlySpotRateData`, values are read from its columns."""
 
-    def __init__(self, dt_utc: datetime, dt_local: datetime, price: Decimal):
-        self.dt_utc = dt_utc
-        self.dt_local = dt_local
-        self.price = price
+    __slots__ = ('_data', 'index')
 
-        self.most_expensive_order = 0
+    most_expensive_order = 0
 
-        self.consecutive_sum_prices: dict[int, Decimal] = {}
+    def __init__(self, data: 'HourlySpotRateData', index: int):
+        self._data = data
+        self.index = index
 
-        self.cheapest_consecutive_order = {i: 0 for i in CONSECUTIVE_HOURS}
+    @property
+    def dt_utc(self) -> datetime:
+        return self._data.dts[self.index]
+
+    @property
+    def dt_local(self) -> datetime:
+        return self._data.dts[self.index].astimezone(self._data.zoneinfo)
+
+    @property
+    def price(self) -> Decimal:
+        return self._data.prices[self.index]
+
+    @property
+    def order(self) -> int:
+        """Order of this interval within its day, the same as 1 hour block order for hourly prices."""
+        return self._data.orders[self.index]
+
+    @property
+    def consecutive_sum_prices(self) -> dict[int, Decimal]:
+        sums: dict[int, Decimal] = {}
+        for hours in self._data.consecutive_hours:
+            window_sum = self._data.window_sum(self.index, hours)
+            if window_sum is not None:
+                sums[hours] = window_sum
+        return sums
+
+    @property
+    def cheapest_consecutive_order(self) -> dict[int, int]:
+        """Order of the block ending with this hour, all hours of a day are ordered for 1 hour blocks,
+        for longer blocks only the cheapest one is marked with 1."""
+        return {hours: self._data.cheapest_order(self.index, hours) for hours in self._data.consecutive_hours}
 
 
 @final
 class SpotRateDay:
-    def __init__(self):
-        self.hours_by_dt: dict[datetime, SpotRateHour] = {}
+    """Intervals of one local day, a range of indices of `HourlySpotRateData` columns.
 
-        self._cheapest_hour = 0
+    Created once the orders of the day are known, `ranked` holds the indices from the cheapest
+    to the most expensive interval.
+    """
 
-    def add_hour(self, hour: SpotRateHour):
-        self.hours_by_dt[hour.dt_utc] = hour
+    __slots__ = ('_data', 'indices', 'ranked', '_most_expensive', '_hours_by_dt')
 
-    def cheapest_hour(self) -> SpotRateHour | None:
-        cheapest_hour = None
-        for hour in self.hours_by_dt.values():
-            if cheapest_hour is None or cheapest_hour.price > hour.price:
-                cheapest_hour = hour
+    def __init__(self, data: 'HourlySpotRateData', start: int, end: int):
+        self._data = data
+        self.indices = range(start, end)
+        self._hours_by_dt: dict[datetime, SpotRateHour] | None = None
 
-        return cheapest_hour
+        # Orders are unique within a day, no sorting needed
+        ranked = array('i', [0]) * len(self.indices)
+        for i in self.indices:
+            ranked[data.orders[i] - 1] = i
+        self.ranked = ranked
 
-    def most_expensive_hour(self) -> SpotRateHour | None:
-        most_expensive_hour = None
-        for hour in self.hours_by_dt.values():
-            if most_expensive_hour is None or most_expensive_hour.price < hour.price:
-                most_expensive_hour = hour
+        if not ranked:
+            self._most_expensive = None
+            return
 
-        return most_expensive_hour
+        # Equal prices are ranked by time, the first of the most expensive ones is the earliest
+        prices = data.prices
+        max_price = prices[ranked[-1]]
+        most_expensive = len(ranked) - 1
+        while most_expensive > 0 and prices[ranked[most_expensive - 1]] == max_price:
+            most_expensive -= 1
+        self._most_expensive = ranked[most_expensive]
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @property
+    def hours(self) -> list[SpotRateHour]:
+        return self._data.hours[self.indices.start:self.indices.stop]
+
+    @property
+    def hours_by_dt(self) -> dict[datetime, SpotRateHour]:
+        """Views of the intervals by UTC datetime, created on first use."""
+        if self._hours_by_dt is None:
+            self._hours_by_dt = {hour.dt_utc: hour for hour in self.hours}
+        return self._hours_by_dt
+
+    def cheapest_hour(self) -> SpotRateHour | None:
+        if not self.ranked:
+            return None
+        return self._data.hours[self.ranked[0]]
+
+    def most_expensive_hour(self) -> SpotRateHour | None:
+        if self._most_expensive is None:
+            return None
+        return self._data.hours[self._most_expensive]
 
 
 @final
 class HourlySpotRateData:
+    """Electricity prices stored as columns ordered by time.
+
+    `dts` and `prices` hold the intervals, `price_values` the same prices as floats for attributes,
+    `orders` the order of each interval within its day. Window sums come from prefix sums of the
+    price series and only the cheapest block of each day is kept for blocks longer than one interval.
+    """
+
     def __init__(
         self,
         rates: SpotRate.RateByDatetime,
         zoneinfo: ZoneInfo,
-        rate_template: Template | None,
+        rate_template: RateTemplate | None,
+        consecutive_hours: tuple[int, ...] = CONSECUTIVE_HOURS,
+        step: timedelta = timedelta(hours=1),
+        previous: 'HourlySpotRateData | None' = None,
     ) -> None:
+        self.zoneinfo = zoneinfo
         self.now = get_now(zoneinfo)
         self.today_date = self.now.date()
+        # Hour order sensors need ranking of single hours
+        self.consecutive_hours = tuple(sorted({1, *consecutive_hours}))
         self.tomorrow_date = self.today_date + timedelta(days=1)
-
-        self.today_day = SpotRateDay()
-        self.tomorrow_day: SpotRateDay | None = None
-
-        self.hours_by_dt: dict[datetime, SpotRateHour] = {}
-
-        # Create individual SpotRateHour instances and compute statistics while doing that
-        for utc_hour, rate in rates.items():
-            if rate_template is not None:
-                rate = Decimal(
-                    cast(
-                        float,
-                        rate_template.async_render(
-                            {
-                                "value": float(rate),
-                                "hour": utc_hour,
-                            }
-                        ),
-                    )
-                )
-            rate_hour = SpotRateHour(utc_hour, utc_hour.astimezone(zoneinfo), rate)
-            self.hours_by_dt[utc_hour] = rate_hour
-
-            if rate_hour.dt_local.date() == self.today_date:
-                self.today_day.add_hour(rate_hour)
-            elif rate_hour.dt_local.date() == self.tomorrow_date:
-                if self.tomorrow_day is None:
-                    self.tomorrow_day = SpotRateDay()
-                self.tomorrow_day.add_hour(rate_hour)
-
-        for base_dt, hour in self.hours_by_dt.items():
-            rate = Decimal(0)
-            for offset in range(CONSECUTIVE_HOURS[-1]):
-                prev_dt = base_dt - timedelta(hours=offset)
-                prev_hour = self.hours_by_dt.get(prev_dt)
-                if not prev_hour:
-                    # Out of range, probably before yesterday
+        # Length of one interval, 15 minutes or 1 hour
+        self.step = step
+        self._step_minutes = step // timedelta(minutes=1)
+        periods_per_hour = timedelta(hours=1) // step
+        # Blocks are in hours, windows in intervals
+        self._lengths = {hours: hours * periods_per_hour for hours in self.consecutive_hours}
+
+        if rate_template is not None:
+            # All hours are rendered in one template pass, templates may depend on more than the spot rate
+            keys = sorted(rates)
+            rates = dict(zip(keys, rate_template.render([rates[dt] for dt in keys], keys)))
+
+        self._series = series = PriceSeries(rates, step)
+        self.dts = series.dts
+        self.prices = series.prices
+        self._day_ranges = self._local_day_ranges(self.dts, zoneinfo)
+
+        if previous is not None and (
+            previous.zoneinfo != zoneinfo or previous.step != step or previous.consecutive_hours != self.consecutive_hours
+        ):
+            previous = None
+
+        # Days with the same prices as in the previous data reuse its orders and cheapest blocks
+        unchanged: dict[date, range] = {}
+        if previous is not None:
+            for day, indices in self._day_ranges.items():
+                previous_indices = previous._same_day(day, self.dts[indices.start:indices.stop], self.prices[indices.start:indices.stop])  # pyright: ignore[reportPrivateUsage]
+                if previous_indices is not None:
+                    unchanged[day] = previous_indices
+
+        self.price_values = array('d', map(float, series.prices))
+
+        # Local days are ranges of the ordered intervals, find them by UTC bounds
+        today_start = datetime.combine(self.today_date, time(0), tzinfo=zoneinfo).astimezone(timezone.utc)
+        tomorrow_start = datetime.combine(self.tomorrow_date, time(0), tzinfo=zoneinfo).astimezone(timezone.utc)
+        tomorrow_end = datetime.combine(self.tomorrow_date + timedelta(days=1), time(0), tzinfo=zoneinfo).astimezone(timezone.utc)
+        today_first = bisect_left(self.dts, today_start)
+        tomorrow_first = bisect_left(self.dts, tomorrow_start)
+        tomorrow_last = bisect_left(self.dts, tomorrow_end)
+
+        days = {self.today_date: range(today_first, tomorrow_first)}
+        if tomorrow_last > tomorrow_first:
+            days[self.tomorrow_date] = range(tomorrow_first, tomorrow_last)
+
+        self.orders = array('i', [0]) * len(self.dts)
+        # End of the cheapest block of each ranked day by block length in hours
+        self._cheapest_end_dts: dict[date, dict[int, datetime]] = {}
+        self.recomputed_days: list[date] = []
+        for day, indices in days.items():
+            if not indices:
+                continue
+
+            previous_indices = unchanged.get(day)
+            if previous is not None and previous_indices is not None and day in previous._cheapest_end_dts:  # pyright: ignore[reportPrivateUsage]
+                self.orders[indices.start:indices.stop] = previous.orders[previous_indices.start:previous_indices.stop]
+                # Blocks ending early in the day start in the previous one
+                day_before = day - timedelta(days=1)
+                if day_before in unchanged or (day_before not in self._day_ranges and day_before not in previous._day_ranges):  # pyright: ignore[reportPrivateUsage]
+                    self._cheapest_end_dts[day] = previous._cheapest_end_dts[day]  # pyright: ignore[reportPrivateUsage]
                     continue
+            else:
+                for i, order in PriceSeries.rank(indices, self.prices).items():
+                    self.orders[i] = order
+
+            self.recomputed_days.append(day)
+            end_dts: dict[int, datetime] = {}
+            for hours, length in self._lengths.items():
+                if length == 1:
+                    end = indices.start + self.orders[indices.start:indices.stop].index(1)
+                elif (end := PriceSeries.cheapest(indices, series.window_sums(length, indices))) is None:
+                    continue
+                end_dts[hours] = self.dts[end]
+            self._cheapest_end_dts[day] = end_dts
+
+        self.today_day = SpotRateDay(self, today_first, tomorrow_first)
+        self.tomorrow_day = SpotRateDay(self, tomorrow_first, tomorrow_last) if tomorrow_last > tomorrow_first else None
+
+        # End index of the cheapest block of each day by block length in hours
+        self._cheapest_ends: dict[int, list[int]] = {
+            hours: [cast(int, series.index_of(end_dts[hours])) for end_dts in self._cheapest_end_dts.values() if hours in end_dts]
+            for hours in self.consecutive_hours
+        }
+
+        self._hours: list[SpotRateHour] | None = None
+        self._hours_by_dt: dict[datetime, SpotRateHour] | None = None
+
+    @staticmethod
+    def _local_day_ranges(dts: list[datetime], zoneinfo: ZoneInfo) -> dict[date, range]:
+        """Ranges of ordered `dts` by local day."""
+        ranges: dict[date, range] = {}
+        if not dts:
+            return ranges
+
+        day = dts[0].astimezone(zoneinfo).date()
+        last_day = dts[-1].astimezone(zoneinfo).date()
+        start = 0
+        while day <= last_day:
+            next_day = day + timedelta(days=1)
+            end = bisect_left(dts, datetime.combine(next_day, time(0), tzinfo=zoneinfo).astimezone(timezone.utc), start)
+            if end > start:
+                ranges[day] = range(start, end)
+            start = end
+            day = next_day
+        return ranges
+
+    def _same_day(self, day: date, dts: list[datetime], prices: list[Decimal]) -> range | None:
+        """Indices of `day` when it had the same prices here."""
+        indices = self._day_ranges.get(day)
+        if indices is None:
+            return None
+        if self.dts[indices.start:indices.stop] != dts or self.prices[indices.start:indices.stop] != prices:
+            return None
+        return indices
+
+    def refresh_now(self) -> None:
+        """Move to the current time within the same day, prices and orders stay valid."""
+        self.now = get_now(self.zoneinfo)
+
+    def has_complete_tomorrow(self) -> bool:
+        if self.tomorrow_day is None:
+            return False
+
+        start = datetime.combine(self.tomorrow_date, time(0), tzinfo=self.zoneinfo)
+        end = datetime.combine(self.tomorrow_date + timedelta(days=1), time(0), tzinfo=self.zoneinfo)
+        # 23 or 25 hours on daylight saving time change
+        expected = (end.astimezone(timezone.utc) - start.astimezone(timezone.utc)) // self.step
+        return len(self.tomorrow_day) >= expected
 
-                rate += prev_hour.price
-
-                if (offset + 1) in CONSECUTIVE_HOURS:
-                    hour.consecutive_sum_prices[(offset + 1)] = rate
+    @property
+    def hours(self) -> list[SpotRateHour]:
+        """Views of all intervals, created on first use."""
+        if self._hours is None:
+            self._hours = [SpotRateHour(self, i) for i in range(len(self.dts))]
+        return self._hours
 
-        for consecutive in CONSECUTIVE_HOURS:
-            sorted_today_hours = sorted(
-                self.today_day.hours_by_dt.values(),
-                key=lambda hour: hour.consecutive_sum_prices.get(
-                    consecutive, Decimal(0)
-                ),
-            )
-            for i, hour in enumerate(sorted_today_hours, 1):
-                hour.cheapest_consecutive_order[consecutive] = i
-
-            if self.tomorrow_day is not None:
-                sorted_tomorrow_hours = sorted(
-                    self.tomorrow_day.hours_by_dt.values(),
-                    key=lambda hour: hour.consecutive_sum_prices.get(
-                        consecutive, Decimal(0)
-                    ),
-                )
-                for i, hour in enumerate(sorted_tomorrow_hours, 1):
-                    hour.cheapest_consecutive_order[consecutive] = i
+    @property
+    def hours_by_dt(self) -> dict[datetime, SpotRateHour]:
+        """Views of all intervals by UTC datetime, created on first use."""
+        if self._hours_by_dt is None:
+            self._hours_by_dt = {hour.dt_utc: hour for hour in self.hours}
+        return self._hours_by_dt
+
+    def window_sum(self, index: int, hours: int) -> Decimal | None:
+        """Sum of the block of `hours` ending with the interval at `index`."""
+        return self._series.window_sum(index, self._lengths[hours])
+
+    def cheapest_order(self, index: int, hours: int) -> int:
+        if self._lengths[hours] == 1:
+            return self.orders[index]
+        return 1 if index in self._cheapest_ends[hours] else 0
+
+    def cheapest_blocks(self, hours: int) -> list[SpotRateHour]:
+        """Last intervals of the cheapest blocks of `hours`, one for today and one for tomorrow.
+
+        Blocks not fully inside the data, starting before its first interval or with missing
+        intervals, are skipped.
+        """
+        length = self._lengths[hours]
+        blocks: list[SpotRateHour] = []
+        for end in self._cheapest_ends[hours]:
+            start = self._series.index_of(self.dts[end] - self.step * (length - 1))
+            if start is None or end - start + 1 != length:
+                logger.debug('Cheapest %d hours block ending at %s is not complete, skipping it', hours, self.dts[end])
+                continue
+            blocks.append(self.hours[end])
+        return blocks
 
     def hour_for_dt(self, dt: datetime) -> SpotRateHour:
-        utc_hour = dt.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        utc_dt = dt.astimezone(timezone.utc)
+        utc_hour = utc_dt.replace(minute=utc_dt.minute - utc_dt.minute % self._step_minutes, second=0, microsecond=0)
 
-        try:
-            return self.hours_by_dt[utc_hour]
-        except KeyError:
+        index = self._series.index_of(utc_hour)
+        if index is None:
             raise LookupError(f'No hour found in data for {dt.isoformat()}')
+        return self.hours[index]
 
     @property
     def current_hour(self) -> SpotRateHour:
@@ -170,20 +375,24 @@ class HourlyTradeRateData:
         self,
         rates: SpotRate.RateByDatetime,
         zoneinfo: ZoneInfo,
-        buy_rate_template: Template | None,
-        sell_rate_template: Template | None,
+        buy_rate_template: RateTemplate | None,
+        sell_rate_template: RateTemplate | None,
+        consecutive_hours: tuple[int, ...] = CONSECUTIVE_HOURS,
+        step: timedelta = timedelta(hours=1),
+        previous: 'HourlyTradeRateData | None' = None,
     ) -> None:
-        self.spot_rates = HourlySpotRateData(rates, zoneinfo, None)
+        # Days that did not change since the previous data are not ranked again
+        self.spot_rates = HourlySpotRateData(rates, zoneinfo, None, consecutive_hours, step, previous and previous.spot_rates)
 
         if buy_rate_template is None:
             self.buy_rates = self.spot_rates
         else:
-            self.buy_rates = HourlySpotRateData(rates, zoneinfo, buy_rate_template)
+            self.buy_rates = HourlySpotRateData(rates, zoneinfo, buy_rate_template, consecutive_hours, step, previous and previous.buy_rates)
 
         if sell_rate_template is None:
             self.sell_rates = self.spot_rates
         else:
-            self.sell_rates = HourlySpotRateData(rates, zoneinfo, sell_rate_template)
+            self.sell_rates = HourlySpotRateData(rates, zoneinfo, sell_rate_template, consecutive_hours, step, previous and previous.sell_rates)
 
 
 @final
@@ -192,8 +401,9 @@ class DailySpotRateData:
         self,
         rates: SpotRate.RateByDatetime,
         zoneinfo: ZoneInfo,
-        rate_template: Template | None,
+        rate_template: RateTemplate | None,
     ) -> None:
+        self.zoneinfo = zoneinfo
         self.now = get_now(zoneinfo)
         today = self.now.date()
 
@@ -204,9 +414,14 @@ class DailySpotRateData:
         midnight_yesterday = datetime.combine(date=yesterday, time=time(hour=0), tzinfo=zoneinfo).astimezone(timezone.utc)
 
         # It's 0 when there are no data, we want None
-        self._yesteday = self._get_trade_rate(rates, midnight_yesterday, rate_template) or None
-        self._today = self._get_trade_rate(rates, midnight_today, rate_template) or None
-        self._tomorrow = self._get_trade_rate(rates, midnight_tomorrow, rate_template) or None
+        days = [midnight_yesterday, midnight_today, midnight_tomorrow]
+        day_rates = {day: rate for day in days if (rate := rates.get(day, None) or None) is not None}
+        if rate_template is not None and day_rates:
+            day_rates = dict(zip(day_rates.keys(), rate_template.render(list(day_rates.values()), list(day_rates.keys()))))
+
+        self._yesteday = day_rates.get(midnight_yesterday) or None
+        self._today = day_rates.get(midnight_today) or None
+        self._tomorrow = day_rates.get(midnight_tomorrow) or None
 
     @property
     def today(self) -> Decimal:
@@ -220,28 +435,9 @@ class DailySpotRateData:
     def tomorrow(self) -> Decimal | None:
         return self._tomorrow
 
-    def _get_trade_rate(
-        self,
-        rates: SpotRate.RateByDatetime,
-        dt: datetime,
-        rate_template: Template | None,
-    ) -> Decimal | None:
-        rate = rates.get(dt, None) or None
-
-        if rate is not None and rate_template is not None:
-            rate = Decimal(
-                cast(
-                    float,
-                    rate_template.async_render(
-                        {
-                            "value": float(rate),
-                            "day": dt,
-                        }
-                    ),
-                )
-            )
-
-        return rate
+    def refresh_now(self) -> None:
+        """Move to the current time within the same day, prices stay valid."""
+        self.now = get_now(self.zoneinfo)
 
 
 @final
@@ -250,7 +446,7 @@ class DailyTradeRateData:
         self,
         rates: SpotRate.RateByDatetime,
         zoneinfo: ZoneInfo,
-        buy_rate_template: Template | None,
+        buy_rate_template: RateTemplate | None,
     ) -> None:
         self.spot_rates = DailySpotRateData(rates, zoneinfo, None)
         if buy_rate_template is None:
@@ -268,12 +464,36 @@ class SpotRateData:
     def get_now(self, zoneinfo: timezone | ZoneInfo = timezone.utc) -> datetime:
         return get_now(zoneinfo=zoneinfo)
 
+    def is_final(self, now: datetime) -> bool:
+        """Whether prices of all delivery days are known, so downloading them again won't change anything.
+
+        Past days and today are final once published, tomorrow is final when all its intervals are published.
+        """
+        return (
+            self.electricity.spot_rates.today_date == now.date()
+            and self.electricity.spot_rates.has_complete_tomorrow()
+            and self.gas.spot_rates.tomorrow is not None
+        )
+
+    def refresh_now(self) -> None:
+        """Recompute time dependent state from memory."""
+        rates = (
+            self.electricity.spot_rates,
+            self.electricity.buy_rates,
+            self.electricity.sell_rates,
+            self.gas.spot_rates,
+            self.gas.buy_rates,
+        )
+        # Buy and sell rates are the same objects as spot rates when there is no template
+        for rate in {id(rate): rate for rate in rates}.values():
+            rate.refresh_now()
+
 
 @final
 class SpotRateCoordinator(DataUpdateCoordinator[SpotRateData | None]):
     """My custom coordinator."""
 
-    def __init__(self, hass: HomeAssistant, spot_rate: SpotRate, in_eur: bool, unit: SpotRate.EnergyUnit, electricity_buy_rate_template_code: str, electricity_sell_rate_template_code: str, gas_buy_rate_template_code: str):
+    def __init__(self, hass: HomeAssistant, spot_rate: SpotRate, in_eur: bool, unit: SpotRate.EnergyUnit, electricity_buy_rate_template_code: str, electricity_sell_rate_template_code: str, gas_buy_rate_template_code: str, consecutive_hours: tuple[int, ...] = CONSECUTIVE_HOURS, resolution: ElectricityResolution = 'PT60M', refresh_timings: bool = False, entry_id: str | None = None):
         """Initialize my coordinator."""
         logger.debug('SpotRateCoordinator.__init__')
         super().__init__(
@@ -285,8 +505,16 @@ class SpotRateCoordinator(DataUpdateCoordinator[SpotRateData | None]):
         self._spot_rate = spot_rate
         self._in_eur = in_eur
         self._unit: SpotRate.EnergyUnit = unit
+        self.consecutive_hours = consecutive_hours
+        self.resolution: ElectricityResolution = resolution
         self._spot_rate_data = None
+        # Digests of the inputs of the current data, the same inputs give the same data
+        self._inputs: tuple[object, ...] | None = None
+        self.input_hits = 0
+        self.input_misses = 0
         self._retry_attempt = 0
+        # When the pending delayed update (a retry or a randomly delayed refresh) runs
+        self._next_update: datetime | None = None
         # Delays in seconds, total needs to be less than 3600 (one hour) as the `on_schedule` is scheduled once an hour
         self._retry_attempt_delays = [2, 4, 8, 16, 32, 64, 128, 256, 512, 1024]
         unique_id = f"spot_rate_{unit}_{self._in_eur}"
@@ -294,32 +522,107 @@ class SpotRateCoordinator(DataUpdateCoordinator[SpotRateData | None]):
         self._electricity_buy_rate_template = None
         if electricity_buy_rate_template_code.strip():
             try:
-                self._electricity_buy_rate_template = Template(electricity_buy_rate_template_code, hass)
+                self._electricity_buy_rate_template = RateTemplate(Template(electricity_buy_rate_template_code, hass), 'hour')
             except TemplateError as e:
                 logger.error("Template error in %s: %s", unique_id, e)
 
         self._electricity_sell_rate_template = None
         if electricity_sell_rate_template_code.strip():
             try:
-                self._electricity_sell_rate_template = Template(electricity_sell_rate_template_code, hass)
+                self._electricity_sell_rate_template = RateTemplate(Template(electricity_sell_rate_template_code, hass), 'hour')
             except TemplateError as e:
                 logger.error("Template error in %s: %s", unique_id, e)
 
         self._gas_buy_rate_template = None
         if gas_buy_rate_template_code.strip():
             try:
-                self._gas_buy_rate_template = Template(gas_buy_rate_template_code, hass)
+                self._gas_buy_rate_template = RateTemplate(Template(gas_buy_rate_template_code, hass), 'day')
             except TemplateError as e:
                 logger.error("Template error in %s: %s", unique_id, e)
 
-        # TODO: do we need to unschedule it?
+        # Stage timings of refreshes, for the diagnostic sensor
+        self.timings: StageTimings | None = None
+        if refresh_timings:
+            self.timings = StageTimings()
+            # Shared by all config entries, the last one enabling timings gets them until it is unloaded
+            spot_rate.timings = self.timings
+            spot_rate.cnb_rate.timings = self.timings
+            for template in (self._electricity_buy_rate_template, self._electricity_sell_rate_template, self._gas_buy_rate_template):
+                if template is not None:
+                    template.timings = self.timings
+
+        # Finished days are imported to long-term statistics
+        self._statistics = PriceStatistics(
+            hass,
+            entry_id,
+            spot_rate,
+            in_eur,
+            unit,
+            resolution,
+            {
+                'spot': None,
+                **({'buy': self._electricity_buy_rate_template} if self._electricity_buy_rate_template else {}),
+                **({'sell': self._electricity_sell_rate_template} if self._electricity_sell_rate_template else {}),
+            },
+        )
+        # Running import, cancelled when the config entry is unloaded
+        self._import_task: asyncio.Task[None] | None = None
+
+        # Cancelled by `unschedule` when the config entry is unloaded
         self._unschedule = event.async_track_utc_time_change(hass, self.on_schedule, minute=0, second=0)
+        self._unschedule_quarters: CALLBACK_TYPE | None = None
+        if resolution == 'PT15M':
+            # Prices change within the hour, but they are downloaded once an hour
+            self._unschedule_quarters = event.async_track_utc_time_change(hass, self.on_quarter, minute=[15, 30, 45], second=0)
+
+    @callback
+    def unschedule(self) -> None:
+        """Stop the scheduled updates."""
+        self._unschedule()
+        if self._unschedule_quarters is not None:
+            self._unschedule_quarters()
+            self._unschedule_quarters = None
+
+    @callback
+    def cancel_import(self) -> None:
+        """Stop the running import to long-term statistics."""
+        if self._import_task is not None:
+            _ = self._import_task.cancel()
+            self._import_task = None
+
+    @callback
+    def release_timings(self) -> None:
+        """Stop measuring the shared downloads when timings of this coordinator are not shown anymore."""
+        if self.timings is None:
+            return
+        if self._spot_rate.timings is self.timings:
+            self._spot_rate.timings = None
+        if self._spot_rate.cnb_rate.timings is self.timings:
+            self._spot_rate.cnb_rate.timings = None
 
     @callback
     def on_schedule(self, _dt: datetime):
+        data = self._spot_rate_data
+        if data is not None and data.is_final(get_now(ZoneInfo(self.hass.config.time_zone))):
+            # Today and tomorrow are already complete, only the current hour changes
+            logger.debug('SpotRateCoordinator.on_schedule all delivery days are final, skipping download')
+            data.refresh_now()
+            self.async_update_listeners()
+            return
+
         _ = self.hass.async_create_task(self.async_refresh())
 
+    @callback
+    def on_quarter(self, _dt: datetime):
+        if self._spot_rate_data is not None:
+            self._spot_rate_data.refresh_now()
+            self.async_update_listeners()
+
     async def fetch_data(self):
+        with stage(self.timings, 'fetch'):
+            return await self._fetch_data()
+
+    async def _fetch_data(self):
         logger.debug('SpotRateCoordinator.fetch_data')
 
         zoneinfo = ZoneInfo(self.hass.config.time_zone)
@@ -327,14 +630,44 @@ class SpotRateCoordinator(DataUpdateCoordinator[SpotRateData | None]):
 
         async with async_timeout.timeout(30):
             electricity_rates, gas_rates = await asyncio.gather(
-                self._spot_rate.get_electricity_rates(now, in_eur=self._in_eur, unit=self._unit),
+                self._spot_rate.get_electricity_rates(now, in_eur=self._in_eur, unit=self._unit, resolution=self.resolution),
                 self._spot_rate.get_gas_rates(now, in_eur=self._in_eur, unit=self._unit),
             )
             self._retry_attempt = 0
-            return SpotRateData(
-                electricity=HourlyTradeRateData(electricity_rates, zoneinfo, self._electricity_buy_rate_template, self._electricity_sell_rate_template),
-                gas=DailyTradeRateData(gas_rates, zoneinfo, self._gas_buy_rate_template),
+
+            inputs = (
+                now.date(),
+                self._spot_rate.digests.get('electricity'),
+                self._spot_rate.digests.get('gas'),
+                None if self._in_eur else self._spot_rate.cnb_rate.digest,
             )
+            if self._spot_rate_data is not None and inputs == self._inputs:
+                self.input_hits += 1
+                logger.debug('Inputs unchanged (%d hits, %d misses), keeping the data', self.input_hits, self.input_misses)
+                self._spot_rate_data.refresh_now()
+                return self._spot_rate_data
+            self.input_misses += 1
+
+            previous = self._spot_rate_data.electricity if self._spot_rate_data is not None else None
+            with stage(self.timings, 'model'):
+                electricity = HourlyTradeRateData(
+                    electricity_rates,
+                    zoneinfo,
+                    self._electricity_buy_rate_template,
+                    self._electricity_sell_rate_template,
+                    self.consecutive_hours,
+                    RESOLUTION_STEPS[self.resolution],
+                    previous,
+                )
+                data = SpotRateData(
+                    electricity=electricity,
+                    gas=DailyTradeRateData(gas_rates, zoneinfo, self._gas_buy_rate_template),
+                )
+            logger.debug('Recomputed electricity days %s', electricity.spot_rates.recomputed_days)
+            if self._import_task is None or self._import_task.done():
+                self._import_task = self.hass.async_create_task(self._statistics.async_import(now.date()))
+            self._inputs = inputs
+            return data
 
     def retry_maybe(self, exc_info: Exception | None=None):
         try:
@@ -346,14 +679,17 @@ class SpotRateCoordinator(DataUpdateCoordinator[SpotRateData | None]):
         if delay is not None:
             logger.error('OTE request failed %d times, retrying in %d seconds', self._retry_attempt, delay, exc_info=exc_info)
             _ = event.async_call_later(self.hass, delay=delay, action=self.update_data)
+            self._next_update = datetime.now(timezone.utc) + timedelta(seconds=delay)
         else:
             logger.error('OTE request failed %d times, not retrying', self._retry_attempt, exc_info=exc_info)
 
     async def update_data(self, dt: datetime):
         logger.debug('SpotRateCoordinator.update_data %s', dt)
+        self._next_update = None
         try:
             self._spot_rate_data = await self.fetch_data()
-            self.async_set_updated_data(self._spot_rate_data)
+            with stage(self.timings, 'fanout'):
+                self.async_set_updated_data(self._spot_rate_data)
 
         except (OTEFault, asyncio.TimeoutError) as e:
             self.retry_maybe(exc_info=e)
@@ -376,6 +712,7 @@ class SpotRateCoordinator(DataUpdateCoordinator[SpotRateData | None]):
             # users hitting the API at the same time, max delay is 2 minutes
             delay = random.randint(5, 120)
             _ = event.async_call_later(self.hass, delay=delay, action=self.update_data)
+            self._next_update = datetime.now(timezone.utc) + timedelta(seconds=delay)
             logger.debug(f'SpotRateCoordinator.update_data scheduled in {delay} seconds')
         else:
             try:
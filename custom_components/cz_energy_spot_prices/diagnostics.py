@@ -0,0 +1,132 @@
+"""Diagnostics with the data model, downloads, caches, retries and timings of a config entry."""
+
+import sys
+from collections import Counter
+from typing import Any, cast
+
+from homeassistant.core import HomeAssistant
+
+from . import SpotRateConfigEntry
+from .const import DOMAIN
+from .coordinator import DailySpotRateData, HourlySpotRateData, SpotRateCoordinator
+from .price_cache import PriceCache
+from .rate_template import RateTemplate
+
+
+def _ratio(hits: int, misses: int) -> float | None:
+    return round(hits / (hits + misses), 3) if hits + misses else None
+
+
+def _hourly_summary(rates: HourlySpotRateData) -> dict[str, Any]:
+    intervals = Counter(dt.astimezone(rates.zoneinfo).date().isoformat() for dt in rates.dts)
+    # Columns and their items, datetimes are mostly shared with the other trades
+    size = (
+        sys.getsizeof(rates.dts)
+        + sum(sys.getsizeof(dt) for dt in rates.dts)
+        + sys.getsizeof(rates.prices)
+        + sum(sys.getsizeof(price) for price in rates.prices)
+        + sys.getsizeof(rates.price_values)
+        + sys.getsizeof(rates.orders)
+    )
+    return {
+        'intervals_per_day': dict(intervals),
+        'step_minutes': rates.step.total_seconds() / 60,
+        'recomputed_days': [day.isoformat() for day in rates.recomputed_days],
+        'memory_estimate_bytes': size,
+    }
+
+
+def _daily_summary(rates: DailySpotRateData) -> dict[str, Any]:
+    try:
+        today = str(rates.today)
+    except LookupError:
+        today = None
+    return {
+        'today': today,
+        'tomorrow': None if rates.tomorrow is None else str(rates.tomorrow),
+    }
+
+
+def _template_summary(template: RateTemplate | None) -> dict[str, Any] | None:
+    if template is None:
+        return None
+    return {
+        'calls': template.calls,
+        'renders': template.renders,
+        'last_render_ms': None if template.last_render_seconds is None else round(template.last_render_seconds * 1000, 3),
+        'mean_render_ms': round(template.render_seconds / template.calls * 1000, 3) if template.calls else None,
+    }
+
+
+def _cache_summary(cache: object) -> dict[str, Any] | None:
+    if not isinstance(cache, PriceCache):
+        return None
+    stats = cache.stats()
+    return {**stats, 'hit_ratio': _ratio(cache.hits, cache.misses)}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: SpotRateConfigEntry) -> dict[str, Any]:
+    coordinator: SpotRateCoordinator = entry.runtime_data
+    spot_rate = coordinator._spot_rate  # pyright: ignore[reportPrivateUsage]
+    cnb_rate = spot_rate.cnb_rate
+    domain_data = cast(dict[str, object], hass.data.get(DOMAIN, {}))
+
+    model: dict[str, Any] | None = None
+    data = coordinator.data
+    if data is not None:
+        model = {
+            'electricity': {
+                'spot': _hourly_summary(data.electricity.spot_rates),
+                'buy': _hourly_summary(data.electricity.buy_rates) if coordinator.has_electricity_buy_rate_template() else None,
+                'sell': _hourly_summary(data.electricity.sell_rates) if coordinator.has_electricity_sell_rate_template() else None,
+            },
+            'gas': {
+                'spot': _daily_summary(data.gas.spot_rates),
+                'buy': _daily_summary(data.gas.buy_rates) if coordinator.has_gas_buy_rate_template() else None,
+            },
+        }
+
+    return {
+        'entry': {
+            'data': dict(entry.data),
+            'options': dict(entry.options),
+        },
+        'model': model,
+        'downloads': {
+            'ote': {
+                'last_payload_chars': spot_rate.last_payload_sizes,
+                'last_parse_ms': {commodity: round(seconds * 1000, 3) for commodity, seconds in spot_rate.last_parse_seconds.items()},
+                'digests': spot_rate.digests,
+            },
+            'cnb': {
+                'downloads': cnb_rate.downloads,
+                'last_payload_chars': cnb_rate.last_payload_size,
+                'last_download_ms': None if cnb_rate.last_download_seconds is None else round(cnb_rate.last_download_seconds * 1000, 3),
+            },
+        },
+        'caches': {
+            'prices': _cache_summary(domain_data.get('price_cache')),
+            'history': _cache_summary(domain_data.get('history_cache')),
+            'payloads': {
+                'hits': spot_rate.payload_hits,
+                'misses': spot_rate.payload_misses,
+                'hit_ratio': _ratio(spot_rate.payload_hits, spot_rate.payload_misses),
+            },
+            'inputs': {
+                'hits': coordinator.input_hits,
+                'misses': coordinator.input_misses,
+                'hit_ratio': _ratio(coordinator.input_hits, coordinator.input_misses),
+            },
+        },
+        'retry': {
+            'attempt': coordinator._retry_attempt,  # pyright: ignore[reportPrivateUsage]
+            'next_update': None if coordinator._next_update is None else coordinator._next_update.isoformat(),  # pyright: ignore[reportPrivateUsage]
+            'last_update_success': coordinator.last_update_success,
+        },
+        'templates': {
+            'electricity_buy': _template_summary(coordinator._electricity_buy_rate_template),  # pyright: ignore[reportPrivateUsage]
+            'electricity_sell': _template_summary(coordinator._electricity_sell_rate_template),  # pyright: ignore[reportPrivateUsage]
+            'gas_buy': _template_summary(coordinator._gas_buy_rate_template),  # pyright: ignore[reportPrivateUsage]
+        },
+        'timings': coordinator.timings.summary() if coordinator.timings is not None else None,
+    }
@@ -0,0 +1,80 @@
+"""Pooled HTTP session for standalone use outside of Home Assistant.
+
+Inside Home Assistant the shared session from `async_get_clientsession` is injected
+into `SpotRate` and `CnbRate` instead.
+"""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Keep idle connections open long enough to be reused by follow-up requests (OTE + CNB fallback)
+KEEPALIVE_TIMEOUT = 60
+
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _on_connection_create_end(
+    _session: aiohttp.ClientSession,
+    _ctx: SimpleNamespace,
+    _params: aiohttp.TraceConnectionCreateEndParams,
+) -> None:
+    logger.debug('New connection created')
+
+
+async def _on_connection_reuseconn(
+    _session: aiohttp.ClientSession,
+    _ctx: SimpleNamespace,
+    _params: aiohttp.TraceConnectionReuseconnParams,
+) -> None:
+    logger.debug('Connection reused')
+
+
+def _release_session(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Close the session of another event loop, its connections can't be used from this one."""
+    if session.closed:
+        return
+    if loop is not None and not loop.is_closed():
+        # Closed on its own loop, whenever that runs again
+        _ = asyncio.run_coroutine_threadsafe(session.close(), loop)
+    else:
+        # The connections went away with the loop, only the session is left open
+        session.detach()
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Return module level session with keep-alive connection pool, create it if needed."""
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        if _session is not None:
+            _release_session(_session, _session_loop)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(_on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(keepalive_timeout=KEEPALIVE_TIMEOUT),
+            trace_configs=[trace_config],
+        )
+        _session_loop = loop
+
+    return _session
+
+
+async def close_session() -> None:
+    """Close the module level session, call it before the event loop is closed."""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+
+    _session = None
+    _session_loop = None
@@ -0,0 +1,175 @@
+"""Persistent day-granular cache of published prices."""
+
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Literal, TypedDict, final
+from zoneinfo import ZoneInfo
+
+from homeassistant.helpers.storage import Store
+
+logger = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Delay before the cache is written to disk, more days usually arrive at once
+SAVE_DELAY = 10
+
+# How many days back are kept in the cache
+RETENTION_DAYS = 14
+
+Commodity = Literal['electricity', 'gas']
+Resolution = Literal['PT15M', 'PT60M', 'P1D']
+ElectricityResolution = Literal['PT15M', 'PT60M']
+
+RESOLUTION_STEPS: dict[Resolution, timedelta] = {
+    'PT15M': timedelta(minutes=15),
+    'PT60M': timedelta(hours=1),
+    'P1D': timedelta(days=1),
+}
+
+
+class CacheData(TypedDict):
+    # "commodity|date|resolution|currency" -> prices of all periods of the day in order
+    days: dict[str, list[str]]
+    # "date" -> currency code -> CZK rate
+    currency_rates: dict[str, dict[str, str]]
+
+
+@final
+class PriceCache:
+    """Prices of complete delivery days, which never change once published.
+
+    Days are stored as a list of prices in period order, timestamps are derived from
+    the local start of the day and the resolution, so the cache stays compact.
+    Without `store` the cache lives only in memory.
+    """
+
+    def __init__(
+        self,
+        store: Store[CacheData] | None = None,
+        timezone: ZoneInfo = ZoneInfo('Europe/Prague'),
+        retention_days: int | None = RETENTION_DAYS,
+    ) -> None:
+        self._store = store
+        self._timezone = timezone
+        self._retention_days = retention_days
+        self._days: dict[str, list[str]] = {}
+        self._currency_rates: dict[str, dict[str, str]] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(commodity: Commodity, day: date, resolution: Resolution, currency: str = 'EUR') -> str:
+        return f'{commodity}|{day.isoformat()}|{resolution}|{currency}'
+
+    async def async_load(self) -> None:
+        if self._store is None or self._loaded:
+            return
+
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            data = await self._store.async_load()
+            if data:
+                self._days = data.get('days', {})
+                self._currency_rates = data.get('currency_rates', {})
+            self._loaded = True
+            logger.debug('Loaded %d days from price cache', len(self._days))
+
+    def start_of_day(self, day: date) -> datetime:
+        return datetime.combine(day, time(0), tzinfo=self._timezone).astimezone(ZoneInfo('UTC'))
+
+    def periods_in_day(self, day: date, resolution: Resolution) -> int:
+        if resolution == 'P1D':
+            return 1
+        return int((self.start_of_day(day + timedelta(days=1)) - self.start_of_day(day)) / RESOLUTION_STEPS[resolution])
+
+    def get_day(self, commodity: Commodity, day: date, resolution: Resolution, currency: str = 'EUR') -> dict[datetime, Decimal] | None:
+        prices = self._days.get(self.key(commodity, day, resolution, currency))
+        if prices is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        start = self.start_of_day(day)
+        step = RESOLUTION_STEPS[resolution]
+        return {start + step * i: Decimal(price) for i, price in enumerate(prices)}
+
+    def has_day(self, commodity: Commodity, day: date, resolution: Resolution, currency: str = 'EUR') -> bool:
+        """Whether the day is stored, without counting it as a hit or miss."""
+        return self.key(commodity, day, resolution, currency) in self._days
+
+    def days(self, commodity: Commodity, resolution: Resolution, currency: str = 'EUR') -> list[date]:
+        """Stored days in order."""
+        suffix = f'|{resolution}|{currency}'
+        prefix = f'{commodity}|'
+        return sorted(
+            date.fromisoformat(key.split('|')[1])
+            for key in self._days
+            if key.startswith(prefix) and key.endswith(suffix)
+        )
+
+    def set_day(self, commodity: Commodity, day: date, resolution: Resolution, rates: dict[datetime, Decimal], currency: str = 'EUR') -> bool:
+        """Store the day if `rates` contain all its periods, return whether it was stored."""
+        start = self.start_of_day(day)
+        step = RESOLUTION_STEPS[resolution]
+        prices: list[str] = []
+        for i in range(self.periods_in_day(day, resolution)):
+            price = rates.get(start + step * i)
+            if price is None:
+                # Not published yet (or incomplete), don't cache it
+                return False
+            prices.append(str(price))
+
+        key = self.key(commodity, day, resolution, currency)
+        if self._days.get(key) != prices:
+            self._days[key] = prices
+            self._schedule_save()
+        return True
+
+    def get_currency_rates(self, day: date) -> dict[str, Decimal] | None:
+        rates = self._currency_rates.get(day.isoformat())
+        if rates is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return {currency: Decimal(rate) for currency, rate in rates.items()}
+
+    def set_currency_rates(self, day: date, rates: dict[str, Decimal]) -> None:
+        self._currency_rates[day.isoformat()] = {currency: str(rate) for currency, rate in rates.items()}
+        self._schedule_save()
+
+    async def async_save(self) -> None:
+        """Write the cache now instead of after the save delay."""
+        if self._store is not None:
+            await self._store.async_save(self._data_to_save())
+
+    def _schedule_save(self) -> None:
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> CacheData:
+        if self._retention_days is not None:
+            oldest = (datetime.now(self._timezone).date() - timedelta(days=self._retention_days)).isoformat()
+            self._days = {key: prices for key, prices in self._days.items() if key.split('|')[1] >= oldest}
+            self._currency_rates = {day: rates for day, rates in self._currency_rates.items() if day >= oldest}
+
+        return {
+            'days': self._days,
+            'currency_rates': self._currency_rates,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            'days': len(self._days),
+            'currency_days': len(self._currency_rates),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
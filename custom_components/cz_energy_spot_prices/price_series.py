@@ -0,0 +1,113 @@
+"""Ordered price series with prefix sums for consecutive interval windows."""
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import final
+
+
+@final
+class PriceSeries:
+    """Prices ordered by time with O(1) sums of consecutive intervals.
+
+    A window of `length` intervals ends at (and includes) the interval at `index`.
+    Its sum is defined only when the interval `length - 1` steps before exists in
+    the series, intervals missing in between are skipped, the same way the
+    previous per-hour lookups did.
+    """
+
+    def __init__(self, prices: dict[datetime, Decimal], step: timedelta) -> None:
+        self.step = step
+        self.dts = sorted(prices)
+        self.prices = [prices[dt] for dt in self.dts]
+        self._index_by_dt = {dt: i for i, dt in enumerate(self.dts)}
+
+        # Sorted unique times without gaps, windows are then plain index ranges
+        self._contiguous = len(self.dts) < 2 or self.dts[-1] - self.dts[0] == step * (len(self.dts) - 1)
+
+        self._prefix_sums = [Decimal(0)]
+        total = Decimal(0)
+        for price in self.prices:
+            total += price
+            self._prefix_sums.append(total)
+
+    def __len__(self) -> int:
+        return len(self.dts)
+
+    def index_of(self, dt: datetime) -> int | None:
+        return self._index_by_dt.get(dt)
+
+    def window_sum(self, index: int, length: int) -> Decimal | None:
+        start = self._index_by_dt.get(self.dts[index] - self.step * (length - 1))
+        if start is None:
+            # Out of range, probably before yesterday
+            return None
+        return self._prefix_sums[index + 1] - self._prefix_sums[start]
+
+    def window_sums(self, length: int, indices: range | None = None) -> list[Decimal | None]:
+        """Sums of windows of `length` intervals ending at each interval of the series.
+
+        With `indices` only windows ending at them are summed and the other sums are None.
+        """
+        prefix_sums = self._prefix_sums
+        if indices is None:
+            indices = range(len(self.dts))
+
+        sums: list[Decimal | None] = [None] * len(self.dts)
+        if self._contiguous:
+            first = max(indices.start, length - 1)
+            if first < indices.stop:
+                sums[first:indices.stop] = [
+                    end - start for start, end in zip(prefix_sums[first + 1 - length:indices.stop + 1 - length], prefix_sums[first + 1:indices.stop + 1])
+                ]
+            return sums
+
+        span = self.step * (length - 1)
+        dts = self.dts
+        index_by_dt = self._index_by_dt
+
+        for index in indices:
+            start = index_by_dt.get(dts[index] - span)
+            if start is not None:
+                sums[index] = prefix_sums[index + 1] - prefix_sums[start]
+        return sums
+
+    @staticmethod
+    def rank(indices: Sequence[int], sums: Sequence[Decimal | None]) -> dict[int, int]:
+        """Order (starting with 1 for the cheapest) of windows ending at `indices`.
+
+        Missing sums count as zero and ties keep the order of `indices`.
+        """
+        try:
+            ordered = sorted(indices, key=sums.__getitem__)
+        except TypeError:
+            zero = Decimal(0)
+            ordered = sorted(indices, key=lambda index: sums[index] if sums[index] is not None else zero)
+        return {index: order for order, index in enumerate(ordered, 1)}
+
+    @staticmethod
+    def cheapest(indices: Sequence[int], sums: Sequence[Decimal | None]) -> int | None:
+        """Index of the cheapest window ending at one of `indices`, the one ranked 1 by `rank`.
+
+        Every window sum is O(1) thanks to prefix sums, so a single linear pass is enough.
+        """
+        try:
+            # The first of equal sums, as with a strict comparison
+            return min(indices, key=sums.__getitem__)
+        except ValueError:
+            return None
+        except TypeError:
+            # Some sums are missing
+            pass
+
+        zero = Decimal(0)
+        cheapest_index: int | None = None
+        cheapest_sum = zero
+        for index in indices:
+            window_sum = sums[index]
+            if window_sum is None:
+                window_sum = zero
+            if cheapest_index is None or window_sum < cheapest_sum:
+                cheapest_index = index
+                cheapest_sum = window_sum
+        return cheapest_index
@@ -0,0 +1,160 @@
+import logging
+import re
+import time
+from ast import literal_eval
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, cast, final
+
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers.template import Template
+
+from .timing import StageTimings, stage
+
+logger = logging.getLogger(__name__)
+
+# Separates results of single values in one batched render, templates don't produce it
+SEPARATOR = '\x1e'
+
+# Consecutive failed batched renders before batching is given up
+BATCH_FAILURE_LIMIT = 3
+
+BATCH_TEMPLATE = (
+    '{%% for value in values %%}{%% set %(key)s = %(key)ss[loop.index0] %%}'
+    '%(code)s'
+    '{%% if not loop.last %%}' + SEPARATOR + '{%% endif %%}{%% endfor %%}'
+)
+
+
+class BatchMismatch(ValueError):
+    """Batched render produced a different number of results than values."""
+
+
+@final
+class RateTemplate:
+    """Price adjustment template rendered for a whole series at once.
+
+    Templates using `values` get lists of all `values` and `hours` (or `days`) and return a list of prices.
+    Templates for a single `value` and `hour` (or `day`) are wrapped in a loop and rendered in one pass,
+    with rendering value by value as a fallback. Whether a template returns all prices is decided by
+    its result, not by `values` appearing in it.
+    """
+
+    def __init__(self, template: Template, key: str = 'hour') -> None:
+        self.template = template
+        self.key = key
+        # Jinja renders, a call of `render` takes one or more of them
+        self.renders = 0
+        # Calls of `render` with their total and last duration in seconds
+        self.calls = 0
+        self.render_seconds = 0.0
+        self.last_render_seconds: float | None = None
+        # Stage timings of rendering, when enabled
+        self.timings: StageTimings | None = None
+
+        code = template.template
+        # Only templates mentioning `values` can return all prices, None until the first result tells
+        self._explicit: bool | None = None if re.search(r'\bvalues\b', code) else False
+
+        self._batch: Template | None = None
+        self._batch_failures = 0
+        try:
+            self._batch = Template(BATCH_TEMPLATE % {'key': key, 'code': code}, template.hass)
+            self._batch.ensure_valid()
+        except TemplateError as e:
+            logger.debug('Template can not be batched, rendering value by value: %s', e)
+            self._batch = None
+
+    def render(self, values: list[Decimal], keys: list[datetime]) -> list[Decimal]:
+        started = time.monotonic()
+        try:
+            with stage(self.timings, 'render'):
+                return self._render(values, keys)
+        finally:
+            self.calls += 1
+            self.last_render_seconds = time.monotonic() - started
+            self.render_seconds += self.last_render_seconds
+
+    def _render(self, values: list[Decimal], keys: list[datetime]) -> list[Decimal]:
+        if not values:
+            return []
+
+        if self._explicit is not False:
+            rendered = self._render_explicit(values, keys)
+            if rendered is not None:
+                self._explicit = True
+                return rendered
+
+        if self._batch is not None:
+            try:
+                rendered = self._render_batch(values, keys)
+                self._batch_failures = 0
+                return rendered
+            except BatchMismatch as e:
+                # The template breaks the loop it is wrapped in, it would fail the same way every time
+                logger.debug('Batched template render failed, rendering value by value from now on: %s', e)
+                self._batch = None
+            except (TemplateError, ValueError, SyntaxError, TypeError) as e:
+                # Might depend on the values, give up batching only when it keeps failing
+                self._batch_failures += 1
+                logger.debug('Batched template render failed %d times, rendering value by value: %s', self._batch_failures, e)
+                if self._batch_failures >= BATCH_FAILURE_LIMIT:
+                    self._batch = None
+
+        return self._render_single(values, keys)
+
+    def _variables(self, values: list[Decimal], keys: list[datetime]) -> dict[str, Any]:
+        return {
+            'values': [float(value) for value in values],
+            f'{self.key}s': keys,
+        }
+
+    def _render_explicit(self, values: list[Decimal], keys: list[datetime]) -> list[Decimal] | None:
+        """All prices at once, None when the template does not return them."""
+        self.renders += 1
+        try:
+            result = self.template.async_render(self._variables(values, keys))
+        except TemplateError as e:
+            if self._explicit is None:
+                # A template for a single `value`, which only mentions `values`
+                logger.debug('Template does not render with `values`, rendering it for single values: %s', e)
+                self._explicit = False
+            return None
+
+        if not isinstance(result, (list, tuple)):
+            if self._explicit is None:
+                self._explicit = False
+            return None
+        if len(cast(list[Any], result)) != len(values):
+            logger.warning('Template using `values` returned %d prices instead of %d', len(cast(list[Any], result)), len(values))
+            return None
+        return [Decimal(cast(float, value)) for value in cast(list[Any], result)]
+
+    def _render_batch(self, values: list[Decimal], keys: list[datetime]) -> list[Decimal]:
+        assert self._batch is not None
+        self.renders += 1
+        result = cast(str, self._batch.async_render(self._variables(values, keys), parse_result=False))
+        chunks = result.split(SEPARATOR)
+        if len(chunks) != len(values):
+            raise BatchMismatch(f'Expected {len(values)} results, got {len(chunks)}')
+        # Same conversion as a single render with parsed result
+        return [Decimal(cast(float, literal_eval(chunk.strip()))) for chunk in chunks]
+
+    def _render_single(self, values: list[Decimal], keys: list[datetime]) -> list[Decimal]:
+        rendered: list[Decimal] = []
+        for value, key in zip(values, keys):
+            self.renders += 1
+            rendered.append(
+                Decimal(
+                    cast(
+                        float,
+                        self.template.async_render(
+                            {
+                                'value': float(value),
+                                self.key: key,
+                            }
+                        ),
+                    )
+                )
+            )
+        return rendered
@@ -5,14 +5,15 @@ from decimal import Decimal
 from typing import Any, Callable, cast, override
 from zoneinfo import ZoneInfo
 
-from homeassistant.const import CONF_CURRENCY, CONF_UNIT_OF_MEASUREMENT
+from homeassistant.const import CONF_CURRENCY, CONF_UNIT_OF_MEASUREMENT, MATCH_ALL, EntityCategory, UnitOfTime
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import SpotRateConfigEntry
 from .binary_sensor import ElectricityBinarySpotRateSensorBase, GasBinarySpotRateSensorBase
-from .coordinator import SpotRateCoordinator, SpotRateData, SpotRateHour, CONSECUTIVE_HOURS
+from .coordinator import HourlySpotRateData, SpotRateCoordinator, SpotRateData, SpotRateHour, CONSECUTIVE_HOURS
 from .spot_rate_mixin import ElectricitySpotRateSensorMixin, GasSpotRateSensorMixin, Trade
 from .spot_rate_settings import SpotRateSettings
 
@@ -57,6 +58,9 @@ async def async_setup_entry(
     # Deprecated sensors
     sensors += __get_deprecated_sensors(hass, settings, coordinator)
 
+    if coordinator.timings is not None:
+        sensors.append(RefreshTimingsSensor(coordinator, entry.entry_id))
+
     async_add_entities(sensors)
 
 def __get_electricity_sensors(hass: HomeAssistant, settings: SpotRateSettings, coordinator: SpotRateCoordinator, trade: Trade):
@@ -179,7 +183,11 @@ def __get_deprecated_sensors(hass: HomeAssistant, settings: SpotRateSettings, co
         deprecated_has_tomorrow_gas_data,
     ]
 
-    for i in CONSECUTIVE_HOURS:
+    # Deprecated sensors are kept only for the original block lengths
+    for i in coordinator.consecutive_hours:
+        if i not in CONSECUTIVE_HOURS:
+            continue
+
         sensors.append(
             ConsecutiveCheapestElectricitySensor(
                 hours=i,
@@ -208,8 +216,13 @@ class ElectricityPriceSensor(ElectricitySpotRateSensorBase):
 
 
 class SpotRateElectricitySensor(ElectricityPriceSensor):
+    # Prices of whole days are in the state, but not in history, see the get_electricity_prices service
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
     def __init__(self, hass: HomeAssistant, settings: SpotRateSettings, coordinator: SpotRateCoordinator, trade: Trade, deprecated: bool = False) -> None:
         self._deprecated: bool = deprecated
+        # Data the attributes were built from
+        self._attr_rates: HourlySpotRateData | None = None
 
         if self._deprecated:
             self._attr_unique_id = f'sensor.current_spot_electricity_{trade.lower()}_price'
@@ -238,6 +251,7 @@ class SpotRateElectricitySensor(ElectricityPriceSensor):
             self._attr_available = False
             self._value = None
             self._attr = {}
+            self._attr_rates = None
             return
 
         hourly_rates = None
@@ -248,7 +262,7 @@ class SpotRateElectricitySensor(ElectricityPriceSensor):
             logger.error(
                 'Current time "%s" is not found in SpotRate values:\n%s',
                 rate_data.get_now(),
-                "\n\t".join([dt.isoformat() for dt in hourly_rates.hours_by_dt.keys()])
+                "\n\t".join([dt.isoformat() for dt in hourly_rates.dts])
                 if hourly_rates
                 else "",
             )
@@ -260,17 +274,21 @@ class SpotRateElectricitySensor(ElectricityPriceSensor):
             self._attr_available = True
             return
 
-        for hour_data in hourly_rates.today_day.hours_by_dt.values():
-            dt_local = hour_data.dt_local.isoformat()
-            attributes[dt_local] = float(hour_data.price)
+        self._attr_available = True
+        # Prices of today and tomorrow change only with new data
+        if hourly_rates is self._attr_rates:
+            return
 
-        if hourly_rates.tomorrow_day:
-            for hour_data in hourly_rates.tomorrow_day.hours_by_dt.values():
-                dt_local = hour_data.dt_local.isoformat()
-                attributes[dt_local] = float(hour_data.price)
+        # Straight from the columns, without creating views of the intervals
+        dts, price_values, zoneinfo = hourly_rates.dts, hourly_rates.price_values, hourly_rates.zoneinfo
+        for day in (hourly_rates.today_day, hourly_rates.tomorrow_day):
+            if day is None:
+                continue
+            for i in day.indices:
+                attributes[dts[i].astimezone(zoneinfo).isoformat()] = price_values[i]
 
         self._attr = attributes
-        self._attr_available = True
+        self._attr_rates = hourly_rates
 
 
 class HourFindSensor(ElectricityPriceSensor):
@@ -383,6 +401,8 @@ class MostExpensiveTomorrowElectricitySensor(HourFindSensor):
 
 class EnergyHourOrder(ElectricitySpotRateSensorBase):
     _attr_icon = 'mdi:hours-24'
+    # Orders of whole days are in the state, but not in history, see the get_electricity_prices service
+    _unrecorded_attributes = frozenset({MATCH_ALL})
 
 
 class CurrentElectricityHourOrder(EnergyHourOrder):
@@ -404,15 +424,15 @@ class CurrentElectricityHourOrder(EnergyHourOrder):
             return
 
         hourly_rates = self._get_trade_rates(rate_data)
-        cheapest_order = hourly_rates.current_hour.cheapest_consecutive_order[1]
+        cheapest_order = hourly_rates.current_hour.order
         if cheapest_order != self._value:
             logger.debug('%s updated from %s to %s', self.unique_id, self._value, cheapest_order)
             self._value = cheapest_order
         else:
             logger.debug('%s unchanged with %d', self.unique_id, cheapest_order)
 
-        for hour in hourly_rates.today.hours_by_dt.values():
-            self._attr[hour.dt_local.isoformat()] = [hour.cheapest_consecutive_order[1], float(round(hour.price, 3))]
+        for hour in hourly_rates.today.hours:
+            self._attr[hour.dt_local.isoformat()] = [hour.order, float(round(hour.price, 3))]
 
         self._attr_available = True
 
@@ -440,8 +460,8 @@ class TomorrowElectricityHourOrder(EnergyHourOrder):
             self._attr_available = False
             return
 
-        for hour in hourly_rates.tomorrow.hours_by_dt.values():
-            self._attr[hour.dt_local.isoformat()] = [hour.cheapest_consecutive_order[1], float(round(hour.price, 3))]
+        for hour in hourly_rates.tomorrow.hours:
+            self._attr[hour.dt_local.isoformat()] = [hour.order, float(round(hour.price, 3))]
 
         self._attr_available = True
 
@@ -487,7 +507,7 @@ class ConsecutiveCheapestElectricitySensor(ElectricityBinarySpotRateSensorBase):
             if max_price is None or hour.price > max_price:
                 max_price = hour.price
 
-            dt += timedelta(hours=1)
+            dt += hourly_rates.step
         return {
             'Start': start,
             'Start hour': start.hour,
@@ -509,24 +529,26 @@ class ConsecutiveCheapestElectricitySensor(ElectricityBinarySpotRateSensorBase):
 
         is_on = False
         hourly_rates = self._get_trade_rates(rate_data)
-        for hour in hourly_rates.hours_by_dt.values():
-            start = hour.dt_local - timedelta(hours=self.hours - 1)
-            end = hour.dt_local + timedelta(hours=1, seconds=-1)
+        # Only the cheapest blocks of today and tomorrow are marked with 1
+        for hour in hourly_rates.cheapest_blocks(self.hours):
+            # Block of `hours` ending with this interval
+            start = hour.dt_local - timedelta(hours=self.hours) + hourly_rates.step
+            end = hour.dt_local + hourly_rates.step - timedelta(seconds=1)
 
             # Ignore start times before now, we only want future blocks
             if end < hourly_rates.now:
                 continue
 
-            if hour.cheapest_consecutive_order[self.hours] == 1:
-                if not self._attr:
-                    # Only put it there once, so to contains closes interval in the future
-                    self._attr = self._compute_attr(rate_data, start, end)
+            if not self._attr:
+                # Only put it there once, so to contains closes interval in the future
+                self._attr = self._compute_attr(rate_data, start, end)
 
-                if start <= hourly_rates.now <= end:
-                    is_on = True
+            if start <= hourly_rates.now <= end:
+                is_on = True
 
-            self._attr_is_on = is_on
-            self._attr_available = True
+        # Set once after the loop, also when no block is left today and tomorrow
+        self._attr_is_on = is_on
+        self._attr_available = True
 
 
 #BC
@@ -654,3 +676,34 @@ class HasTomorrowGasData(GasBinarySpotRateSensorBase):
 
         self._attr_is_on = self._get_trade_rates(rate_data).tomorrow is not None
         self._attr_available = True
+
+
+class RefreshTimingsSensor(CoordinatorEntity[SpotRateCoordinator], SensorEntity):
+    """Duration of the last refresh, with rolling timings of each stage in attributes."""
+
+    _attr_has_entity_name: bool = True
+    _attr_entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement: str | None = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision: int | None = 1
+    _attr_icon: str | None = 'mdi:timer-outline'
+    # Percentiles of the last refreshes are not worth keeping in history
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    def __init__(self, coordinator: SpotRateCoordinator, entry_id: str) -> None:
+        super().__init__(coordinator)
+        # Each config entry has its own timings, the entity ID is generated from the name
+        self._attr_unique_id = f'{entry_id}_refresh_timings'
+        self._attr_translation_key = 'refresh_timings'
+
+    @property
+    @override
+    def native_value(self):  # pyright: ignore[reportIncompatibleVariableOverride]
+        timings = self.coordinator.timings
+        seconds = timings.last.get('fetch') if timings is not None else None
+        return round(seconds * 1000, 3) if seconds is not None else None
+
+    @property
+    @override
+    def extra_state_attributes(self):  # pyright: ignore[reportIncompatibleVariableOverride]
+        timings = self.coordinator.timings
+        return timings.summary() if timings is not None else None
@@ -0,0 +1,125 @@
+import logging
+from datetime import date, datetime
+from typing import Any, cast
+from zoneinfo import ZoneInfo
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .backfill import async_backfill
+from .const import DOMAIN, SERVICE_BACKFILL, SERVICE_GET_ELECTRICITY_PRICES
+from .coordinator import HourlySpotRateData, SpotRateCoordinator, SpotRateDay
+from .spot_rate_mixin import Trade
+
+logger = logging.getLogger(__name__)
+
+ATTR_CONFIG_ENTRY = 'config_entry'
+ATTR_TRADE = 'trade'
+ATTR_COMMODITY = 'commodity'
+ATTR_START = 'start'
+ATTR_END = 'end'
+
+GET_ELECTRICITY_PRICES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY): cv.string,
+        vol.Optional(ATTR_TRADE, default=Trade.SPOT.value): vol.In([trade.value for trade in Trade]),
+    }
+)
+
+BACKFILL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_COMMODITY): vol.All(cv.ensure_list, [vol.In(['electricity', 'gas'])]),
+        vol.Required(ATTR_START): cv.date,
+        vol.Optional(ATTR_END): cv.date,
+    }
+)
+
+
+def _day_prices(day: SpotRateDay | None) -> list[dict[str, Any]] | None:
+    if day is None:
+        return None
+    return [
+        {
+            'start': hour.dt_local.isoformat(),
+            'price': float(hour.price),
+            'order': hour.order,
+        }
+        for hour in day.hours
+    ]
+
+
+def _get_coordinator(hass: HomeAssistant, entry_id: str | None) -> SpotRateCoordinator:
+    entries = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED and (entry_id is None or entry.entry_id == entry_id)
+    ]
+    if not entries:
+        raise ServiceValidationError(f'No loaded {DOMAIN} config entry {entry_id or ""}'.strip())
+    return cast(SpotRateCoordinator, entries[0].runtime_data)
+
+
+async def async_get_electricity_prices(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Whole day prices and orders, the same as in attributes of the price and order sensors."""
+    coordinator = _get_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY))
+    if coordinator.data is None:
+        raise ServiceValidationError('Electricity prices are not available yet')
+
+    trade = Trade(call.data[ATTR_TRADE])
+    electricity = coordinator.data.electricity
+    rates: HourlySpotRateData
+    match trade:
+        case Trade.SPOT:
+            rates = electricity.spot_rates
+        case Trade.BUY:
+            rates = electricity.buy_rates
+        case Trade.SELL:
+            rates = electricity.sell_rates
+
+    return {
+        'trade': trade.value,
+        'today': _day_prices(rates.today),
+        'tomorrow': _day_prices(rates.tomorrow),
+    }
+
+
+async def async_run_backfill(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Download history of prices, days already downloaded are skipped."""
+    start = cast(date, call.data[ATTR_START])
+    end = cast(date | None, call.data.get(ATTR_END)) or datetime.now(ZoneInfo(hass.config.time_zone)).date()
+    if end < start:
+        raise ServiceValidationError(f'Backfill end {end} is before its start {start}')
+
+    commodities = cast(list[str] | None, call.data.get(ATTR_COMMODITY)) or ['electricity', 'gas']
+    results = [await async_backfill(hass, 'gas' if commodity == 'gas' else 'electricity', start, end) for commodity in commodities]
+    return {'results': cast(list[Any], results)}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    if hass.services.has_service(DOMAIN, SERVICE_GET_ELECTRICITY_PRICES):
+        return
+
+    async def handle_get_electricity_prices(call: ServiceCall) -> ServiceResponse:
+        return await async_get_electricity_prices(hass, call)
+
+    async def handle_backfill(call: ServiceCall) -> ServiceResponse:
+        return await async_run_backfill(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_ELECTRICITY_PRICES,
+        handle_get_electricity_prices,
+        schema=GET_ELECTRICITY_PRICES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL,
+        handle_backfill,
+        schema=BACKFILL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
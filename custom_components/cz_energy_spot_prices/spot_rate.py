@@ -2,15 +2,20 @@ import sys
 import logging
 from datetime import date, datetime, timedelta, time
 from zoneinfo import ZoneInfo
-from typing import Literal
+from typing import Awaitable, Iterator, Literal, cast
 from decimal import Decimal
 import asyncio
+import hashlib
+import time as time_module
 import xml.etree.ElementTree as ET
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 import aiohttp
 
 from .cnb_rate import CnbRate
+from .http_session import get_session, close_session
+from .price_cache import Commodity, ElectricityResolution, PriceCache, Resolution
+from .timing import StageTimings, stage
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +77,33 @@ QUERY_GAS = """<?xml version="1.0" encoding="UTF-8" ?>
 # </SOAP-ENV:Envelope>
 
 
+OTE_NAMESPACE = '{http://www.ote-cr.cz/schema/service/public}'
+OTE_ITEM = f'{OTE_NAMESPACE}Item'
+OTE_DATE = f'{OTE_NAMESPACE}Date'
+OTE_HOUR = f'{OTE_NAMESPACE}Hour'
+OTE_PERIOD_INDEX = f'{OTE_NAMESPACE}PeriodIndex'
+OTE_PRICE = f'{OTE_NAMESPACE}Price'
+OTE_HOURLY_PRICE = f'{OTE_NAMESPACE}HourlyPrice'
+SOAP_FAULT = '{http://schemas.xmlsoap.org/soap/envelope/}Fault'
+
+# Offsets of OTE periods (PeriodIndex - 1) from the start of the day, there are up to 100 periods on DST change
+PERIOD_OFFSETS = [timedelta(minutes=15 * i) for i in range(100)]
+
+# Size of the chunks fed to the streaming XML parser
+PARSE_CHUNK_SIZE = 16 * 1024
+
+RateKind = Literal["electricity_legacy", "electricity_60min", "electricity_15min", "gas"]
+RateTuple = tuple[datetime, Decimal, Decimal]
+# Commodity, first day, last day and the UTC hour the rates were requested in
+SharedRatesKey = tuple[Commodity, date, date, datetime]
+
+# Resolutions parsed from a single OTE response
+COMMODITY_RESOLUTIONS: dict[Commodity, tuple[Resolution, ...]] = {
+    "electricity": ("PT15M", "PT60M"),
+    "gas": ("P1D",),
+}
+
+
 class OTEFault(Exception):
     pass
 
@@ -87,9 +119,46 @@ class SpotRate:
     RateByDatetime = dict[datetime, Decimal]
     EnergyUnit = Literal['kWh', 'MWh']
 
-    def __init__(self):
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | None = None,
+        cache: PriceCache | None = None,
+        cnb_rate: CnbRate | None = None,
+        ote_url: str | None = None,
+    ):
+        if ote_url is not None:
+            # Stand-in server in tests and benchmarks
+            self.OTE_PUBLIC_URL = ote_url
         self.timezone = ZoneInfo('Europe/Prague')
         self.utc = ZoneInfo('UTC')
+        # Home Assistant passes its shared session, standalone use falls back to the pooled module session
+        self._session = session
+        # Complete days are served from the cache instead of OTE
+        self._cache = cache
+        # Shared by electricity and gas (and by all config entries in Home Assistant)
+        self._cnb_rate = cnb_rate or CnbRate(session, cache)
+        # Rates in EUR/MWh of the current hour, config entries differ only in the conversion of them
+        self._shared_rates: dict[SharedRatesKey, dict[Resolution, SpotRate.RateByDatetime]] = {}
+        # Requests in progress, concurrent callers for the same rates wait for the same request
+        self._pending_rates: dict[SharedRatesKey, asyncio.Future[dict[Resolution, SpotRate.RateByDatetime]]] = {}
+        # Digest and parsed rates of the last response of each commodity, identical responses are not parsed again
+        self._payloads: dict[Commodity, tuple[str, dict[Resolution, SpotRate.RateByDatetime]]] = {}
+        self.payload_hits = 0
+        self.payload_misses = 0
+        # Digest of what the last rates of each commodity were made of, the same digest means the same rates
+        self.digests: dict[Commodity, str] = {}
+        # Size in characters and parse time in seconds of the last response of each commodity
+        self.last_payload_sizes: dict[Commodity, int] = {}
+        self.last_parse_seconds: dict[Commodity, float] = {}
+        # Stage timings of downloads and parsing, when enabled
+        self.timings: StageTimings | None = None
+
+    @property
+    def cnb_rate(self) -> CnbRate:
+        return self._cnb_rate
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        return self._session or get_session()
 
     def get_electricity_query(
         self,
@@ -104,20 +173,16 @@ class SpotRate:
         return QUERY_GAS.format(start=start.isoformat(), end=end.isoformat())
 
     async def _download(self, query: str) -> str:
+        started = time_module.monotonic()
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.OTE_PUBLIC_URL, data=query) as response:
-                    return await response.text()
+            with stage(self.timings, 'ote'):
+                async with self._get_session().post(self.OTE_PUBLIC_URL, data=query) as response:
+                    text = await response.text()
         except aiohttp.ClientError as e:
             raise OTEFault(f'Unable to download rates: {e}')
 
-    def _fromstring(self, text: str):
-        try:
-            return ET.fromstring(text)
-        except Exception as e:
-            if 'Application is not available' in text:
-                raise UpdateFailed('OTE Portal is currently not available!') from e
-            raise UpdateFailed('Failed to parse query response.') from e
+        logger.debug('OTE request took %.3f s (%d bytes)', time_module.monotonic() - started, len(text))
+        return text
 
     async def noop(self) -> None:
         pass
@@ -127,180 +192,347 @@ class SpotRate:
         start: datetime,
         in_eur: bool,
         unit: EnergyUnit,
+        resolution: ElectricityResolution = "PT60M",
     ) -> RateByDatetime:
         assert start.tzinfo, 'Timezone must be set'
         start_tz = start.astimezone(self.timezone)
         first_day = start_tz.date()
 
         # From yesterday (as we need it for longest consecutive) till tomorrow (we won't have more data anyway)
-        query_start = first_day - timedelta(days=1)
-        query_end = first_day + timedelta(days=1)
-
-        rates_task = self._get_rates(
-            self.get_electricity_query(
-                query_start,
-                query_end,
-            ),
-            unit,
-            kind="electricity_60min",
+        rates_task = self._get_shared_day_rates(
+            "electricity",
+            first_day - timedelta(days=1),
+            first_day + timedelta(days=1),
+            resolution,
         )
 
-        if not in_eur:
-            currency_task = CnbRate().get_current_rates()
-            # Fetch both the prices and the currency rates concurrently
-            rates, currency = await asyncio.gather(rates_task, currency_task)
-            eur_rate = currency["EUR"]
-            # Convert the rates from EUR to CZK
-            converted: SpotRate.RateByDatetime = {}
-            for dt, value in rates.items():
-                converted[dt] = value * eur_rate
-            return converted
-
-        else:
-            # Just fetch the prices
-            rates = await rates_task
-            return rates
+        return await self._convert(rates_task, in_eur, unit)
 
     async def get_gas_rates(self, start: datetime, in_eur: bool, unit: EnergyUnit) -> RateByDatetime:
         assert start.tzinfo, 'Timezone must be set'
         start_tz = start.astimezone(self.timezone)
         first_day = start_tz.date()
+
         # yesteday, today and tomorrow (yesterday as we might not have today data for some time)
-        query = self.get_gas_query(first_day - timedelta(days=1), first_day + timedelta(days=1))
+        rates_task = self._get_shared_day_rates(
+            "gas",
+            first_day - timedelta(days=1),
+            first_day + timedelta(days=1),
+            "P1D",
+        )
+
+        return await self._convert(rates_task, in_eur, unit)
 
-        rates_task = self._get_rates(query, unit, kind="gas")
+    async def _convert(self, rates_task: Awaitable[RateByDatetime], in_eur: bool, unit: EnergyUnit) -> RateByDatetime:
+        """Convert rates in EUR/MWh to the requested currency and unit."""
+        eur_rate: Decimal | None = None
         if not in_eur:
-            cnb_rate = CnbRate()
+            # Fetch both the prices and the currency rates concurrently
             rates, currency_rates = await asyncio.gather(
                 rates_task,
-                cnb_rate.get_current_rates(),
+                self._cnb_rate.get_current_rates(),
             )
             eur_rate = currency_rates['EUR']
-            converted: SpotRate.RateByDatetime = {}
-            for dt, value in rates.items():
-                converted[dt] = value * eur_rate
-            return converted
         else:
             rates = await rates_task
 
+        return self.convert_rates(rates, eur_rate, unit)
+
+    @staticmethod
+    def convert_rates(rates: RateByDatetime, eur_rate: Decimal | None, unit: EnergyUnit) -> RateByDatetime:
+        """Convert rates in EUR/MWh to `unit`, and to CZK with `eur_rate` unless it is None."""
+        if unit == 'kWh':
+            # API returns price for MWh, we need to covert to kWh
+            divider = Decimal(1000)
+        elif unit == 'MWh':
+            divider = None
+        else:
+            raise ValueError(f"Invalid unit {unit}")  # pyright: ignore[reportUnreachable]
+
+        converted: SpotRate.RateByDatetime = {}
+        for dt, value in rates.items():
+            if divider is not None:
+                value /= divider
+            if eur_rate is not None:
+                # Convert the rates from EUR to CZK
+                value *= eur_rate
+            converted[dt] = value
+        return converted
+
+    async def _get_shared_day_rates(
+        self,
+        commodity: Commodity,
+        first_day: date,
+        last_day: date,
+        resolution: Resolution,
+    ) -> RateByDatetime:
+        """Get rates in EUR/MWh once an hour, no matter how many config entries ask for them.
+
+        The returned rates are shared and must not be modified.
+        """
+        now = datetime.now(self.utc)
+        key: SharedRatesKey = (commodity, first_day, last_day, now.replace(minute=0, second=0, microsecond=0))
+
+        rates = self._shared_rates.get(key)
+        if rates is not None:
+            logger.debug('Using shared %s rates for %s - %s', commodity, first_day, last_day)
+            return rates[resolution]
+
+        pending = self._pending_rates.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load_shared_day_rates(key))
+            self._pending_rates[key] = pending
+            pending.add_done_callback(lambda _: self._pending_rates.pop(key, None))
+
+        # Don't cancel the shared request when one of the callers is cancelled
+        return (await asyncio.shield(pending))[resolution]
+
+    async def _load_shared_day_rates(self, key: SharedRatesKey) -> dict[Resolution, RateByDatetime]:
+        commodity, first_day, last_day, hour = key
+        rates = await self._get_day_rates(commodity, first_day, last_day)
+
+        # Rates of previous hours are not needed anymore, new data might have been published since then
+        self._shared_rates = {k: v for k, v in self._shared_rates.items() if k[3] == hour}
+        self._shared_rates[key] = rates
         return rates
 
+    async def _get_day_rates(
+        self,
+        commodity: Commodity,
+        first_day: date,
+        last_day: date,
+    ) -> dict[Resolution, RateByDatetime]:
+        """Get rates in EUR/MWh for whole days in every resolution, complete days are served from the cache."""
+        days = [first_day + timedelta(days=i) for i in range((last_day - first_day).days + 1)]
+        resolutions = COMMODITY_RESOLUTIONS[commodity]
+
+        rates_by_day: dict[date, dict[Resolution, SpotRate.RateByDatetime]] = {}
+        if self._cache is not None:
+            for day in days:
+                day_rates = {resolution: self._cache.get_day(commodity, day, resolution) for resolution in resolutions}
+                if all(rates is not None for rates in day_rates.values()):
+                    rates_by_day[day] = cast(dict[Resolution, SpotRate.RateByDatetime], day_rates)
+
+        missing = [day for day in days if day not in rates_by_day]
+        if not missing:
+            logger.debug('All %s rates for %s - %s served from cache', commodity, first_day, last_day)
+            # Cached days never change
+            digest = 'cache'
+        else:
+            # Days not in the cache are either not published yet or not downloaded yet
+            if commodity == "electricity":
+                query = self.get_electricity_query(missing[0], missing[-1])
+            else:
+                query = self.get_gas_query(missing[0], missing[-1])
+            text = await self._download(query)
+
+            self.last_payload_sizes[commodity] = len(text)
+            digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+            payload = self._payloads.get(commodity)
+            if payload is not None and payload[0] == digest:
+                # OTE usually answers the same until the next day is published
+                self.payload_hits += 1
+                downloaded = payload[1]
+            else:
+                self.payload_misses += 1
+                started = time_module.monotonic()
+                with stage(self.timings, 'parse'):
+                    downloaded = self._parse_day_rates(commodity, text)
+                self.last_parse_seconds[commodity] = time_module.monotonic() - started
+                self._payloads[commodity] = (digest, downloaded)
+            for day in missing:
+                rates_by_day[day] = {
+                    resolution: self._filter_day(downloaded[resolution], day)
+                    for resolution in resolutions
+                }
+                if self._cache is not None:
+                    for day_resolution, day_rates in rates_by_day[day].items():
+                        _ = self._cache.set_day(commodity, day, day_resolution, day_rates)
+
+        self.digests[commodity] = f'{first_day}|{last_day}|{digest}'
+        result: dict[Resolution, SpotRate.RateByDatetime] = {resolution: {} for resolution in resolutions}
+        for day in days:
+            for resolution in resolutions:
+                result[resolution].update(rates_by_day[day][resolution])
+        return result
+
+    def _parse_day_rates(self, commodity: Commodity, text: str) -> dict[Resolution, RateByDatetime]:
+        """Parse OTE response to rates in EUR/MWh for every resolution it contains."""
+        if commodity == "gas":
+            return {"P1D": self._parse_rates(text, "MWh", "gas")}
+
+        # Electricity is always queried with PT15M resolution, each item also contains the hourly price
+        rates_15min: SpotRate.RateByDatetime = {}
+        rates_60min: SpotRate.RateByDatetime = {}
+        for dt, price, hourly_price in self.iter_rates(text, "electricity_60min"):
+            rates_15min[dt] = price
+            rates_60min[dt.replace(minute=0) if dt.minute else dt] = hourly_price
+        return {"PT15M": rates_15min, "PT60M": rates_60min}
+
+    def _filter_day(self, rates: RateByDatetime, day: date) -> RateByDatetime:
+        start = datetime.combine(day, time(0), tzinfo=self.timezone).astimezone(self.utc)
+        end = datetime.combine(day + timedelta(days=1), time(0), tzinfo=self.timezone).astimezone(self.utc)
+        return {dt: price for dt, price in rates.items() if start <= dt < end}
+
     async def _get_rates(
         self,
         query: str,
         unit: Literal["kWh", "MWh"],
-        kind: Literal[
-            "electricity_legacy", "electricity_60min", "electricity_15min", "gas"
-        ] = "electricity_15min",
+        kind: RateKind = "electricity_15min",
     ) -> RateByDatetime:
         text = await self._download(query)
-        root = self._fromstring(text)
-        fault = root.find('.//{http://schemas.xmlsoap.org/soap/envelope/}Fault')
-        if fault:
-            faultstring = fault.find('faultstring')
-            error = 'Unknown error'
-            if faultstring is not None:
-                error = faultstring.text
-            else:
-                error = text
-            raise OTEFault(error)
+        return self._parse_rates(text, unit, kind)
+
+    def _parse_rates(
+        self,
+        text: str,
+        unit: Literal["kWh", "MWh"],
+        kind: RateKind = "electricity_15min",
+    ) -> RateByDatetime:
+        if unit == 'kWh':
+            # API returns price for MWh, we need to covert to kWh
+            divider = Decimal(1000)
+        elif unit == 'MWh':
+            divider = None
+        else:
+            raise ValueError(f"Invalid unit {unit}")  # pyright: ignore[reportUnreachable]
 
         result: SpotRate.RateByDatetime = {}
-        for item in root.findall('.//{http://www.ote-cr.cz/schema/service/public}Item'):
-            date_el = item.find('{http://www.ote-cr.cz/schema/service/public}Date')
-            if date_el is None or date_el.text is None:
+        for dt, price, hourly_price in self.iter_rates(text, kind):
+            if kind == "electricity_60min":
+                # We need to use HourlyPrice for 60min intervals, there are 4 items for each hour
+                if dt.minute:
+                    dt = dt.replace(minute=0)
+                price = hourly_price
+
+            if divider is not None:
+                price /= divider
+
+            result[dt] = price
+
+        return result
+
+    def iter_rates(
+        self,
+        text: str,
+        kind: RateKind = "electricity_15min",
+    ) -> Iterator[RateTuple]:
+        """Parse OTE response and yield `(utc_datetime, price, hourly_price)` tuples in EUR/MWh.
+
+        The response is parsed incrementally, each `Item` is converted as soon as it is closed
+        and cleared afterwards, so the whole document tree is never held in memory.
+        `hourly_price` is zero unless `kind` is "electricity_60min".
+        """
+        # Start of the day in UTC is the same for all items of the same day
+        day_starts: dict[str, datetime] = {}
+
+        for item in self._iter_items(text):
+            date_text = item.get(OTE_DATE)
+            if not date_text:
                 raise InvalidFormat('Item has no "Date" child or is empty')
-            current_date = date.fromisoformat(date_el.text)
+
+            start_of_day = day_starts.get(date_text)
+            if start_of_day is None:
+                current_date = date.fromisoformat(date_text)
+                start_of_day = datetime.combine(current_date, time(0), tzinfo=self.timezone).astimezone(self.utc)
+                day_starts[date_text] = start_of_day
 
             if kind == "electricity_legacy":
                 # Legacy API has "Hour" element - index starting from 1
-                hour_el = item.find('{http://www.ote-cr.cz/schema/service/public}Hour')
-                if hour_el is None or hour_el.text is None:
-                    current_hour = 0
-                    logger.warning('Item has no "Hour" child or is empty: %s', current_date)
+                hour_text = item.get(OTE_HOUR)
+                if not hour_text:
+                    offset = 0
+                    logger.warning('Item has no "Hour" child or is empty: %s', date_text)
                 else:
-                    current_hour = int(hour_el.text) - 1  # Minus 1 because OTE reports nth hour (starting with 1st) - "1" for 0:00 - 1:00
-                current_minute = 0
+                    offset = (int(hour_text) - 1) * 4  # Minus 1 because OTE reports nth hour (starting with 1st) - "1" for 0:00 - 1:00
             elif kind == "electricity_15min" or kind == "electricity_60min":
                 # We can use either PeriodInterval or PeriodIndex to get the interval, but the documentation doesn't specify handling of daylight saving time
                 # so we'll use PeriodIndex as that one should be safer - 92 or 100 intervals per day instead of 96 on usual days
-                period_index_el = item.find(
-                    "{http://www.ote-cr.cz/schema/service/public}PeriodIndex"
-                )
-                if period_index_el is None or not period_index_el.text:
+                period_index_text = item.get(OTE_PERIOD_INDEX)
+                if not period_index_text:
                     logger.warning(
-                        'Item has no "PeriodIndex" child or is empty: %s', current_date
+                        'Item has no "PeriodIndex" child or is empty: %s', date_text
                     )
-                    current_hour = 0
-                    current_minute = 0
+                    offset = 0
                 else:
                     try:
-                        period_index = int(period_index_el.text)
+                        period_index = int(period_index_text)
                     except ValueError as e:
                         raise InvalidFormat(
-                            f"Invalid PeriodIndex {period_index_el.text} for date {current_date}"
+                            f"Invalid PeriodIndex {period_index_text} for date {date_text}"
                         ) from e
 
                     if period_index < 1 or period_index > 100:
                         raise InvalidFormat(
-                            f"Invalid PeriodIndex {period_index} for date {current_date}"
+                            f"Invalid PeriodIndex {period_index} for date {date_text}"
                         )
 
-                    # Each period is 15 minutes, so we can calculate the hour as (period_index - 1) // 4
-                    current_hour = (period_index - 1) // 4
-                    current_minute = ((period_index - 1) % 4) * 15
+                    offset = period_index - 1
             elif kind == "gas":
                 # Gas rates doesn't have hours, skip it
-                current_hour = 0
-                current_minute = 0
+                offset = 0
             else:
                 raise ValueError(f"Invalid kind {kind}")  # pyright: ignore[reportUnreachable]
 
-            price_el = item.find('{http://www.ote-cr.cz/schema/service/public}Price')
-            if price_el is None or price_el.text is None:
+            price_text = item.get(OTE_PRICE)
+            if price_text is None:
                 logger.info(
                     'Item has no "Price" child or is empty: %s %s',
-                    current_date,
-                    current_hour,
+                    date_text,
+                    offset // 4,
                 )
                 continue
-            current_price = Decimal(price_el.text)
+            current_price = Decimal(price_text)
 
             current_hourly_price = Decimal(0)
             if kind == "electricity_60min":
-                hourly_price_el = item.find(
-                    "{http://www.ote-cr.cz/schema/service/public}HourlyPrice"
-                )
-                if hourly_price_el is None or hourly_price_el.text is None:
+                hourly_price_text = item.get(OTE_HOURLY_PRICE)
+                if hourly_price_text is None:
                     logger.info(
                         'Item has no "HourlyPrice" child or is empty: %s %s',
-                        current_date,
-                        current_hour,
+                        date_text,
+                        offset // 4,
                     )
                     continue
-                current_hourly_price = Decimal(hourly_price_el.text)
+                current_hourly_price = Decimal(hourly_price_text)
 
-            if unit == 'kWh':
-                # API returns price for MWh, we need to covert to kWh
-                current_price /= Decimal(1000)
-                current_hourly_price /= Decimal(1000)
-            elif unit != 'MWh':
-                raise ValueError(f"Invalid unit {unit}")  # pyright: ignore[reportUnreachable]
+            # Because of daylight saving time, we need to count the offset from the start of the day in UTC
+            yield start_of_day + PERIOD_OFFSETS[offset], current_price, current_hourly_price
 
-            start_of_day = datetime.combine(current_date, time(0), tzinfo=self.timezone)
+    def _iter_items(self, text: str) -> Iterator[dict[str, str | None]]:
+        """Yield children of each `Item` element of OTE response as a `{tag: text}` dict."""
+        parser = ET.XMLPullParser(events=('end',))
 
-            if kind != "electricity_60min":
-                # Because of daylight saving time, we need to convert time to UTC
-                dt = start_of_day.astimezone(self.utc) + timedelta(
-                    hours=current_hour, minutes=current_minute
-                )
-                result[dt] = current_price
-            else:
-                # We need to use HourlyPrice for 60min intervals, so we need to create 4 entries for each hour
-                dt = start_of_day.astimezone(self.utc) + timedelta(hours=current_hour)
-                result[dt] = current_hourly_price
+        try:
+            for offset in range(0, len(text), PARSE_CHUNK_SIZE):
+                parser.feed(text[offset:offset + PARSE_CHUNK_SIZE])
+                for _event, element in parser.read_events():
+                    if element.tag == OTE_ITEM:
+                        yield {child.tag: child.text for child in element}
+                        # Drop processed children so the tree doesn't grow with the response,
+                        # only the empty Item element stays attached to its parent
+                        element.clear()
+                    elif element.tag == SOAP_FAULT:
+                        self._raise_fault(element, text)
+
+            parser.close()
+        except ET.ParseError as e:
+            if 'Application is not available' in text:
+                raise UpdateFailed('OTE Portal is currently not available!') from e
+            raise UpdateFailed('Failed to parse query response.') from e
 
-        return result
+    def _raise_fault(self, fault: ET.Element, text: str):
+        if not len(fault):
+            # Empty Fault element was never reported as an error
+            return
+
+        faultstring = fault.find('faultstring')
+        error = 'Unknown error'
+        if faultstring is not None:
+            error = faultstring.text
+        else:
+            error = text
+        raise OTEFault(error)
 
 
 if __name__ == '__main__':
@@ -321,10 +553,14 @@ if __name__ == '__main__':
             czk = rates_czk[dt]
             print(f'{dt.isoformat():30s} {eur:10.4f} {czk:10.4f}')
 
+    async def get_electricity_rates():
+        try:
+            return await spot_rate.get_electricity_rates(dt, in_eur=False, unit="kWh")
+        finally:
+            await close_session()
+
     # query = spot_rate.get_electricity_query(dt - timedelta(days=1), dt + timedelta(days=1), in_eur=in_eur)
-    rates_eur = asyncio.run(
-        spot_rate.get_electricity_rates(dt, in_eur=False, unit="kWh")
-    )
+    rates_eur = asyncio.run(get_electricity_rates())
     # rates_czk = asyncio.run(spot_rate.get_electricity_rates(dt, in_eur=False, unit='kWh'))
 
     print('ELECTRICITY')
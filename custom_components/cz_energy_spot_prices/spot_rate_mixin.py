@@ -36,6 +36,8 @@ class SpotRateSensorMixin(CoordinatorEntity[SpotRateCoordinator]):
     _attr_unique_id: str | None
     _attr_translation_key: str | None
     _attr_icon: str | None
+    # State written last, to skip writes of unchanged entities
+    _written: tuple[Any, ...] | None = None
 
     coordinator: SpotRateCoordinator
 
@@ -62,8 +64,24 @@ class SpotRateSensorMixin(CoordinatorEntity[SpotRateCoordinator]):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self.update(self.coordinator.data)
+
+        written = self._state_fingerprint()
+        if written == self._written:
+            logger.debug('%s state unchanged, not written', self.unique_id)
+            return
+
+        self._written = written
         super()._handle_coordinator_update()
 
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Everything the written state consists of, compared item by item."""
+        return (
+            self.available,
+            self._value,
+            getattr(self, '_attr_is_on', None),
+            tuple(self._attr.items()) if self._attr else None,
+        )
+
     def _get_utility_rate_data(
         self, _rate_data: SpotRateData
     ) -> HourlyTradeRateData | DailyTradeRateData:
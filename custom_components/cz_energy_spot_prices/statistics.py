@@ -0,0 +1,198 @@
+"""Electricity prices of finished delivery days as external long-term statistics.
+
+Each price (spot, buy and sell) of each config entry is one statistic with hourly mean, min
+and max, so energy cost dashboards don't need the state history of the price sensors. Entries
+have their own statistics, they differ in currency, unit and templates. Days after the last
+imported hour are read from the price caches, so days missed while Home Assistant was not
+running are imported too, as far back as the caches reach.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import cast, final
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMeanType, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics, get_last_statistics
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .price_cache import ElectricityResolution, PriceCache
+from .rate_template import RateTemplate
+from .spot_rate import SpotRate
+
+logger = logging.getLogger(__name__)
+
+# Trade -> template of its prices, None for spot prices
+TradeTemplates = dict[str, RateTemplate | None]
+
+# Concurrent CNB requests for rates of past days
+CNB_CONCURRENCY = 4
+
+
+def statistic_id(trade: str, entry_id: str | None) -> str:
+    # Statistic IDs are lower case
+    suffix = f'_{entry_id.lower()}' if entry_id else ''
+    return f'{DOMAIN}:{trade.lower()}_electricity_price{suffix}'
+
+
+def hourly_statistics(rates: SpotRate.RateByDatetime) -> list[StatisticData]:
+    """Mean, min and max of each hour, from hourly or 15 minute rates."""
+    hours: defaultdict[datetime, list[Decimal]] = defaultdict(list)
+    for dt in sorted(rates):
+        # Local hours start at the same time as UTC ones
+        hours[dt.replace(minute=0)].append(rates[dt])
+
+    return [
+        StatisticData(
+            start=hour,
+            mean=float(sum(prices) / len(prices)),
+            min=float(min(prices)),
+            max=float(max(prices)),
+        )
+        for hour, prices in hours.items()
+    ]
+
+
+@final
+class PriceStatistics:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str | None,
+        spot_rate: SpotRate,
+        in_eur: bool,
+        unit: SpotRate.EnergyUnit,
+        resolution: ElectricityResolution,
+        templates: TradeTemplates,
+    ) -> None:
+        self._hass = hass
+        self._entry_id = entry_id
+        self._spot_rate = spot_rate
+        self._in_eur = in_eur
+        self._unit: SpotRate.EnergyUnit = unit
+        self._resolution: ElectricityResolution = resolution
+        self._templates = templates
+        self._unit_of_measurement = f'{"€" if in_eur else "Kč"}/{unit}'
+        # Last day imported for all trades, nothing to do until the next day ends
+        self._imported_until: date | None = None
+        self._lock = asyncio.Lock()
+
+    def _caches(self) -> list[PriceCache]:
+        # The shared cache of recent days and the backfilled history, when it was loaded
+        domain_data = cast(dict[str, object], self._hass.data.get(DOMAIN, {}))
+        caches = [domain_data.get('price_cache'), domain_data.get('history_cache')]
+        return [cache for cache in caches if isinstance(cache, PriceCache)]
+
+    async def _last_hour(self, trade: str) -> datetime | None:
+        trade_statistic_id = statistic_id(trade, self._entry_id)
+        last = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics, self._hass, 1, trade_statistic_id, True, set()
+        )
+        rows = last.get(trade_statistic_id)
+        if not rows:
+            return None
+        return datetime.fromtimestamp(rows[0]['start'], timezone.utc)
+
+    def _cached_rates(self, first_day: date | None, last_day: date) -> dict[date, SpotRate.RateByDatetime]:
+        """Rates in EUR/MWh of cached days from `first_day` (the oldest cached one if None) till `last_day`."""
+        caches = self._caches()
+        days = sorted({day for cache in caches for day in cache.days('electricity', self._resolution)})
+        rates: dict[date, SpotRate.RateByDatetime] = {}
+        for day in days:
+            if (first_day is not None and day < first_day) or day > last_day:
+                continue
+            for cache in caches:
+                day_rates = cache.get_day('electricity', day, self._resolution)
+                if day_rates is not None:
+                    rates[day] = day_rates
+                    break
+        return rates
+
+    async def _eur_rates(self, days: list[date]) -> dict[date, Decimal]:
+        """CZK rates of EUR valid for `days`, past days must not be converted with the current rate."""
+        caches = self._caches()
+        eur_rates: dict[date, Decimal] = {}
+        missing: list[date] = []
+        for day in days:
+            for cache in caches:
+                currency_rates = cache.get_currency_rates(day)
+                if currency_rates is not None:
+                    eur_rates[day] = currency_rates['EUR']
+                    break
+            else:
+                missing.append(day)
+
+        semaphore = asyncio.Semaphore(CNB_CONCURRENCY)
+
+        async def download(day: date) -> dict[str, Decimal]:
+            async with semaphore:
+                return await self._spot_rate.cnb_rate.get_day_rates(day)
+
+        # Days missing in the caches are downloaded at once, a few at a time
+        for day, currency_rates in zip(missing, await asyncio.gather(*(download(day) for day in missing))):
+            if caches:
+                caches[0].set_currency_rates(day, currency_rates)
+            eur_rates[day] = currency_rates['EUR']
+        return eur_rates
+
+    async def _converted_rates(self, first_day: date | None, last_day: date) -> SpotRate.RateByDatetime:
+        cached_rates = self._cached_rates(first_day, last_day)
+        eur_rates = {} if self._in_eur else await self._eur_rates(list(cached_rates))
+        rates: SpotRate.RateByDatetime = {}
+        for day, day_rates in cached_rates.items():
+            rates.update(SpotRate.convert_rates(day_rates, eur_rates.get(day), self._unit))
+        return rates
+
+    async def async_import(self, today: date) -> None:
+        """Import days before `today` that are not in the statistics yet."""
+        last_day = today - timedelta(days=1)
+        if self._imported_until is not None and self._imported_until >= last_day:
+            return
+        if 'recorder' not in self._hass.config.components:
+            return
+
+        async with self._lock:
+            last_hours = {trade: await self._last_hour(trade) for trade in self._templates}
+            first_days = [
+                None if last_hour is None else (last_hour + timedelta(hours=1)).astimezone(self._spot_rate.timezone).date()
+                for last_hour in last_hours.values()
+            ]
+            # Converted once for all trades, from the first day any of them misses
+            first_day = None if None in first_days else min(cast(list[date], first_days), default=None)
+            converted = await self._converted_rates(first_day, last_day)
+
+            statistics_by_id: dict[str, tuple[StatisticMetaData, list[StatisticData]]] = {}
+            for trade, template in self._templates.items():
+                last_hour = last_hours[trade]
+                rates = converted
+                if last_hour is not None:
+                    rates = {dt: price for dt, price in rates.items() if dt > last_hour}
+                if not rates:
+                    continue
+
+                if template is not None:
+                    # The same rendering as in the coordinator, in one pass over all the days
+                    keys = sorted(rates)
+                    rates = dict(zip(keys, template.render([rates[dt] for dt in keys], keys)))
+
+                trade_statistic_id = statistic_id(trade, self._entry_id)
+                metadata = StatisticMetaData(
+                    mean_type=StatisticMeanType.ARITHMETIC,
+                    has_sum=False,
+                    name=f'{trade.capitalize()} electricity price ({self._unit_of_measurement})',
+                    source=DOMAIN,
+                    statistic_id=trade_statistic_id,
+                    unit_class=None,
+                    unit_of_measurement=self._unit_of_measurement,
+                )
+                statistics_by_id[trade_statistic_id] = (metadata, hourly_statistics(rates))
+
+            for trade_statistic_id, (metadata, statistics) in statistics_by_id.items():
+                async_add_external_statistics(self._hass, metadata, statistics)
+                logger.debug('Imported %d hours of %s statistics', len(statistics), trade_statistic_id)
+
+            self._imported_until = last_day
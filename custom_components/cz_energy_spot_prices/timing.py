@@ -0,0 +1,73 @@
+"""Rolling timings of the refresh pipeline stages.
+
+Stages:
+- ote: OTE round trip
+- cnb: CNB round trip (all probed days)
+- parse: parsing of an OTE response
+- render: one rendering of a price template
+- model: building of the electricity and gas data, including rendering, ranking and sorting
+- fetch: `fetch_data` as a whole
+- fanout: update of all entities with new data
+"""
+
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import final
+
+# Durations kept for each stage
+SAMPLES = 100
+
+# Used when timings are disabled, costs a single call
+_DISABLED = nullcontext()
+
+
+@final
+class StageTimings:
+    def __init__(self, samples: int = SAMPLES) -> None:
+        self._size = samples
+        self._durations: dict[str, deque[float]] = {}
+        # Last duration of each stage in seconds
+        self.last: dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(name, time.monotonic() - started)
+
+    def add(self, name: str, seconds: float) -> None:
+        durations = self._durations.get(name)
+        if durations is None:
+            durations = self._durations[name] = deque(maxlen=self._size)
+        durations.append(seconds)
+        self.last[name] = seconds
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Count, p50, p95 and max in milliseconds of each stage."""
+        result: dict[str, dict[str, float]] = {}
+        for name, durations in self._durations.items():
+            ordered = sorted(durations)
+            result[name] = {
+                'count': len(ordered),
+                'p50_ms': round(percentile(ordered, 50) * 1000, 3),
+                'p95_ms': round(percentile(ordered, 95) * 1000, 3),
+                'max_ms': round(ordered[-1] * 1000, 3),
+            }
+        return result
+
+
+def percentile(ordered: list[float], percent: int) -> float:
+    """Nearest rank percentile of ordered values."""
+    rank = max(-(-len(ordered) * percent // 100), 1)
+    return ordered[rank - 1]
+
+
+def stage(timings: StageTimings | None, name: str) -> AbstractContextManager[None]:
+    """Measure the `with` block as stage `name` when timings are enabled."""
+    if timings is None:
+        return _DISABLED
+    return timings.measure(name)
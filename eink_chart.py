@@ -8,6 +8,7 @@ from PIL import Image, ImageDraw, ImageFont
 import datetime
 
 from custom_components.cz_energy_spot_prices.spot_rate import SpotRate
+from custom_components.cz_energy_spot_prices.http_session import close_session
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -263,6 +264,8 @@ async def generate_chart() -> None:
         draw_chart(prices)
     except Exception as e:
         logger.exception(f"Error generating chart: {e}")
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
@@ -2,12 +2,9 @@ import pytest
 
 from homeassistant.core import HomeAssistant
 
-from custom_components.cz_energy_spot_prices.sensor import SpotRateElectricitySensor, Settings
-
 
 @pytest.fixture
-async def hass():
-    h = HomeAssistant()
+async def hass(tmp_path):
+    h = HomeAssistant(str(tmp_path))
     h.config.time_zone = 'Europe/Prague'
     return h
-
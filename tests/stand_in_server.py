@@ -0,0 +1,202 @@
+"""Local stand-in for the OTE and CNB services, for tests, benchmarks and soak tests.
+
+Speaks the OTE `PublicDataService` SOAP endpoint (`GetDamPricePeriodE`, `GetImPriceG`) and the
+CNB `exrates/daily` JSON API with synthetic data for any date range. Responses can be delayed
+and replaced by faults, truncated bodies or the "Application is not available" page, either
+at random with the configured rates or for the next requests with `fail_next`.
+
+    async with StandInServer(StandInConfig(latency=0.01)) as server:
+        cnb_rate = CnbRate(session, rates_url=server.cnb_url)
+        spot_rate = SpotRate(session, cnb_rate=cnb_rate, ote_url=server.ote_url)
+"""
+
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Literal
+import asyncio
+import json
+import random
+import xml.etree.ElementTree as ET
+
+from aiohttp import web
+
+from . import synthetic
+
+OTE_PATH = '/services/PublicDataService'
+CNB_PATH = '/cnbapi/exrates/daily'
+OTE_NS = '{http://www.ote-cr.cz/schema/service/public}'
+
+Fault = Literal['fault', 'truncated', 'unavailable']
+Endpoint = Literal['ote', 'cnb']
+
+SOAP_FAULT = """<?xml version="1.0" ?>
+<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/">
+  <SOAP-ENV:Body>
+    <SOAP-ENV:Fault>
+      <faultcode>SOAP-ENV:Server</faultcode>
+      <faultstring>Stand-in fault</faultstring>
+    </SOAP-ENV:Fault>
+  </SOAP-ENV:Body>
+</SOAP-ENV:Envelope>
+"""
+
+# HTML, not well-formed XML
+UNAVAILABLE = """<!DOCTYPE html>
+<html><head><title>Error</title></head>
+<body><h1>Application is not available</h1><br></body></html>
+"""
+
+CNB_RATES = {'EUR': 24.375, 'USD': 20.85}
+
+
+@dataclass
+class StandInConfig:
+    # Seconds before each response
+    latency: float = 0.0
+    # Probabilities of each fault for a request
+    fault_rate: float = 0.0
+    truncate_rate: float = 0.0
+    unavailable_rate: float = 0.0
+    # Days after this one are not published yet, OTE returns no items and CNB a validation error
+    published_until: date | None = None
+    seed: int = 0
+
+
+class StandInServer:
+    def __init__(self, config: StandInConfig | None = None, host: str = '127.0.0.1', port: int = 0) -> None:
+        self.config = config or StandInConfig()
+        self._host = host
+        self._port = port
+        self._random = random.Random(self.config.seed)
+        self._next_faults: dict[Endpoint, deque[Fault]] = {'ote': deque(), 'cnb': deque()}
+        self._runner: web.AppRunner | None = None
+        self.base_url = ''
+        # Requests by endpoint, `ote` and `cnb`
+        self.requests: Counter[str] = Counter()
+
+        self.app = web.Application()
+        _ = self.app.router.add_post(OTE_PATH, self._handle_ote)
+        _ = self.app.router.add_get(CNB_PATH, self._handle_cnb)
+
+    @property
+    def ote_url(self) -> str:
+        return self.base_url + OTE_PATH
+
+    @property
+    def cnb_url(self) -> str:
+        return self.base_url + CNB_PATH
+
+    def fail_next(self, fault: Fault, count: int = 1, endpoint: Endpoint = 'ote') -> None:
+        """Answer the next `count` requests of `endpoint` with `fault`, regardless of the configured rates."""
+        self._next_faults[endpoint].extend([fault] * count)
+
+    async def start(self) -> None:
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f'http://{host}:{port}'
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'StandInServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.close()
+
+    def _pick_fault(self, endpoint: Endpoint) -> Fault | None:
+        if self._next_faults[endpoint]:
+            return self._next_faults[endpoint].popleft()
+
+        roll = self._random.random()
+        for fault, rate in (
+            ('fault', self.config.fault_rate),
+            ('truncated', self.config.truncate_rate),
+            ('unavailable', self.config.unavailable_rate),
+        ):
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+    def _published(self, start: date, end: date) -> tuple[date, int]:
+        if self.config.published_until is not None:
+            end = min(end, self.config.published_until)
+        return start, max((end - start).days + 1, 0)
+
+    async def _handle_ote(self, request: web.Request) -> web.Response:
+        self.requests['ote'] += 1
+        body = await request.text()
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+
+        fault = self._pick_fault('ote')
+        if fault == 'unavailable':
+            return web.Response(status=503, text=UNAVAILABLE, content_type='text/html')
+        if fault == 'fault':
+            return web.Response(status=500, text=SOAP_FAULT, content_type='text/xml')
+
+        query = ET.fromstring(body)
+        start_text = query.findtext(f'.//{OTE_NS}StartDate')
+        end_text = query.findtext(f'.//{OTE_NS}EndDate')
+        if start_text is None or end_text is None:
+            return web.Response(status=500, text=SOAP_FAULT, content_type='text/xml')
+        start, days = self._published(date.fromisoformat(start_text), date.fromisoformat(end_text))
+
+        if query.find(f'.//{OTE_NS}GetImPriceG') is not None:
+            text = synthetic.gas_response(start, days)
+        else:
+            text = synthetic.electricity_response(start, days)
+
+        if fault == 'truncated':
+            text = text[:len(text) // 2]
+        return web.Response(text=text, content_type='text/xml')
+
+    async def _handle_cnb(self, request: web.Request) -> web.Response:
+        self.requests['cnb'] += 1
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+
+        fault = self._pick_fault('cnb')
+        if fault == 'unavailable':
+            return web.Response(status=503, text=UNAVAILABLE, content_type='text/html')
+        if fault == 'fault':
+            return web.json_response({'description': 'Stand-in fault', 'errorCode': 'INTERNAL_SERVER_ERROR'}, status=500)
+
+        day = date.fromisoformat(request.query['date'])
+        if self.config.published_until is not None and day > self.config.published_until:
+            return web.json_response({
+                'description': 'Invalid date',
+                'errorCode': 'VALIDATION_ERROR',
+                'happenedAt': day.isoformat(),
+                'endPoint': CNB_PATH,
+                'messageId': 'stand-in',
+            }, status=400)
+
+        # Rates of weekends are the ones of the previous Friday
+        valid_for = day - timedelta(days=max(day.weekday() - 4, 0))
+        text = json.dumps({
+            'rates': [
+                {
+                    'validFor': valid_for.isoformat(),
+                    'order': order,
+                    'country': code,
+                    'currency': code,
+                    'amount': 1,
+                    'currencyCode': code,
+                    'rate': rate,
+                }
+                for order, (code, rate) in enumerate(CNB_RATES.items(), 1)
+            ],
+        })
+
+        if fault == 'truncated':
+            text = text[:len(text) // 2]
+        return web.Response(text=text, content_type='application/json')
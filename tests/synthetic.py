@@ -0,0 +1,95 @@
+"""Synthetic OTE responses and rate series for the stand-in server, tests and benchmarks."""
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+import math
+
+TIMEZONE = ZoneInfo('Europe/Prague')
+UTC = ZoneInfo('UTC')
+
+ELECTRICITY_ITEM = """        <Item>
+          <Date>{date}</Date>
+          <PeriodResolution>PT15M</PeriodResolution>
+          <PeriodIndex>{index}</PeriodIndex>
+          <PeriodInterval>{interval}</PeriodInterval>
+          <Price>{price}</Price>
+          <HourlyPrice>{hourly_price}</HourlyPrice>
+          <VolumeTotal>{volume}</VolumeTotal>
+        </Item>
+"""
+
+GAS_ITEM = """        <Item>
+          <Date>{date}</Date>
+          <Price>{price}</Price>
+          <Volume>{volume}</Volume>
+        </Item>
+"""
+
+RESPONSE = """<?xml version="1.0" ?>
+<SOAP-ENV:Envelope SOAP-ENV:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/">
+  <SOAP-ENV:Body>
+    <{function}Response xmlns="http://www.ote-cr.cz/schema/service/public">
+      <Result>
+{items}      </Result>
+    </{function}Response>
+  </SOAP-ENV:Body>
+</SOAP-ENV:Envelope>
+"""
+
+
+def periods_in_day(day: date, minutes: int = 15) -> int:
+    """Number of periods in a local day, 92/96/100 for 15 minutes on DST days."""
+    start = datetime.combine(day, time(0), tzinfo=TIMEZONE).astimezone(UTC)
+    end = datetime.combine(day + timedelta(days=1), time(0), tzinfo=TIMEZONE).astimezone(UTC)
+    return int((end - start) / timedelta(minutes=minutes))
+
+
+def price_at(day: date, index: int) -> Decimal:
+    """Deterministic price with a daily curve, in EUR/MWh."""
+    phase = (day.toordinal() % 7) + index / 96 * 2 * math.pi
+    return Decimal(f'{100 + 60 * math.sin(phase) + (index * 37 % 11):.2f}')
+
+
+def electricity_response(start: date, days: int) -> str:
+    items: list[str] = []
+    for day_offset in range(days):
+        day = start + timedelta(days=day_offset)
+        count = periods_in_day(day)
+        prices = [price_at(day, i) for i in range(count)]
+        for i, price in enumerate(prices):
+            hour_prices = prices[i - i % 4:i - i % 4 + 4]
+            minutes = i * 15
+            items.append(ELECTRICITY_ITEM.format(
+                date=day.isoformat(),
+                index=i + 1,
+                interval=f'{minutes // 60:02d}:{minutes % 60:02d}-{(minutes + 15) // 60:02d}:{(minutes + 15) % 60:02d}',
+                price=price,
+                hourly_price=f'{sum(hour_prices) / len(hour_prices):.2f}',
+                volume=f'{800 + i:.3f}',
+            ))
+    return RESPONSE.format(function='GetDamPricePeriodE', items=''.join(items))
+
+
+def gas_response(start: date, days: int) -> str:
+    items = [
+        GAS_ITEM.format(
+            date=(start + timedelta(days=i)).isoformat(),
+            price=price_at(start + timedelta(days=i), 0),
+            volume='6540.6',
+        )
+        for i in range(days)
+    ]
+    return RESPONSE.format(function='GetImPriceG', items=''.join(items))
+
+
+def rates(start: date, days: int, minutes: int = 60) -> dict[datetime, Decimal]:
+    """Rate series as returned by `SpotRate.get_electricity_rates` (UTC keys, EUR/MWh)."""
+    result: dict[datetime, Decimal] = {}
+    step = timedelta(minutes=minutes)
+    for day_offset in range(days):
+        day = start + timedelta(days=day_offset)
+        start_of_day = datetime.combine(day, time(0), tzinfo=TIMEZONE).astimezone(UTC)
+        for i in range(periods_in_day(day, minutes)):
+            result[start_of_day + step * i] = price_at(day, i * minutes // 15)
+    return result
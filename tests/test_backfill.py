@@ -0,0 +1,73 @@
+import asyncio
+from datetime import date
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+from custom_components.cz_energy_spot_prices.backfill import Backfill, JsonFileStore, chunk_days
+from custom_components.cz_energy_spot_prices.price_cache import PriceCache
+from custom_components.cz_energy_spot_prices.spot_rate import SpotRate
+
+from .stand_in_server import StandInConfig, StandInServer
+
+
+def test_chunk_days():
+    days = [date(2025, 1, day) for day in (1, 2, 3, 4, 5, 8, 9, 20)]
+
+    assert chunk_days(days, 3) == [
+        (date(2025, 1, 1), date(2025, 1, 3)),
+        (date(2025, 1, 4), date(2025, 1, 5)),
+        (date(2025, 1, 8), date(2025, 1, 9)),
+        (date(2025, 1, 20), date(2025, 1, 20)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_is_resumable():
+    config = StandInConfig(latency=0.01, published_until=date(2025, 3, 9))
+    async with StandInServer(config) as server, aiohttp.ClientSession() as session:
+        cache = PriceCache(retention_days=None)
+        backfill = Backfill(SpotRate(session, cache, ote_url=server.ote_url), cache, concurrency=2)
+
+        server.fail_next('fault')
+        stats = await backfill.run('electricity', date(2025, 1, 1), date(2025, 3, 10))
+        assert (stats['days'], stats['chunks'], stats['failed_chunks']) == (69, 3, 1)
+        # One chunk failed and the last day isn't published yet
+        assert stats['stored_days'] + stats['missing_days'] == 69
+        assert stats['stored_days'] < 68
+
+        stats = await backfill.run('electricity', date(2025, 1, 1), date(2025, 3, 10))
+        assert stats['failed_chunks'] == 0
+        assert stats['skipped_days'] + stats['stored_days'] == 68
+        assert stats['missing_days'] == 1
+
+        # Nothing left to download but the unpublished day
+        requests = server.requests['ote']
+        stats = await backfill.run('electricity', date(2025, 1, 1), date(2025, 3, 9))
+        assert (stats['skipped_days'], stats['chunks']) == (68, 0)
+        assert server.requests['ote'] == requests
+
+
+@pytest.mark.asyncio
+async def test_cancelled_backfill_keeps_finished_chunks(tmp_path: Path):
+    path = tmp_path / 'history.json'
+    config = StandInConfig(latency=0.05, published_until=date(2025, 3, 9))
+    async with StandInServer(config) as server, aiohttp.ClientSession() as session:
+        cache = PriceCache(JsonFileStore(path), retention_days=None)  # pyright: ignore[reportArgumentType]
+        backfill = Backfill(SpotRate(session, cache, ote_url=server.ote_url), cache, concurrency=1)
+
+        task = asyncio.create_task(backfill.run('electricity', date(2025, 1, 1), date(2025, 3, 9)))
+        # Cancelled once the first chunk is saved
+        while not path.exists():
+            await asyncio.sleep(0.01)
+        _ = task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    restored = PriceCache(JsonFileStore(path), retention_days=None)  # pyright: ignore[reportArgumentType]
+    await restored.async_load()
+    days = restored.days('electricity', 'PT15M')
+    assert days[0] == date(2025, 1, 1)
+    assert date(2025, 1, 31) in days
+    assert date(2025, 3, 9) not in days
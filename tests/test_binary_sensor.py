@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.cz_energy_spot_prices import binary_sensor, coordinator
+from custom_components.cz_energy_spot_prices.binary_sensor import ConsecutiveCheapestElectricitySensor
+from custom_components.cz_energy_spot_prices.coordinator import DailyTradeRateData, HourlyTradeRateData, SpotRateData
+from custom_components.cz_energy_spot_prices.spot_rate_mixin import Trade
+from custom_components.cz_energy_spot_prices.spot_rate_settings import SpotRateSettings
+
+TIMEZONE = ZoneInfo('Europe/Prague')
+SETTINGS = SpotRateSettings(currency='EUR', currency_human='€', unit='MWh', timezone='Europe/Prague', zoneinfo=TIMEZONE)
+
+
+def local(day: int, hour: int) -> datetime:
+    return datetime(2025, 10, day, hour, tzinfo=TIMEZONE)
+
+
+@pytest.mark.asyncio
+async def test_cheapest_block_transitions(monkeypatch: pytest.MonkeyPatch):
+    now = local(1, 22) + timedelta(minutes=30)
+    monkeypatch.setattr(coordinator, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo))
+    monkeypatch.setattr(binary_sensor, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo))
+
+    # Adjacent cheapest hours, the last one of today and the first one of tomorrow
+    start = local(1, 0).astimezone(timezone.utc)
+    rates = {start + timedelta(hours=i): Decimal(1 if i in (23, 24) else 10) for i in range(48)}
+    data = SpotRateData(
+        HourlyTradeRateData(rates, TIMEZONE, None, None, (1,)),
+        DailyTradeRateData({start: Decimal(30)}, TIMEZONE, None),
+    )
+
+    scheduled: list[tuple[Any, datetime, MagicMock]] = []
+
+    def track_point_in_utc_time(_hass: Any, action: Any, point: datetime) -> MagicMock:
+        cancel = MagicMock()
+        scheduled.append((action, point, cancel))
+        return cancel
+
+    monkeypatch.setattr(binary_sensor.event, 'async_track_point_in_utc_time', track_point_in_utc_time)
+
+    spot_rate_coordinator = MagicMock(data=data)
+    sensor = ConsecutiveCheapestElectricitySensor(1, MagicMock(), SETTINGS, spot_rate_coordinator, Trade.SPOT)
+    write = MagicMock()
+    monkeypatch.setattr(sensor, 'async_write_ha_state', write)
+    await sensor.async_added_to_hass()
+    assert sensor.is_on is False
+    assert sensor.extra_state_attributes['Start'] == local(1, 23)
+
+    def fire() -> datetime:
+        action, point, _cancel = scheduled[-1]
+        action(point)
+        return point
+
+    # On at the start of the first block
+    assert fire() == local(1, 23).astimezone(timezone.utc)
+    assert sensor.is_on is True
+    # Still on where the adjacent blocks meet, showing the next block
+    assert fire() == local(2, 0).astimezone(timezone.utc)
+    assert sensor.is_on is True
+    assert sensor.extra_state_attributes['Start'] == local(2, 0)
+    # Off at the end of the second block, nothing left to wake up for
+    assert fire() == local(2, 1).astimezone(timezone.utc)
+    assert sensor.is_on is False
+    assert len(scheduled) == 3
+    assert write.call_count == 3
+
+    # The same data don't reschedule, new data do and the pending wake-up is cancelled on removal
+    sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+    assert len(scheduled) == 3
+    spot_rate_coordinator.data = SpotRateData(
+        HourlyTradeRateData(rates, TIMEZONE, None, None, (1,)),
+        DailyTradeRateData({start: Decimal(30)}, TIMEZONE, None),
+    )
+    sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+    assert len(scheduled) == 4
+    await sensor.async_will_remove_from_hass()
+    scheduled[-1][2].assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cheapest_block_on_dst_day(monkeypatch: pytest.MonkeyPatch):
+    now = local(26, 0) + timedelta(minutes=30)
+    monkeypatch.setattr(coordinator, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo))
+    monkeypatch.setattr(binary_sensor, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo))
+
+    # Clocks go back at 03:00 CEST, the cheapest 3 hours are 02:00 CEST, 02:00 CET and 03:00 CET
+    block_start = datetime(2025, 10, 26, 0, tzinfo=timezone.utc)
+    start = local(25, 0).astimezone(timezone.utc)
+    rates = {
+        start + timedelta(hours=i): Decimal(1 if block_start <= start + timedelta(hours=i) < block_start + timedelta(hours=3) else 10)
+        for i in range(49)
+    }
+    data = SpotRateData(
+        HourlyTradeRateData(rates, TIMEZONE, None, None, (3,)),
+        DailyTradeRateData({start: Decimal(30)}, TIMEZONE, None),
+    )
+
+    scheduled: list[datetime] = []
+    monkeypatch.setattr(binary_sensor.event, 'async_track_point_in_utc_time', lambda _hass, _action, point: scheduled.append(point))
+
+    sensor = ConsecutiveCheapestElectricitySensor(3, MagicMock(), SETTINGS, MagicMock(data=data), Trade.SPOT)
+    await sensor.async_added_to_hass()
+    assert sensor.is_on is False
+    assert scheduled == [block_start]
+    # Times in the repeated hour never compare equal across zones
+    assert sensor.extra_state_attributes['Start'].astimezone(timezone.utc) == block_start
+    assert sensor.extra_state_attributes['End'].astimezone(timezone.utc) == block_start + timedelta(hours=3, seconds=-1)
+    assert (sensor.extra_state_attributes['Start hour'], sensor.extra_state_attributes['End hour']) == (2, 3)
+    assert sensor.extra_state_attributes['Mean'] == 1
@@ -0,0 +1,84 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from custom_components.cz_energy_spot_prices.cnb_rate import CnbRate, InvalidDateError
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_download(monkeypatch: pytest.MonkeyPatch):
+    cnb_rate = CnbRate()
+    days: list[date] = []
+
+    async def get_day_rates(day: date) -> dict[str, Decimal]:
+        days.append(day)
+        await asyncio.sleep(0.01)
+        return {'CZK': Decimal(1), 'EUR': Decimal('24.375')}
+
+    monkeypatch.setattr(cnb_rate, 'get_day_rates', get_day_rates)
+
+    results = await asyncio.gather(*(cnb_rate.get_current_rates() for _ in range(5)))
+    assert all(result['EUR'] == Decimal('24.375') for result in results)
+
+    # Second call on the same day is served from memory
+    assert (await cnb_rate.get_current_rates())['EUR'] == Decimal('24.375')
+    assert len(days) == 1
+    assert cnb_rate.downloads == 1
+
+
+def fake_download(requested: list[date], published: date):
+    async def download_rates(day: date):
+        requested.append(day)
+        await asyncio.sleep(0.01)
+        if day > published:
+            raise InvalidDateError(f'Invalid date format: {day}')
+        return {'rates': [{'currencyCode': 'EUR', 'rate': 24.5 if day == published else 99}]}
+
+    return download_rates
+
+
+@pytest.mark.asyncio
+async def test_published_day_costs_one_request(monkeypatch: pytest.MonkeyPatch):
+    cnb_rate = CnbRate()
+    requested: list[date] = []
+    monkeypatch.setattr(cnb_rate, 'download_rates', fake_download(requested, date(2025, 12, 23)))
+
+    rates = await cnb_rate.get_day_rates(date(2025, 12, 23))
+    assert rates['EUR'] == Decimal('24.5')
+    assert requested == [date(2025, 12, 23)]
+
+
+@pytest.mark.asyncio
+async def test_weekend_probes_all_days_at_once(monkeypatch: pytest.MonkeyPatch):
+    cnb_rate = CnbRate()
+    requested: list[date] = []
+    monkeypatch.setattr(cnb_rate, 'download_rates', fake_download(requested, date(2025, 12, 23)))
+
+    # A Sunday after Christmas, all the days of the window in a single round trip
+    rates = await cnb_rate.get_day_rates(date(2025, 12, 28))
+    assert rates['EUR'] == Decimal('24.5')
+    assert requested == [date(2025, 12, 28 - i) for i in range(7)]
+
+    # Days without rates are not asked for again
+    requested.clear()
+    await cnb_rate.get_day_rates(date(2025, 12, 28))
+    assert requested == [date(2025, 12, 23), date(2025, 12, 22)]
+
+
+@pytest.mark.asyncio
+async def test_holiday_is_learned(monkeypatch: pytest.MonkeyPatch):
+    cnb_rate = CnbRate()
+    requested: list[date] = []
+    monkeypatch.setattr(cnb_rate, 'download_rates', fake_download(requested, date(2025, 12, 23)))
+
+    # Christmas Eve on a Wednesday is found out by the first request
+    rates = await cnb_rate.get_day_rates(date(2025, 12, 24))
+    assert rates['EUR'] == Decimal('24.5')
+    assert requested == [date(2025, 12, 24 - i) for i in range(7)]
+
+    # Then it is skipped, the older days are probed at once
+    requested.clear()
+    await cnb_rate.get_day_rates(date(2025, 12, 24))
+    assert requested == [date(2025, 12, 23 - i) for i in range(6)]
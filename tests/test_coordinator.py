@@ -0,0 +1,101 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+import random
+
+import pytest
+
+from custom_components.cz_energy_spot_prices import coordinator
+from custom_components.cz_energy_spot_prices.coordinator import HourlySpotRateData
+
+TIMEZONE = ZoneInfo('Europe/Prague')
+
+
+def quarter_hour_rates(first_day: date, days: int) -> dict[datetime, Decimal]:
+    rng = random.Random(0)
+    start = datetime.combine(first_day, datetime.min.time(), tzinfo=TIMEZONE).astimezone(timezone.utc)
+    end = datetime.combine(first_day + timedelta(days=days), datetime.min.time(), tzinfo=TIMEZONE).astimezone(timezone.utc)
+    return {start + timedelta(minutes=15 * i): Decimal(rng.randint(-500, 3000)) / 10 for i in range((end - start) // timedelta(minutes=15))}
+
+
+def test_quarter_hours_on_dst_day(monkeypatch: pytest.MonkeyPatch):
+    now = datetime(2025, 10, 26, 10, 20, tzinfo=TIMEZONE)
+    monkeypatch.setattr(coordinator, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo))
+
+    rates = quarter_hour_rates(date(2025, 10, 25), 3)
+    data = HourlySpotRateData(rates, TIMEZONE, None, (1, 2), timedelta(minutes=15))
+
+    # 25 hours on the autumn daylight saving time change
+    assert len(data.today.hours_by_dt) == 100
+    assert data.tomorrow is not None and data.has_complete_tomorrow()
+
+    today = list(data.today.hours_by_dt.values())
+    assert sorted(hour.order for hour in today) == list(range(1, 101))
+    assert min(today, key=lambda hour: hour.order).price == min(hour.price for hour in today)
+
+    # Cheapest 2 hour block spans 8 quarter-hours
+    cheapest = [hour for hour in today if hour.cheapest_consecutive_order[2] == 1]
+    assert len(cheapest) == 1
+    assert cheapest[0].dt_utc == data.cheapest_blocks(2)[0].dt_utc
+    dts = sorted(rates)
+    end = dts.index(cheapest[0].dt_utc)
+    assert cheapest[0].consecutive_sum_prices[2] == sum(rates[dt] for dt in dts[end - 7:end + 1])
+    assert all(
+        hour.consecutive_sum_prices[2] >= cheapest[0].consecutive_sum_prices[2]
+        for hour in today
+        if 2 in hour.consecutive_sum_prices
+    )
+
+    assert data.current_hour.dt_utc == datetime(2025, 10, 26, 9, 15, tzinfo=timezone.utc)
+
+
+def test_recompute_only_changed_days(monkeypatch: pytest.MonkeyPatch):
+    now = datetime(2025, 10, 26, 10, 20, tzinfo=TIMEZONE)
+    monkeypatch.setattr(coordinator, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo))
+
+    rates = quarter_hour_rates(date(2025, 10, 25), 3)
+    tomorrow_start = datetime(2025, 10, 27, tzinfo=TIMEZONE).astimezone(timezone.utc)
+    without_tomorrow = {dt: price for dt, price in rates.items() if dt < tomorrow_start}
+
+    previous = HourlySpotRateData(without_tomorrow, TIMEZONE, None, (1, 2), timedelta(minutes=15))
+    data = HourlySpotRateData(rates, TIMEZONE, None, (1, 2), timedelta(minutes=15), previous)
+    fresh = HourlySpotRateData(rates, TIMEZONE, None, (1, 2), timedelta(minutes=15))
+    assert data.recomputed_days == [date(2025, 10, 27)]
+    assert data.orders == fresh.orders
+    assert [hour.dt_utc for hour in data.cheapest_blocks(2)] == [hour.dt_utc for hour in fresh.cheapest_blocks(2)]
+
+    # Blocks of tomorrow may start before midnight, a change there ranks tomorrow again
+    last_today = max(dt for dt in rates if dt < tomorrow_start)
+    changed = rates | {last_today: Decimal(-1000)}
+    data = HourlySpotRateData(changed, TIMEZONE, None, (1, 2), timedelta(minutes=15), data)
+    fresh = HourlySpotRateData(changed, TIMEZONE, None, (1, 2), timedelta(minutes=15))
+    assert data.recomputed_days == [date(2025, 10, 26), date(2025, 10, 27)]
+    assert data.orders == fresh.orders
+    assert [hour.dt_utc for hour in data.cheapest_blocks(2)] == [hour.dt_utc for hour in fresh.cheapest_blocks(2)]
+
+
+def test_day_ranking(monkeypatch: pytest.MonkeyPatch):
+    now = datetime(2025, 10, 1, 10, 20, tzinfo=TIMEZONE)
+    monkeypatch.setattr(coordinator, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo))
+
+    start = datetime(2025, 10, 1, tzinfo=TIMEZONE).astimezone(timezone.utc)
+    prices = [Decimal(price) for price in (3, 1, 5, 1, 5, 2) * 4]
+    data = HourlySpotRateData({start + timedelta(hours=i): price for i, price in enumerate(prices)}, TIMEZONE, None)
+
+    today = data.today
+    assert [data.prices[i] for i in today.ranked] == sorted(prices)
+    # The first of equal prices, as before
+    assert today.cheapest_hour().dt_utc == start + timedelta(hours=1)
+    assert today.most_expensive_hour().dt_utc == start + timedelta(hours=2)
+
+
+def test_cheapest_blocks_skip_incomplete_blocks(monkeypatch: pytest.MonkeyPatch):
+    now = datetime(2025, 10, 1, 10, 20, tzinfo=TIMEZONE)
+    monkeypatch.setattr(coordinator, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo))
+
+    # The data start with today, the cheapest 2 hour block would start yesterday
+    start = datetime(2025, 10, 1, tzinfo=TIMEZONE).astimezone(timezone.utc)
+    data = HourlySpotRateData({start + timedelta(hours=i): Decimal(1 if i == 0 else 10) for i in range(24)}, TIMEZONE, None, (2,))
+
+    assert [hour.dt_utc for hour in data.cheapest_blocks(1)] == [start]
+    assert data.cheapest_blocks(2) == []
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+import json
+
+import pytest
+
+from custom_components.cz_energy_spot_prices import coordinator, diagnostics
+from custom_components.cz_energy_spot_prices.const import DOMAIN
+from custom_components.cz_energy_spot_prices.coordinator import DailyTradeRateData, HourlyTradeRateData, SpotRateData
+from custom_components.cz_energy_spot_prices.price_cache import PriceCache
+from custom_components.cz_energy_spot_prices.spot_rate import SpotRate
+from custom_components.cz_energy_spot_prices.timing import StageTimings
+
+TIMEZONE = ZoneInfo('Europe/Prague')
+
+
+@pytest.mark.asyncio
+async def test_config_entry_diagnostics(monkeypatch: pytest.MonkeyPatch):
+    now = datetime(2025, 10, 1, 10, 20, tzinfo=TIMEZONE)
+    monkeypatch.setattr(coordinator, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo))
+
+    start = datetime(2025, 9, 30, tzinfo=TIMEZONE).astimezone(timezone.utc)
+    rates = {start + timedelta(minutes=15 * i): Decimal(i % 7) for i in range(2 * 96)}
+    data = SpotRateData(
+        HourlyTradeRateData(rates, TIMEZONE, None, None, step=timedelta(minutes=15)),
+        DailyTradeRateData({start + timedelta(days=1): Decimal(30)}, TIMEZONE, None),
+    )
+
+    cache = PriceCache()
+    cache.hits, cache.misses = 3, 1
+    timings = StageTimings()
+    timings.add('fetch', 0.25)
+    spot_rate_coordinator = SimpleNamespace(
+        data=data,
+        _spot_rate=SpotRate(),
+        _retry_attempt=2,
+        _next_update=datetime(2025, 10, 1, 8, 21, tzinfo=timezone.utc),
+        _electricity_buy_rate_template=None,
+        _electricity_sell_rate_template=None,
+        _gas_buy_rate_template=None,
+        last_update_success=True,
+        input_hits=1,
+        input_misses=3,
+        timings=timings,
+        has_electricity_buy_rate_template=lambda: False,
+        has_electricity_sell_rate_template=lambda: False,
+        has_gas_buy_rate_template=lambda: False,
+    )
+    entry = SimpleNamespace(data={'currency': 'EUR'}, options={}, runtime_data=spot_rate_coordinator)
+    hass = MagicMock()
+    hass.data = {DOMAIN: {'price_cache': cache}}
+
+    result = await diagnostics.async_get_config_entry_diagnostics(hass, entry)  # pyright: ignore[reportArgumentType]
+
+    spot = result['model']['electricity']['spot']
+    assert spot['intervals_per_day'] == {'2025-09-30': 96, '2025-10-01': 96}
+    assert spot['memory_estimate_bytes'] > 0
+    assert result['model']['gas']['spot'] == {'today': '30', 'tomorrow': None}
+    assert result['caches']['prices']['hit_ratio'] == 0.75
+    assert result['caches']['inputs']['hit_ratio'] == 0.25
+    assert result['retry'] == {'attempt': 2, 'next_update': '2025-10-01T08:21:00+00:00', 'last_update_success': True}
+    assert result['timings']['fetch']['max_ms'] == 250
+    # Diagnostics are downloaded as JSON
+    _ = json.dumps(result)
@@ -0,0 +1,31 @@
+import asyncio
+
+from custom_components.cz_energy_spot_prices import http_session
+
+
+async def get_session():
+    return http_session.get_session()
+
+
+def test_session_of_closed_loop_is_released():
+    first = asyncio.run(get_session())
+    second = asyncio.run(get_session())
+    try:
+        assert second is not first
+        assert first.closed
+    finally:
+        asyncio.run(http_session.close_session())
+
+
+def test_session_of_open_loop_is_closed_on_it():
+    loop = asyncio.new_event_loop()
+    try:
+        first = loop.run_until_complete(get_session())
+        second = asyncio.run(get_session())
+        assert second is not first
+        # Closed once the first loop runs again
+        loop.run_until_complete(asyncio.sleep(0))
+        assert first.closed
+    finally:
+        loop.close()
+        asyncio.run(http_session.close_session())
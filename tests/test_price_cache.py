@@ -0,0 +1,49 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from custom_components.cz_energy_spot_prices.price_cache import PriceCache
+
+
+def day_rates(cache: PriceCache, day: date, step: timedelta, count: int) -> dict[datetime, Decimal]:
+    start = cache.start_of_day(day)
+    return {start + step * i: Decimal(i) / 4 for i in range(count)}
+
+
+def test_periods_in_day():
+    cache = PriceCache()
+
+    assert cache.periods_in_day(date(2025, 10, 1), 'PT15M') == 96
+    assert cache.periods_in_day(date(2025, 3, 30), 'PT15M') == 92
+    assert cache.periods_in_day(date(2025, 10, 26), 'PT60M') == 25
+    assert cache.periods_in_day(date(2025, 10, 26), 'P1D') == 1
+
+
+def test_complete_day_roundtrip():
+    cache = PriceCache()
+    day = date(2025, 10, 26)
+    rates = day_rates(cache, day, timedelta(hours=1), 25)
+
+    assert cache.get_day('electricity', day, 'PT60M') is None
+    assert cache.set_day('electricity', day, 'PT60M', rates)
+    assert cache.get_day('electricity', day, 'PT60M') == rates
+    assert cache.get_day('electricity', day, 'PT15M') is None
+    assert cache.get_day('gas', day, 'PT60M') is None
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_incomplete_day_not_stored():
+    cache = PriceCache()
+    day = date(2025, 10, 1)
+    rates = day_rates(cache, day, timedelta(minutes=15), 95)
+
+    assert not cache.set_day('electricity', day, 'PT15M', rates)
+    assert cache.get_day('electricity', day, 'PT15M') is None
+
+
+def test_currency_rates():
+    cache = PriceCache()
+    day = datetime.now(timezone.utc).date()
+
+    cache.set_currency_rates(day, {'CZK': Decimal(1), 'EUR': Decimal('24.375')})
+    assert cache.get_currency_rates(day) == {'CZK': Decimal(1), 'EUR': Decimal('24.375')}
+    assert cache.get_currency_rates(day - timedelta(days=1)) is None
@@ -0,0 +1,113 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+import random
+
+import pytest
+
+from custom_components.cz_energy_spot_prices.price_series import PriceSeries
+
+TIMEZONE = ZoneInfo('Europe/Prague')
+CONSECUTIVE_HOURS = (1, 2, 3, 4, 6, 8)
+
+
+def hourly_rates(first_day: date, days: int, seed: int) -> dict[datetime, Decimal]:
+    rng = random.Random(seed)
+    start = datetime.combine(first_day, time(0), tzinfo=TIMEZONE).astimezone(timezone.utc)
+    end = datetime.combine(first_day + timedelta(days=days), time(0), tzinfo=TIMEZONE).astimezone(timezone.utc)
+    rates: dict[datetime, Decimal] = {}
+    dt = start
+    while dt < end:
+        # Few distinct values so there are plenty of ties
+        rates[dt] = Decimal(rng.choice(['-1.50', '0.00', '2.25', '2.25', '3.10', '4.75']))
+        dt += timedelta(hours=1)
+    return rates
+
+
+def reference(rates: dict[datetime, Decimal], day: date):
+    """Nested loop previously used by HourlySpotRateData."""
+    sums: dict[datetime, dict[int, Decimal]] = {}
+    for base_dt in rates:
+        sums[base_dt] = {}
+        rate = Decimal(0)
+        for offset in range(CONSECUTIVE_HOURS[-1]):
+            prev_dt = base_dt - timedelta(hours=offset)
+            if prev_dt not in rates:
+                continue
+            rate += rates[prev_dt]
+            if (offset + 1) in CONSECUTIVE_HOURS:
+                sums[base_dt][offset + 1] = rate
+
+    day_dts = [dt for dt in rates if dt.astimezone(TIMEZONE).date() == day]
+    orders: dict[int, dict[datetime, int]] = {}
+    for consecutive in CONSECUTIVE_HOURS:
+        ordered = sorted(day_dts, key=lambda dt: sums[dt].get(consecutive, Decimal(0)))
+        orders[consecutive] = {dt: i for i, dt in enumerate(ordered, 1)}
+    return sums, orders
+
+
+@pytest.mark.parametrize('first_day', (
+    date(2022, 12, 2),
+    # Spring and autumn daylight saving time changes
+    date(2025, 3, 29),
+    date(2025, 10, 25),
+))
+@pytest.mark.parametrize('seed', range(5))
+def test_matches_reference(first_day: date, seed: int):
+    rates = hourly_rates(first_day, 3, seed)
+    series = PriceSeries(rates, timedelta(hours=1))
+
+    for day in (first_day + timedelta(days=1), first_day + timedelta(days=2)):
+        expected_sums, expected_orders = reference(rates, day)
+        day_indices = [i for i, dt in enumerate(series.dts) if dt.astimezone(TIMEZONE).date() == day]
+
+        for consecutive in CONSECUTIVE_HOURS:
+            sums = series.window_sums(consecutive)
+            for dt, index in zip(series.dts, range(len(series))):
+                assert sums[index] == expected_sums[dt].get(consecutive)
+                assert series.window_sum(index, consecutive) == sums[index]
+
+            orders = PriceSeries.rank(day_indices, sums)
+            assert {series.dts[i]: order for i, order in orders.items()} == expected_orders[consecutive]
+
+
+def test_missing_start():
+    rates = hourly_rates(date(2022, 12, 2), 1, 0)
+    series = PriceSeries(rates, timedelta(hours=1))
+
+    assert series.window_sum(0, 1) == series.prices[0]
+    assert series.window_sum(0, 2) is None
+    assert series.window_sum(3, 4) == sum(series.prices[:4])
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_cheapest_matches_rank(seed: int):
+    rates = hourly_rates(date(2025, 10, 25), 3, seed)
+    series = PriceSeries(rates, timedelta(hours=1))
+    day_indices = list(range(10, len(series)))
+
+    for length in (1, 2, 5, 12):
+        sums = series.window_sums(length)
+        orders = PriceSeries.rank(day_indices, sums)
+        cheapest = PriceSeries.cheapest(day_indices, sums)
+        assert cheapest is not None
+        assert orders[cheapest] == 1
+
+    assert PriceSeries.cheapest([], series.window_sums(1)) is None
+
+
+@pytest.mark.parametrize('step', (timedelta(hours=1), timedelta(minutes=15)))
+def test_series_with_gaps(step: timedelta):
+    rng = random.Random(1)
+    start = datetime(2025, 10, 25, 22, tzinfo=timezone.utc)
+    rates = {start + step * i: Decimal(rng.randint(-50, 300)) for i in range(200)}
+    contiguous = PriceSeries(rates, step)
+    for dt in rng.sample(sorted(rates), 10):
+        del rates[dt]
+    with_gaps = PriceSeries(rates, step)
+
+    for series in (contiguous, with_gaps):
+        for length in (1, 4, 8, 32):
+            sums = series.window_sums(length)
+            assert sums == [series.window_sum(index, length) for index in range(len(series))]
+    assert contiguous.window_sums(201) == [None] * 200
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Coroutine
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers.template import Template
+
+from custom_components.cz_energy_spot_prices.rate_template import RateTemplate
+
+
+START = datetime(2025, 10, 26, 0, tzinfo=timezone.utc)
+HOURS = [START + timedelta(hours=i) for i in range(24)]
+VALUES = [Decimal(i) / 10 for i in range(24)]
+
+
+def render_single(hass: HomeAssistant, code: str) -> list[Decimal]:
+    template = Template(code, hass)
+    return [
+        Decimal(template.async_render({'value': float(value), 'hour': hour}))
+        for value, hour in zip(VALUES, HOURS)
+    ]
+
+
+@pytest.mark.parametrize('code', [
+    '{{ value * 1.21 }}',
+    '{% set fee = 0.5 %}{% if hour.hour in [9, 12] %}{% set fee = 1 %}{% endif %}{{ value + fee }}',
+    '\n{{ value - 0.25 }}\n',
+])
+@pytest.mark.asyncio
+async def test_single_value_template_is_rendered_in_one_pass(hass: Coroutine[None, None, HomeAssistant], code: str):
+    h = await hass
+    rate_template = RateTemplate(Template(code, h))
+
+    assert rate_template.render(VALUES, HOURS) == render_single(h, code)
+    assert rate_template.renders == 1
+
+
+@pytest.mark.asyncio
+async def test_explicit_template_gets_all_values(hass: Coroutine[None, None, HomeAssistant]):
+    h = await hass
+    rate_template = RateTemplate(Template(
+        '{% set ns = namespace(prices=[]) %}'
+        '{% for value in values %}{% set ns.prices = ns.prices + [value * 2] %}{% endfor %}'
+        '{{ ns.prices }}',
+        h,
+    ))
+
+    assert rate_template.render(VALUES, HOURS) == [Decimal(float(value) * 2) for value in VALUES]
+    assert rate_template.renders == 1
+
+
+@pytest.mark.asyncio
+async def test_explicit_template_must_return_all_values(hass: Coroutine[None, None, HomeAssistant]):
+    h = await hass
+    rate_template = RateTemplate(Template('{{ values[:2] }}', h))
+
+    with pytest.raises(TemplateError):
+        rate_template.render(VALUES, HOURS)
+
+
+@pytest.mark.asyncio
+async def test_single_value_template_mentioning_values(hass: Coroutine[None, None, HomeAssistant]):
+    h = await hass
+    rate_template = RateTemplate(Template('{# prices of all values #}{{ value * 2 }}', h))
+
+    assert rate_template.render(VALUES, HOURS) == render_single(h, '{{ value * 2 }}')
+    # Rendered in one pass from then on
+    assert rate_template.render(VALUES, HOURS) == render_single(h, '{{ value * 2 }}')
+    assert (rate_template.calls, rate_template.renders) == (2, 3)
+
+
+@pytest.mark.asyncio
+async def test_batch_survives_failure_depending_on_values(hass: Coroutine[None, None, HomeAssistant]):
+    h = await hass
+    rate_template = RateTemplate(Template('{{ 1 / value }}', h))
+
+    with pytest.raises(TemplateError):
+        rate_template.render([Decimal(0)], HOURS[:1])
+    assert rate_template.render([Decimal(2)], HOURS[:1]) == [Decimal(0.5)]
+    # One failed batch and a failed single render, then one batch
+    assert rate_template.renders == 3
+
+
+@pytest.mark.asyncio
+async def test_fallback_to_single_renders(hass: Coroutine[None, None, HomeAssistant]):
+    h = await hass
+    # Output that is not a literal can't be split into values
+    rate_template = RateTemplate(Template('{{ value }} CZK', h))
+
+    with pytest.raises(Exception):
+        rate_template.render(VALUES[:1], HOURS[:1])
+    assert rate_template.renders == 2
+
+
+@pytest.mark.asyncio
+async def test_gas_template_uses_days(hass: Coroutine[None, None, HomeAssistant]):
+    h = await hass
+    days = [START, START + timedelta(days=1)]
+    rate_template = RateTemplate(Template('{{ value + day.day }}', h), 'day')
+
+    assert rate_template.render(VALUES[:2], days) == [Decimal(26), Decimal(27.1)]
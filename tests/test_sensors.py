@@ -1,5 +1,5 @@
 from zoneinfo import ZoneInfo
-from datetime import timezone, datetime
+from datetime import timezone, datetime, timedelta
 from typing import Coroutine, Literal
 from pathlib import Path
 from decimal import Decimal
@@ -13,6 +13,7 @@ from custom_components.cz_energy_spot_prices.sensor import (
     ConsecutiveCheapestElectricitySensor, TodayGasSensor, TomorrowGasSensor,
 )
 from custom_components.cz_energy_spot_prices.spot_rate import SpotRate
+from custom_components.cz_energy_spot_prices.spot_rate_mixin import Trade
 from custom_components.cz_energy_spot_prices.spot_rate_settings import SpotRateSettings
 from custom_components.cz_energy_spot_prices import coordinator
 from homeassistant.core import HomeAssistant
@@ -483,3 +484,52 @@ class TestGasSensors(TestSensorBase):
         price_eur = Decimal('141.56')
         price_czk = price_eur * self.EUR_RATE
         assert rate_sensor.state == self._convert_unit(price_czk if currency == 'CZK' else price_eur, unit)
+
+
+def electricity_data(rates: dict[datetime, Decimal]) -> coordinator.SpotRateData:
+    zoneinfo = ZoneInfo('Europe/Prague')
+    return coordinator.SpotRateData(
+        coordinator.HourlyTradeRateData(rates, zoneinfo, None, None),
+        coordinator.DailyTradeRateData({min(rates): Decimal(30)}, zoneinfo, None),
+    )
+
+
+def test_unchanged_state_is_not_written(monkeypatch: pytest.MonkeyPatch):
+    zoneinfo = ZoneInfo('Europe/Prague')
+    now = datetime(2025, 10, 1, 10, 20, tzinfo=zoneinfo)
+    monkeypatch.setattr(coordinator, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo))
+
+    start = datetime(2025, 10, 1, tzinfo=zoneinfo).astimezone(timezone.utc)
+    rates = {start + timedelta(hours=i): Decimal(i) for i in range(48)}
+    settings = SpotRateSettings(currency='EUR', currency_human='€', unit='MWh', timezone='Europe/Prague', zoneinfo=zoneinfo)
+    spot_rate_coordinator = MagicMock(data=electricity_data(rates))
+    sensor = SpotRateElectricitySensor(MagicMock(), settings, spot_rate_coordinator, Trade.SPOT)
+    write = MagicMock()
+    monkeypatch.setattr(sensor, 'async_write_ha_state', write)
+
+    sensor._handle_coordinator_update()
+    assert write.call_count == 1
+    attributes = sensor.extra_state_attributes
+
+    # Same data, the attributes are not even rebuilt
+    sensor._handle_coordinator_update()
+    assert write.call_count == 1
+    assert sensor.extra_state_attributes is attributes
+
+    # New data with the same prices are rebuilt, but not written
+    spot_rate_coordinator.data = electricity_data(dict(rates))
+    sensor._handle_coordinator_update()
+    assert write.call_count == 1
+    assert sensor.extra_state_attributes is not attributes
+
+    # A changed attribute is written, the current price is the same
+    spot_rate_coordinator.data = electricity_data({**rates, start + timedelta(hours=30): Decimal(100)})
+    sensor._handle_coordinator_update()
+    assert write.call_count == 2
+    assert sensor.native_value == Decimal(10)
+
+    # And so is a changed current price
+    spot_rate_coordinator.data = electricity_data({**rates, start + timedelta(hours=10): Decimal(100)})
+    sensor._handle_coordinator_update()
+    assert write.call_count == 3
+    assert sensor.native_value == Decimal(100)
@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.cz_energy_spot_prices import coordinator, services
+from custom_components.cz_energy_spot_prices.coordinator import HourlyTradeRateData
+
+TIMEZONE = ZoneInfo('Europe/Prague')
+
+
+def hass_with_data(data: object) -> MagicMock:
+    entry = SimpleNamespace(entry_id='entry', state=ConfigEntryState.LOADED, runtime_data=SimpleNamespace(data=data))
+    hass = MagicMock()
+    hass.config_entries.async_entries.return_value = [entry]
+    return hass
+
+
+@pytest.mark.asyncio
+async def test_get_electricity_prices(monkeypatch: pytest.MonkeyPatch):
+    now = datetime(2025, 10, 1, 10, 20, tzinfo=TIMEZONE)
+    monkeypatch.setattr(coordinator, 'get_now', lambda _zoneinfo=timezone.utc: now.astimezone(_zoneinfo))
+
+    start = datetime(2025, 10, 1, tzinfo=TIMEZONE).astimezone(timezone.utc)
+    rates = {start + timedelta(hours=i): Decimal(100 - i) for i in range(24)}
+    data = SimpleNamespace(electricity=HourlyTradeRateData(rates, TIMEZONE, None, None))
+
+    call = SimpleNamespace(data=services.GET_ELECTRICITY_PRICES_SCHEMA({}))
+    response = await services.async_get_electricity_prices(hass_with_data(data), call)  # pyright: ignore[reportArgumentType]
+
+    assert response is not None
+    assert response['tomorrow'] is None
+    assert response['today'][0] == {'start': '2025-10-01T00:00:00+02:00', 'price': 100.0, 'order': 24}
+    assert response['today'][-1]['order'] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_electricity_prices_without_data():
+    call = SimpleNamespace(data=services.GET_ELECTRICITY_PRICES_SCHEMA({}))
+    with pytest.raises(ServiceValidationError):
+        _ = await services.async_get_electricity_prices(hass_with_data(None), call)  # pyright: ignore[reportArgumentType]
@@ -0,0 +1,158 @@
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.cz_energy_spot_prices.spot_rate import SpotRate, OTEFault, InvalidFormat
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+ELECTRICITY_15MIN = """<?xml version="1.0" ?>
+<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/">
+  <SOAP-ENV:Body>
+    <GetDamPricePeriodEResponse xmlns="http://www.ote-cr.cz/schema/service/public">
+      <Result>
+        <Item>
+          <Date>2025-10-01</Date>
+          <PeriodIndex>1</PeriodIndex>
+          <Price>97.21</Price>
+          <HourlyPrice>85.56</HourlyPrice>
+        </Item>
+        <Item>
+          <Date>2025-10-01</Date>
+          <PeriodIndex>2</PeriodIndex>
+          <Price>88.10</Price>
+          <HourlyPrice>85.56</HourlyPrice>
+        </Item>
+        <Item>
+          <Date>2025-10-01</Date>
+          <PeriodIndex>{index}</PeriodIndex>
+          <Price>70.00</Price>
+          <HourlyPrice>71.00</HourlyPrice>
+        </Item>
+      </Result>
+    </GetDamPricePeriodEResponse>
+  </SOAP-ENV:Body>
+</SOAP-ENV:Envelope>
+"""
+
+FAULT = """<?xml version="1.0" ?>
+<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/">
+  <SOAP-ENV:Body>
+    <SOAP-ENV:Fault>
+      <faultcode>SOAP-ENV:Client</faultcode>
+      <faultstring>Invalid date range</faultstring>
+    </SOAP-ENV:Fault>
+  </SOAP-ENV:Body>
+</SOAP-ENV:Envelope>
+"""
+
+
+def utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_parse_legacy_fixture():
+    text = (FIXTURES / 'ote-electricity-2022-12-03_EUR.xml').read_text()
+    rates = SpotRate()._parse_rates(text, 'MWh', 'electricity_legacy')
+
+    assert len(rates) == 72
+    assert rates[utc(2022, 12, 1, 23)] == Decimal('307.71')
+    assert rates[utc(2022, 12, 2, 23)] == Decimal('261.04')
+
+
+def test_parse_gas_fixture():
+    text = (FIXTURES / 'ote-gas-2022-12-03_EUR.xml').read_text()
+    rates = SpotRate()._parse_rates(text, 'kWh', 'gas')
+
+    assert rates == {
+        utc(2022, 12, 1, 23): Decimal('0.13948'),
+        utc(2022, 12, 2, 23): Decimal('0.14000'),
+        utc(2022, 12, 3, 23): Decimal('0.14156'),
+    }
+
+
+def test_parse_15min():
+    text = ELECTRICITY_15MIN.format(index=5)
+
+    assert SpotRate()._parse_rates(text, 'MWh', 'electricity_15min') == {
+        utc(2025, 9, 30, 22, 0): Decimal('97.21'),
+        utc(2025, 9, 30, 22, 15): Decimal('88.10'),
+        utc(2025, 9, 30, 23, 0): Decimal('70.00'),
+    }
+    assert SpotRate()._parse_rates(text, 'MWh', 'electricity_60min') == {
+        utc(2025, 9, 30, 22): Decimal('85.56'),
+        utc(2025, 9, 30, 23): Decimal('71.00'),
+    }
+
+
+def test_parse_invalid_period_index():
+    with pytest.raises(InvalidFormat):
+        SpotRate()._parse_rates(ELECTRICITY_15MIN.format(index=101), 'MWh', 'electricity_15min')
+
+
+def test_parse_fault():
+    with pytest.raises(OTEFault, match='Invalid date range'):
+        SpotRate()._parse_rates(FAULT, 'MWh', 'electricity_15min')
+
+
+def test_parse_truncated():
+    text = ELECTRICITY_15MIN.format(index=5)
+    with pytest.raises(UpdateFailed, match='Failed to parse'):
+        SpotRate()._parse_rates(text[:len(text) // 2], 'MWh', 'electricity_15min')
+
+    with pytest.raises(UpdateFailed, match='not available'):
+        SpotRate()._parse_rates('<html>Application is not available</body>', 'MWh', 'electricity_15min')
+
+
+@pytest.mark.asyncio
+async def test_shared_rates_are_downloaded_once(monkeypatch: pytest.MonkeyPatch):
+    spot_rate = SpotRate()
+    queries: list[str] = []
+
+    async def download(query: str) -> str:
+        queries.append(query)
+        await asyncio.sleep(0.01)
+        return ELECTRICITY_15MIN.format(index=5)
+
+    monkeypatch.setattr(spot_rate, '_download', download)
+
+    now = utc(2025, 10, 1, 10)
+    in_mwh, in_kwh = await asyncio.gather(
+        spot_rate.get_electricity_rates(now, in_eur=True, unit='MWh'),
+        spot_rate.get_electricity_rates(now, in_eur=True, unit='kWh'),
+    )
+    assert in_mwh[utc(2025, 9, 30, 22)] == Decimal('85.56')
+    assert in_kwh[utc(2025, 9, 30, 22)] == Decimal('0.08556')
+
+    # Later requests within the same hour reuse the rates too
+    _ = await spot_rate.get_electricity_rates(now, in_eur=True, unit='MWh')
+    assert len(queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_identical_response_is_parsed_once(monkeypatch: pytest.MonkeyPatch):
+    spot_rate = SpotRate()
+    responses = [ELECTRICITY_15MIN.format(index=5), ELECTRICITY_15MIN.format(index=5), ELECTRICITY_15MIN.format(index=6)]
+
+    async def download(_query: str) -> str:
+        return responses.pop(0)
+
+    monkeypatch.setattr(spot_rate, '_download', download)
+
+    day = datetime(2025, 10, 1).date()
+    first = await spot_rate._get_day_rates('electricity', day, day)  # pyright: ignore[reportPrivateUsage]
+    first_digest = spot_rate.digests['electricity']
+    second = await spot_rate._get_day_rates('electricity', day, day)  # pyright: ignore[reportPrivateUsage]
+    assert second == first
+    assert spot_rate.digests['electricity'] == first_digest
+    assert (spot_rate.payload_hits, spot_rate.payload_misses) == (1, 1)
+
+    third = await spot_rate._get_day_rates('electricity', day, day)  # pyright: ignore[reportPrivateUsage]
+    assert third != first
+    assert spot_rate.digests['electricity'] != first_digest
+    assert (spot_rate.payload_hits, spot_rate.payload_misses) == (1, 2)
@@ -0,0 +1,59 @@
+from datetime import date, datetime
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import aiohttp
+import pytest
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.cz_energy_spot_prices.cnb_rate import CnbRate
+from custom_components.cz_energy_spot_prices.spot_rate import OTEFault, SpotRate
+
+from .stand_in_server import StandInConfig, StandInServer
+
+TIMEZONE = ZoneInfo('Europe/Prague')
+NOW = datetime(2025, 10, 26, 10, 20, tzinfo=TIMEZONE)
+
+
+@pytest.mark.asyncio
+async def test_rates_over_http():
+    async with StandInServer() as server, aiohttp.ClientSession() as session:
+        cnb_rate = CnbRate(session, rates_url=server.cnb_url)
+        spot_rate = SpotRate(session, cnb_rate=cnb_rate, ote_url=server.ote_url)
+
+        rates = await spot_rate.get_electricity_rates(NOW, in_eur=False, unit='kWh', resolution='PT15M')
+        # Yesterday, today with 100 quarter-hours on the daylight saving time change and tomorrow
+        assert len(rates) == 96 + 100 + 96
+
+        in_eur = await spot_rate.get_electricity_rates(NOW, in_eur=True, unit='MWh', resolution='PT15M')
+        dt = min(rates)
+        assert rates[dt] == in_eur[dt] * Decimal('24.375') / 1000
+        # Both conversions use the same OTE download
+        assert server.requests['ote'] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('fault,error', [
+    ('fault', OTEFault),
+    ('truncated', UpdateFailed),
+    ('unavailable', UpdateFailed),
+])
+async def test_ote_faults(fault, error):
+    async with StandInServer() as server, aiohttp.ClientSession() as session:
+        spot_rate = SpotRate(session, cnb_rate=CnbRate(session, rates_url=server.cnb_url), ote_url=server.ote_url)
+        server.fail_next(fault)
+
+        with pytest.raises(error):
+            _ = await spot_rate.get_electricity_rates(NOW, in_eur=True, unit='MWh')
+
+        # The next request succeeds
+        assert await spot_rate.get_electricity_rates(NOW, in_eur=True, unit='MWh')
+
+
+@pytest.mark.asyncio
+async def test_cnb_falls_back_to_published_day():
+    async with StandInServer(StandInConfig(published_until=date(2025, 10, 24))) as server, aiohttp.ClientSession() as session:
+        rates = await CnbRate(session, rates_url=server.cnb_url).get_day_rates(date(2025, 10, 26))
+
+        assert rates['EUR'] == Decimal('24.375')
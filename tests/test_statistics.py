@@ -0,0 +1,140 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.cz_energy_spot_prices import statistics
+from custom_components.cz_energy_spot_prices.const import DOMAIN
+from custom_components.cz_energy_spot_prices.price_cache import PriceCache
+from custom_components.cz_energy_spot_prices.spot_rate import SpotRate
+
+
+def test_hourly_statistics():
+    start = datetime(2025, 10, 1, 8, tzinfo=timezone.utc)
+    rates = {start + timedelta(minutes=15 * i): Decimal(price) for i, price in enumerate([4, 1, 3, 2, 5, 5, 5, 5])}
+
+    assert statistics.hourly_statistics(rates) == [
+        {'start': start, 'mean': 2.5, 'min': 1.0, 'max': 4.0},
+        {'start': start + timedelta(hours=1), 'mean': 5.0, 'min': 5.0, 'max': 5.0},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_missing_days(monkeypatch: pytest.MonkeyPatch):
+    cache = PriceCache()
+    for day in (date(2025, 9, 29), date(2025, 9, 30), date(2025, 10, 1)):
+        start = cache.start_of_day(day)
+        _ = cache.set_day('electricity', day, 'PT60M', {start + timedelta(hours=i): Decimal(i) for i in range(24)})
+
+    # Statistics end with the first cached day
+    last_hour = cache.start_of_day(date(2025, 9, 30)) - timedelta(hours=1)
+    added: list[tuple[Any, list[Any]]] = []
+
+    async def run_job(job: Any, *args: Any) -> Any:
+        return job(*args)
+
+    monkeypatch.setattr(statistics, 'get_instance', lambda _hass: SimpleNamespace(async_add_executor_job=run_job))
+    monkeypatch.setattr(statistics, 'get_last_statistics', lambda *_args: {statistics.statistic_id('spot', 'ENTRY1'): [{'start': last_hour.timestamp()}]})
+    monkeypatch.setattr(statistics, 'async_add_external_statistics', lambda _hass, metadata, stats: added.append((metadata, stats)))
+
+    hass = MagicMock()
+    hass.config.components = {'recorder'}
+    hass.data = {DOMAIN: {'price_cache': cache}}
+    price_statistics = statistics.PriceStatistics(hass, 'ENTRY1', SpotRate(), True, 'MWh', 'PT60M', {'spot': None})
+
+    # Today is not finished yet
+    await price_statistics.async_import(date(2025, 10, 1))
+    [(metadata, stats)] = added
+    assert metadata['statistic_id'] == 'cz_energy_spot_prices:spot_electricity_price_entry1'
+    assert metadata['unit_of_measurement'] == '€/MWh'
+    assert [stat['start'] for stat in stats] == [last_hour + timedelta(hours=i + 1) for i in range(24)]
+
+    # Nothing more to import until the day ends
+    await price_statistics.async_import(date(2025, 10, 1))
+    assert len(added) == 1
+
+
+@pytest.mark.asyncio
+async def test_import_converts_each_day_with_its_rate(monkeypatch: pytest.MonkeyPatch):
+    cache = PriceCache()
+    days = (date(2025, 9, 29), date(2025, 9, 30))
+    for day in days:
+        start = cache.start_of_day(day)
+        _ = cache.set_day('electricity', day, 'PT60M', {start + timedelta(hours=i): Decimal(100) for i in range(24)})
+    # The first day has its rate cached, the rate of the second one is downloaded
+    cache.set_currency_rates(days[0], {'CZK': Decimal(1), 'EUR': Decimal(24)})
+
+    async def get_day_rates(day: date) -> dict[str, Decimal]:
+        assert day == days[1]
+        return {'CZK': Decimal(1), 'EUR': Decimal(25)}
+
+    async def get_current_rates() -> dict[str, Decimal]:
+        raise AssertionError('Past days must not use the current rate')
+
+    spot_rate = SpotRate()
+    monkeypatch.setattr(spot_rate.cnb_rate, 'get_day_rates', get_day_rates)
+    monkeypatch.setattr(spot_rate.cnb_rate, 'get_current_rates', get_current_rates)
+
+    added: list[tuple[Any, list[Any]]] = []
+
+    async def run_job(job: Any, *args: Any) -> Any:
+        return job(*args)
+
+    monkeypatch.setattr(statistics, 'get_instance', lambda _hass: SimpleNamespace(async_add_executor_job=run_job))
+    monkeypatch.setattr(statistics, 'get_last_statistics', lambda *_args: {})
+    monkeypatch.setattr(statistics, 'async_add_external_statistics', lambda _hass, metadata, stats: added.append((metadata, stats)))
+
+    hass = MagicMock()
+    hass.config.components = {'recorder'}
+    hass.data = {DOMAIN: {'price_cache': cache}}
+    price_statistics = statistics.PriceStatistics(hass, 'ENTRY1', spot_rate, False, 'kWh', 'PT60M', {'spot': None})
+
+    await price_statistics.async_import(date(2025, 10, 1))
+    [(metadata, stats)] = added
+    assert metadata['unit_of_measurement'] == 'Kč/kWh'
+    assert [stat['mean'] for stat in stats] == [2.4] * 24 + [2.5] * 24
+    # The downloaded rate is kept for the next import
+    assert cache.get_currency_rates(days[1]) == {'CZK': Decimal(1), 'EUR': Decimal(25)}
+
+
+@pytest.mark.asyncio
+async def test_entries_have_their_own_statistics(monkeypatch: pytest.MonkeyPatch):
+    cache = PriceCache()
+    day = date(2025, 9, 30)
+    start = cache.start_of_day(day)
+    _ = cache.set_day('electricity', day, 'PT60M', {start + timedelta(hours=i): Decimal(100) for i in range(24)})
+    cache.set_currency_rates(day, {'CZK': Decimal(1), 'EUR': Decimal(25)})
+
+    # Each entry imports into its own statistics, regardless of the others
+    imported: dict[str, float] = {}
+    added: list[tuple[Any, list[Any]]] = []
+
+    async def run_job(job: Any, *args: Any) -> Any:
+        return job(*args)
+
+    def add_statistics(_hass: Any, metadata: Any, stats: list[Any]) -> None:
+        added.append((metadata, stats))
+        imported[metadata['statistic_id']] = stats[-1]['start'].timestamp()
+
+    monkeypatch.setattr(statistics, 'get_instance', lambda _hass: SimpleNamespace(async_add_executor_job=run_job))
+    monkeypatch.setattr(
+        statistics, 'get_last_statistics',
+        lambda _hass, _count, statistic_id, *_args: {statistic_id: [{'start': imported[statistic_id]}]} if statistic_id in imported else {},
+    )
+    monkeypatch.setattr(statistics, 'async_add_external_statistics', add_statistics)
+
+    hass = MagicMock()
+    hass.config.components = {'recorder'}
+    hass.data = {DOMAIN: {'price_cache': cache}}
+    in_eur = statistics.PriceStatistics(hass, 'EUR_ENTRY', SpotRate(), True, 'MWh', 'PT60M', {'spot': None})
+    in_czk = statistics.PriceStatistics(hass, 'CZK_ENTRY', SpotRate(), False, 'kWh', 'PT60M', {'spot': None})
+
+    await in_eur.async_import(date(2025, 10, 1))
+    await in_czk.async_import(date(2025, 10, 1))
+    assert [(metadata['statistic_id'], metadata['unit_of_measurement'], stats[0]['mean']) for metadata, stats in added] == [
+        ('cz_energy_spot_prices:spot_electricity_price_eur_entry', '€/MWh', 100.0),
+        ('cz_energy_spot_prices:spot_electricity_price_czk_entry', 'Kč/kWh', 2.5),
+    ]
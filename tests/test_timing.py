@@ -0,0 +1,30 @@
+from custom_components.cz_energy_spot_prices.timing import StageTimings, percentile, stage
+
+
+def test_percentile():
+    ordered = [float(i) for i in range(1, 21)]
+
+    assert percentile(ordered, 50) == 10
+    assert percentile(ordered, 95) == 19
+    assert percentile(ordered, 100) == 20
+    assert percentile([3.0], 95) == 3
+
+
+def test_rolling_summary():
+    timings = StageTimings(samples=4)
+    for seconds in (1.0, 0.001, 0.002, 0.003, 0.004):
+        timings.add('parse', seconds)
+
+    # The oldest duration is dropped
+    assert timings.summary() == {'parse': {'count': 4, 'p50_ms': 2.0, 'p95_ms': 4.0, 'max_ms': 4.0}}
+    assert timings.last == {'parse': 0.004}
+
+
+def test_disabled_stage_is_not_measured():
+    timings = StageTimings()
+    with stage(None, 'model'):
+        pass
+    with stage(timings, 'model'):
+        pass
+
+    assert timings.summary()['model']['count'] == 1